@@ -41,6 +41,7 @@ from typing import Dict, List, Tuple
 import numpy as np
 import numpy.typing as npt
 from attrs import asdict, define, field
+from numba import njit, prange
 from sklearn.utils.validation import check_random_state
 
 from aeon.base import BaseEstimator
@@ -120,6 +121,9 @@ class GGS:
     change_points_: npt.ArrayLike = field(init=False, default=[])
     _intermediate_change_points: List[List[int]] = field(init=False, default=[])
     _intermediate_ll: List[float] = field(init=False, default=[])
+    # best split of each segment and the data as float array, during find_change_points
+    _splits: Dict = field(init=False, default=None, repr=False, eq=False)
+    _splits_data: np.ndarray = field(init=False, default=None, repr=False, eq=False)
 
     def initialize_intermediates(self) -> None:
         """Initialize the state fo the estimator."""
@@ -194,50 +198,51 @@ class GGS:
         index: change point index
         gll: gained log likelihood
         """
-        # Initialize parameters
-        m, n = data.shape
-        orig_mean = np.mean(data, axis=0)
-        orig_cov = np.cov(data.T, bias=True)
-        orig_ll = self.log_likelihood(data)
-        total_sum = m * (orig_cov + np.outer(orig_mean, orig_mean))
-        mu_left = data[0, :] / n
-        mu_right = (m * orig_mean - data[0, :]) / (m - 1)
-        runSum = np.outer(data[0, :], data[0, :])
-        # Loop through all samples
-        # find point where breaking the segment would have the largest LL increase
-        min_ll = orig_ll
-        new_index = 0
-        for i in range(2, m - 1):
-            # Update parameters
-            runSum = runSum + np.outer(data[i - 1, :], data[i - 1, :])
-            mu_left = ((i - 1) * mu_left + data[i - 1, :]) / (i)
-            mu_right = ((m - i + 1) * mu_right - data[i - 1, :]) / (m - i)
-            sigLeft = runSum / (i) - np.outer(mu_left, mu_left)
-            sigRight = (total_sum - runSum) / (m - i) - np.outer(mu_right, mu_right)
-
-            # Compute Cholesky, LogDet, and Trace
-            Lleft = np.linalg.cholesky(sigLeft + float(self.lamb) * np.identity(n) / i)
-            Lright = np.linalg.cholesky(
-                sigRight + float(self.lamb) * np.identity(n) / (m - i)
-            )
-            ll_left = 2 * sum(map(math.log, np.diag(Lleft)))
-            ll_right = 2 * sum(map(math.log, np.diag(Lright)))
-            (trace_left, trace_right) = (0, 0)
-            if self.lamb > 0:
-                trace_left = math.pow(np.linalg.norm(np.linalg.inv(Lleft)), 2)
-                trace_right = math.pow(np.linalg.norm(np.linalg.inv(Lright)), 2)
-            LL = (
-                i * ll_left
-                - float(self.lamb) * trace_left
-                + (m - i) * ll_right
-                - float(self.lamb) * trace_right
-            )
-            # Keep track of the best point so far
-            if LL < min_ll:
-                min_ll = LL
-                new_index = i
-        # Return break, increase in LL
-        return new_index, min_ll - orig_ll
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        new_index, gain = _split_segment(data, float(self.lamb))
+        return int(new_index), float(gain)
+
+    def _find_splits(
+        self, data: npt.ArrayLike, segments: List[Tuple[int, int]]
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the best split of each segment, see ``add_new_change_point``.
+
+        Within ``find_change_points`` splits are cached, so only segments which
+        have not been searched before are searched. Segments are searched in
+        parallel.
+
+        Parameters
+        ----------
+        data: array_like
+            2D `array_like` representing time series with sequence index along
+            the first dimension and value series as columns.
+        segments: list of tuples of ints
+            Start and stop indexes of the segments.
+
+        Returns
+        -------
+        splits: list of tuples of int and float
+            The change point index within each segment and the gained log
+            likelihood.
+        """
+        if self._splits is None:
+            values = np.ascontiguousarray(data, dtype=np.float64)
+            splits = {}
+        else:
+            values = self._splits_data
+            splits = self._splits
+
+        new_segments = list(dict.fromkeys(s for s in segments if s not in splits))
+        if len(new_segments) > 0:
+            starts = np.array([start for start, _ in new_segments], dtype=np.int64)
+            stops = np.array([stop for _, stop in new_segments], dtype=np.int64)
+            stops = np.minimum(stops, values.shape[0])
+            indexes, gains = _split_segments(values, starts, stops, float(self.lamb))
+            for segment, index, gain in zip(new_segments, indexes, gains):
+                splits[segment] = (int(index), float(gain))
+
+        return [splits[segment] for segment in segments]
 
     def adjust_change_points(
         self, data: npt.ArrayLike, change_points: List[int], new_index: List[int]
@@ -293,7 +298,7 @@ class GGS:
                     or this_pass[bp[i + 1]] == 1
                 ):
                     tempData = data[bp[i - 1] : bp[i + 1], :]
-                    ind, val = self.add_new_change_point(tempData)
+                    [(ind, val)] = self._find_splits(data, [(bp[i - 1], bp[i + 1])])
                     if bp[i] != ind + bp[i - 1] and val != 0:
                         last_pass[ind + bp[i - 1]] = last_pass[bp[i]]
                         del last_pass[bp[i]]
@@ -329,44 +334,160 @@ class GGS:
         The K change points, along with all intermediate change points (for k < K)
         and their corresponding covariance-regularized maximum likelihoods.
         """
-        change_points = self.identity_segmentation(data)
-        self._intermediate_change_points = [change_points[:]]
-        self._intermediate_ll = [self.cumulative_log_likelihood(data, change_points)]
-
-        # Start GGS Algorithm
-        for _ in range(self.k_max):
-            new_index = -1
-            new_value = +1
-            # For each segment, find change point and increase in LL
-            for start, stop in zip(change_points[:-1], change_points[1:]):
-                segment = data[start:stop, :]
-                ind, val = self.add_new_change_point(segment)
-                if val < new_value:
-                    new_index = ind + start
-                    new_value = val
-
-            # Check if our algorithm is finished
-            if new_value == 0:
-                logger.info("Adding change points!")
-                return change_points
-
-            # Add new change point
-            change_points.append(new_index)
-            change_points.sort()
-            if self.verbose:
-                logger.info(f"Change point occurs at: {new_index}, LL: {new_value}")
-
-            # Adjust current locations of the change points
-            change_points = self.adjust_change_points(data, change_points, [new_index])[
-                :
+        self._splits = {}
+        self._splits_data = np.ascontiguousarray(data, dtype=np.float64)
+        try:
+            change_points = self.identity_segmentation(data)
+            self._intermediate_change_points = [change_points[:]]
+            self._intermediate_ll = [
+                self.cumulative_log_likelihood(data, change_points)
             ]
 
-            # Calculate likelihood
-            ll = self.cumulative_log_likelihood(data, change_points)
-            self._intermediate_change_points.append(change_points[:])
-            self._intermediate_ll.append(ll)
-
-        return change_points
+            # Start GGS Algorithm
+            for _ in range(self.k_max):
+                new_index = -1
+                new_value = +1
+                # For each segment, find change point and increase in LL
+                segments = list(zip(change_points[:-1], change_points[1:]))
+                splits = self._find_splits(data, segments)
+                for (start, _), (ind, val) in zip(segments, splits):
+                    if val < new_value:
+                        new_index = ind + start
+                        new_value = val
+
+                # Check if our algorithm is finished
+                if new_value == 0:
+                    logger.info("Adding change points!")
+                    return change_points
+
+                # Add new change point
+                change_points.append(new_index)
+                change_points.sort()
+                if self.verbose:
+                    logger.info(f"Change point occurs at: {new_index}, LL: {new_value}")
+
+                # Adjust current locations of the change points
+                change_points = self.adjust_change_points(
+                    data, change_points, [new_index]
+                )[:]
+
+                # Calculate likelihood
+                ll = self.cumulative_log_likelihood(data, change_points)
+                self._intermediate_change_points.append(change_points[:])
+                self._intermediate_ll.append(ll)
+
+            return change_points
+        finally:
+            # do not keep the data, or splits of data which may be modified later
+            self._splits = None
+            self._splits_data = None
+
+
+@njit(cache=True, fastmath=True)
+def _split_segment(data, lamb):
+    # Best split of a segment as in GGS.add_new_change_point. With M the scatter
+    # matrix of one side plus lamb * I, the regularised covariance is M / size, so
+    # its log determinant and inverse trace follow from M. Adding a point to a side
+    # is a rank one update of M, which updates the Cholesky factor of M in O(n^2),
+    # and the inverse trace with the Sherman-Morrison formula. The right side is
+    # built from the end of the segment, the left side from the start.
+    m, n = data.shape
+    identity = np.eye(n)
+
+    mean = np.zeros(n)
+    for i in range(m):
+        mean += data[i]
+    mean /= m
+    cov = np.zeros((n, n))
+    for i in range(m):
+        diff = data[i] - mean
+        cov += np.outer(diff, diff)
+    cov = cov / m + lamb * identity / m
+    orig_ll = m * np.linalg.slogdet(cov)[1] - lamb * np.trace(np.linalg.inv(cov))
+
+    if m < 4:
+        return 0, 0.0
+
+    # right side statistics for splits i = m - 2, ..., 2
+    logdet_right = np.zeros(m)
+    trace_right = np.zeros(m)
+    mu = (data[m - 2] + data[m - 1]) / 2
+    diff = data[m - 2] - data[m - 1]
+    chol = np.linalg.cholesky(np.outer(diff, diff) / 2 + lamb * identity)
+    trace = np.trace(np.linalg.inv(chol.T @ chol))
+    for i in range(m - 2, 1, -1):
+        logdet_right[i] = 2 * np.sum(np.log(np.diag(chol)))
+        trace_right[i] = trace
+        size = m - i
+        v = (data[i - 1] - mu) * math.sqrt(size / (size + 1))
+        trace = _cholesky_update(chol, v, trace)
+        mu = (size * mu + data[i - 1]) / (size + 1)
+
+    # the left mean starts from data[0] / n, as in the reference implementation
+    mu = (data[0] / n + data[1]) / 2
+    scatter = np.outer(data[0], data[0]) + np.outer(data[1], data[1])
+    chol = np.linalg.cholesky(scatter - 2 * np.outer(mu, mu) + lamb * identity)
+    trace = np.trace(np.linalg.inv(chol.T @ chol))
+
+    min_ll = orig_ll
+    new_index = 0
+    for i in range(2, m - 1):
+        logdet_left = 2 * np.sum(np.log(np.diag(chol)))
+        ll = (
+            i * (logdet_left - n * math.log(i))
+            - lamb * i * trace
+            + (m - i) * (logdet_right[i] - n * math.log(m - i))
+            - lamb * (m - i) * trace_right[i]
+        )
+        if ll < min_ll:
+            min_ll = ll
+            new_index = i
+
+        v = (data[i] - mu) * math.sqrt(i / (i + 1))
+        trace = _cholesky_update(chol, v, trace)
+        mu = (i * mu + data[i]) / (i + 1)
+
+    return new_index, min_ll - orig_ll
+
+
+@njit(cache=True, fastmath=True)
+def _cholesky_update(chol, v, trace):
+    # Update the lower Cholesky factor of M in place to the factor of M + v v^T and
+    # return the trace of the inverse of M + v v^T, given the trace for M.
+    n = len(v)
+    z = np.zeros(n)
+    for i in range(n):
+        z[i] = (v[i] - np.dot(chol[i, :i], z[:i])) / chol[i, i]
+    w = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        total = z[i]
+        for j in range(i + 1, n):
+            total -= chol[j, i] * w[j]
+        w[i] = total / chol[i, i]
+    trace -= np.dot(w, w) / (1 + np.dot(z, z))
+
+    v = v.copy()
+    for k in range(n):
+        r = math.sqrt(chol[k, k] * chol[k, k] + v[k] * v[k])
+        c = r / chol[k, k]
+        s = v[k] / chol[k, k]
+        chol[k, k] = r
+        for j in range(k + 1, n):
+            chol[j, k] = (chol[j, k] + s * v[j]) / c
+            v[j] = c * v[j] - s * chol[j, k]
+    return trace
+
+
+@njit(cache=True, parallel=True)
+def _split_segments(data, starts, stops, lamb):
+    n_segments = len(starts)
+    indexes = np.zeros(n_segments, dtype=np.int64)
+    gains = np.zeros(n_segments)
+    for i in prange(n_segments):
+        indexes[i], gains[i] = _split_segment(
+            np.ascontiguousarray(data[starts[i] : stops[i]]), lamb
+        )
+    return indexes, gains
 
 
 class GreedyGaussianSegmentation(BaseEstimator):
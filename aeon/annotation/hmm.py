@@ -10,9 +10,12 @@ import warnings
 from typing import Tuple
 
 import numpy as np
+from numba import config, get_num_threads, njit, prange, set_num_threads
 from scipy.stats import norm
 
 from aeon.annotation.base._base import BaseSeriesAnnotator
+from aeon.utils.validation import check_n_jobs
+from aeon.utils.validation.series import check_series
 
 __author__ = ["miraep8"]
 __all__ = ["HMM"]
@@ -49,15 +52,19 @@ class HMM(BaseSeriesAnnotator):
     _predict - first the transition_probability and transition_id matrices are
     calculated - these are both nxm matrices, where n is the number of
     hidden states and m is the number of observations. The transition
-    probability matrices record the probability of the most likely
+    probability matrices record the log probability of the most likely
     sequence which has observation `m` being assigned to hidden state n.
     The transition_id matrix records the step before hidden state n that
-    proceeds it in the most likely path.  This logic is mostly carried
-    out by helper function _calculate_trans_mats.
+    proceeds it in the most likely path.
     Next, these matrices are used to calculate the most likely
     path (by backtracing from the final mostly likely state and the
-    id's that proceeded it.)  This logic is done via a helper func
-    hmm_viterbi_label.
+    id's that proceeded it.)  Both steps are done in log space by the compiled
+    helper function _viterbi, in O(m * n^2) time.
+
+    _predict_scores - the posterior probability of each hidden state for each
+    observation is calculated with the forward-backward algorithm, in log space.
+
+    predict_batch labels a list of sequences in parallel.
 
     Parameters
     ----------
@@ -81,6 +88,9 @@ class HMM(BaseSeriesAnnotator):
         list and the transition_prob_mat. The initial probs should be reflective
         of prior beliefs.  If none is passed will each hidden state will be
         assigned an equal inital prob.
+    n_jobs : int, default=1
+        The number of threads used to label sequences in parallel in
+        predict_batch. ``-1`` means using all processors.
 
     Attributes
     ----------
@@ -103,14 +113,14 @@ class HMM(BaseSeriesAnnotator):
     num_obs : int
         The length of the observations data.  Extracted from data.
     trans_prob : 2D np.ndarray, shape = [num_observations, num_hidden_states]
-        Shape [num observations, num hidden states]. The max probability that that
-        observation is assigned to that hidden state.
-        Calculated in _calculate_trans_mat and assigned in _predict.
+        Shape [num observations, num hidden states]. The max log probability that
+        that observation is assigned to that hidden state.
+        Calculated in _viterbi and assigned in _predict.
     trans_id : 2D np.ndarray, shape = [num_observations, num_hidden_states]
         Shape [num observations, num hidden states]. The state id of the state
         proceeding the observation is assigned to that hidden state in the most
-        likely path where that occurs. Calculated in _calculate_trans_mat and
-        assigned in _predict.
+        likely path where that occurs. Calculated in _viterbi and assigned in
+        _predict.
 
     Examples
     --------
@@ -137,8 +147,10 @@ class HMM(BaseSeriesAnnotator):
         emission_funcs: list,
         transition_prob_mat: np.ndarray,
         initial_probs: np.ndarray = None,
+        n_jobs: int = 1,
     ):
         self.initial_probs = initial_probs
+        self.n_jobs = n_jobs
         self.emission_funcs = emission_funcs
         self.transition_prob_mat = transition_prob_mat
         super(HMM, self).__init__(fmt="dense", labels="int_label")
@@ -192,83 +204,15 @@ class HMM(BaseSeriesAnnotator):
             raise ValueError("Sum of initial probs should be 1.")
 
     @staticmethod
-    def _calculate_trans_mats(
-        initial_probs: np.ndarray,
-        emi_probs: np.ndarray,
-        transition_prob_mat: np.ndarray,
-        num_obs: int,
-        num_states: int,
-    ) -> Tuple[np.array, np.array]:
-        """Calculate the transition mats used in the Viterbi algorithm.
-
-        Parameters
-        ----------
-        initial_probs : 1D np.ndarray, shape = [num_hidden_states]
-            A nx1 dimensional array of floats where n
-            represents the number of hidden states in the model. It
-            contains the probability that hidden state for the state
-            before the first observation was state n.  Should sum to 1.
-        emi_probs : 2D np.ndarray, shape = [num_observations, num_hidden_states]
-            A nxm dimensional arrayof floats, where n is the
-            number of hidden states and m is the number of observations.
-            For a given observation, it should contain the probability that it
-            could havbe been generated (ie emitted) from each of the hidden states
-            Each entry should be beteen 0 and 1
-        transition_prob_mat : 2D np.ndarray, shape = [num_states, num_states]
-            A nxn dimensional array of floats where n is
-            the number of hidden states in the model. The jth col in the ith row
-            represents the probability of transitioning to state j from state i.
-            Thus each row should sum to 1.
-        num_obs : int,
-            the number of observations (m)
-        num_states : int,
-            the number of hidden states (n)
-
-        Returns
-        -------
-        trans_prob : 2D np.ndarray, shape = [num_observations, num_hidden_states]
-            an nxm dimensional array which represents the
-            maximum probability of the hidden state of observation m is state n.
-        trans_id : 2D np.ndarray, shape = [num_observations, num_hidden_states]
-            a nxm dimensional array which for each observation
-            "i" and state "j" the i,j entry records the state_id of the most
-            likely state that could have led to the hidden state being "i" for
-            observation "j".
-        """
-        # trans_prob represents the maximum probability of being in that
-        # state at that stage
-        trans_prob = np.zeros((num_states, num_obs))
-        trans_prob[:, 0] = np.log(initial_probs) + np.log(emi_probs[:, 0])
-
-        # trans_id is the index of the state that would have been the most
-        # likely preceeding state.
-        trans_id = np.zeros((num_states, num_obs), dtype=np.int32)
-
-        # use Vertibi Algorithm to fill in trans_prob and trans_id:
-        for i in range(1, num_obs):
-            # adds log(transition_prob_mat) element-wise:
-            paths = np.log(transition_prob_mat)
-            # adds the probabilities for the state before columsn wise:
-            paths += np.stack(
-                [trans_prob[:, i - 1] for _ in range(num_states)], axis=0
-            ).T
-            # adds the probabilities from emission row wise:
-            paths += np.stack(
-                [np.log(emi_probs[:, i]) for _ in range(num_states)], axis=0
-            )
-            trans_id[:, i] = np.argmax(paths, axis=0)
-            trans_prob[:, i] = np.max(paths, axis=0)
-
-        if np.any(np.isinf(trans_prob[:, -1])):
-            warnings.warn("Change parameters, the distribution doesn't work")
-
-        return trans_prob, trans_id
-
-    @staticmethod
-    def _make_emission_probs(
+    def _make_emission_log_probs(
         emission_funcs: list, observations: np.ndarray
     ) -> np.ndarray:
-        """Calculate the prob each obs comes from each hidden state.
+        """Calculate the log prob each obs comes from each hidden state.
+
+        Each emission function is called once on all observations. The pdf or pmf
+        methods of scipy.stats distributions are replaced by the matching logpdf or
+        logpmf methods, which do not underflow for unlikely observations. Callables
+        which do not accept an array are called on each observation.
 
         Parameters
         ----------
@@ -286,65 +230,67 @@ class HMM(BaseSeriesAnnotator):
 
         Returns
         -------
-        emi_probs : 2D np.ndarray, shape = [num_observations, num_hidden_states]
-            A nxm dimensional arrayof floats, where n is the
-            number of hidden states and m is the number of observations.
-            For a given observation, it contains the probability that it
-            could havbe been generated (ie emitted) from each of the hidden states
-            Each entry should be beteen 0 and 1
+        emi_log_probs : 2D np.ndarray, shape = [num_observations, num_hidden_states]
+            For a given observation, it contains the log of the probability that it
+            could have been generated (ie emitted) from each of the hidden states.
         """
-        # assign emission probabilities from each state to each position:
-
-        emi_probs = np.zeros(shape=(len(emission_funcs), len(observations)))
+        observations = np.asarray(observations, dtype=np.float64)
+        emi_log_probs = np.zeros((len(observations), len(emission_funcs)))
         for state_id, emission in enumerate(emission_funcs):
             if isinstance(emission, tuple):
-                emission_func = emission[0]
-                kwargs = emission[1]
-                emi_probs[state_id, :] = np.array(
-                    [emission_func(x, **kwargs) for x in observations]
-                )
+                emission_func, kwargs = emission
             else:
-                emi_probs[state_id, :] = np.array([emission(x) for x in observations])
-        return emi_probs
+                emission_func, kwargs = emission, {}
 
-    @staticmethod
-    def _hmm_viterbi_label(
-        num_obs: int, states: list, trans_prob: np.ndarray, trans_id: np.ndarray
-    ) -> np.array:
-        """Assign hidden state ids to all observations based on most likely path.
+            name = getattr(emission_func, "__name__", None)
+            dist = getattr(emission_func, "__self__", None)
+            if name in ("pdf", "pmf") and hasattr(dist, "log" + name):
+                emi_log_probs[:, state_id] = getattr(dist, "log" + name)(
+                    observations, **kwargs
+                )
+                continue
 
-        Parameters
-        ----------
-        num_obs : int,
-            the number of observations.
-        states : list,
-            a list with integer ids to assign to each hidden state.
-        trans_prob :np.ndarray,
-            a matrix of size [number of observations, number of hidden states]
-            which contains the highest probability path that leads to
-            observation m being assigned to hidden state n.
-        trans_id : np.ndarray, shape = [num_observations, num_hidden_states]
-            a matrix of size [number of observations, number of hidden states]
-            which contains the state id of the state proceeding this one on the
-            most likely path that has observation m being assigned to hidden
-            state n.
+            try:
+                probs = np.asarray(
+                    emission_func(observations, **kwargs), dtype=np.float64
+                )
+            except (TypeError, ValueError):
+                probs = None
+            if probs is None or probs.shape != observations.shape:
+                probs = np.array(
+                    [emission_func(x, **kwargs) for x in observations],
+                    dtype=np.float64,
+                )
+            with np.errstate(divide="ignore"):
+                emi_log_probs[:, state_id] = np.log(probs)
+        return emi_log_probs
 
-        Returns
-        -------
-        hmm_fit: np.ndarray, shape = [num_observations]
-            an array of shape [length of the X (obs)].
-            each entry in the array is an int representing a hidden id state
-            that has been assigned to that observation.
+    def _log_params(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the log initial probs and log transition matrix."""
+        num_states = len(self.emission_funcs)
+        init_probs = self.initial_probs
+        if self.initial_probs is None:
+            init_probs = 1.0 / num_states * np.ones(num_states)
+        with np.errstate(divide="ignore"):
+            log_init = np.log(np.asarray(init_probs, dtype=np.float64))
+            log_trans = np.log(np.asarray(self.transition_prob_mat, dtype=np.float64))
+        return log_init, np.ascontiguousarray(log_trans)
+
+    def _batch_log_probs(self, X: list) -> Tuple[np.ndarray, np.ndarray]:
+        """Concatenate the emission log probs of a list of sequences.
+
+        Returns the emission log probs of all sequences, shape = [total number of
+        observations, num_hidden_states], and the index of the first observation of
+        each sequence, with the total number of observations appended.
         """
-        hmm_fit = np.zeros(num_obs)
-        # Now we trace backwards and find the most likely path:
-        max_inds = np.zeros(num_obs, dtype=np.int32)
-        max_inds[-1] = np.argmax(trans_prob[:, -1])
-        hmm_fit[-1] = states[max_inds[-1]]
-        for index in range(num_obs - 1, 0, -1):
-            max_inds[index - 1] = trans_id[max_inds[index], index]
-            hmm_fit[index - 1] = states[max_inds[index - 1]]
-        return hmm_fit
+        lengths = np.array([len(x) for x in X], dtype=np.int64)
+        if (lengths == 0).any():
+            raise ValueError("All sequences must contain at least one observation.")
+        starts = np.zeros(len(X) + 1, dtype=np.int64)
+        starts[1:] = np.cumsum(lengths)
+        observations = np.concatenate([np.asarray(x).ravel() for x in X])
+        emi_log_probs = self._make_emission_log_probs(self.emission_funcs, observations)
+        return emi_log_probs, starts
 
     def _fit(self, X, Y=None):
         """Do nothing, currently empty.
@@ -377,23 +323,86 @@ class HMM(BaseSeriesAnnotator):
         self.num_states = len(self.emission_funcs)
         self.states = list(range(self.num_states))
         self.num_obs = len(X)
-        emi_probs = self._make_emission_probs(self.emission_funcs, X)
-        init_probs = self.initial_probs
-        if self.initial_probs is None:
-            init_probs = 1.0 / self.num_states * np.ones(self.num_states)
-        trans_prob, trans_id = self._calculate_trans_mats(
-            init_probs,
-            emi_probs,
-            self.transition_prob_mat,
-            self.num_obs,
-            self.num_states,
+
+        emi_log_probs = self._make_emission_log_probs(
+            self.emission_funcs, np.asarray(X).ravel()
         )
+        log_init, log_trans = self._log_params()
+        trans_prob = np.zeros((self.num_obs, self.num_states))
+        trans_id = np.zeros((self.num_obs, self.num_states), dtype=np.int32)
+        hmm_fit = np.zeros(self.num_obs)
+        _viterbi(log_init, log_trans, emi_log_probs, trans_prob, trans_id, hmm_fit)
 
-        self.trans_prob = trans_prob
-        self.trans_id = trans_id
-        return self._hmm_viterbi_label(
-            self.num_obs, self.states, self.trans_prob, self.trans_id
+        if np.any(np.isinf(trans_prob[-1])):
+            warnings.warn("Change parameters, the distribution doesn't work")
+
+        self.trans_prob = trans_prob.T
+        self.trans_id = trans_id.T
+        return hmm_fit
+
+    def _predict_scores(self, X):
+        """Compute the posterior probs of the hidden states by forward-backward.
+
+        Parameters
+        ----------
+        X : 1D np.array, shape = [num_observations]
+            Observations to apply labels to.
+
+        Returns
+        -------
+        scores : 2D np.ndarray, shape = [num_observations, num_hidden_states]
+            The probability that each observation was generated by each of the
+            hidden states, given all observations.
+        """
+        emi_log_probs = self._make_emission_log_probs(
+            self.emission_funcs, np.asarray(X).ravel()
         )
+        log_init, log_trans = self._log_params()
+        log_posterior = np.zeros(emi_log_probs.shape)
+        log_beta = np.zeros(emi_log_probs.shape)
+        _forward_backward(log_init, log_trans, emi_log_probs, log_posterior, log_beta)
+        return np.exp(log_posterior)
+
+    def predict_batch(self, X: list) -> list:
+        """Determine the most likely seq of hidden states of several sequences.
+
+        The sequences are labelled in parallel with ``n_jobs`` threads.
+
+        Parameters
+        ----------
+        X : list of 1D np.ndarray, or 2D np.ndarray
+            The sequences of observations to apply labels to, a 2D array is read as
+            one sequence per row. Each sequence is checked as in ``predict``.
+
+        Returns
+        -------
+        annotated_x : list of 1D np.ndarray
+            Arrays of predicted class labels, one per sequence, same size as the
+            sequence.
+        """
+        self.check_is_fitted()
+        X = [check_series(x) for x in X]
+        emi_log_probs, starts = self._batch_log_probs(X)
+        log_init, log_trans = self._log_params()
+
+        n_obs, n_states = emi_log_probs.shape
+        trans_prob = np.zeros((n_obs, n_states))
+        trans_id = np.zeros((n_obs, n_states), dtype=np.int32)
+        labels = np.zeros(n_obs)
+
+        prev_threads = get_num_threads()
+        set_num_threads(min(check_n_jobs(self.n_jobs), config.NUMBA_NUM_THREADS))
+        try:
+            _viterbi_batch(
+                log_init, log_trans, emi_log_probs, starts, trans_prob, trans_id, labels
+            )
+        finally:
+            set_num_threads(prev_threads)
+
+        if np.any(np.isinf(trans_prob[starts[1:] - 1])):
+            warnings.warn("Change parameters, the distribution doesn't work")
+
+        return [labels[start:end] for start, end in zip(starts[:-1], starts[1:])]
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -425,3 +434,105 @@ class HMM(BaseSeriesAnnotator):
         }
 
         return [params_1, params_2]
+
+
+@njit(cache=True)
+def _viterbi(log_init, log_trans, emi_log_probs, trans_prob, trans_id, labels):
+    # Fill trans_prob and trans_id, shape (num_obs, num_states), with the log prob
+    # of the most likely path ending in each state and the state before it, then
+    # write the states of the most likely path to labels.
+    num_obs, num_states = emi_log_probs.shape
+    for j in range(num_states):
+        trans_prob[0, j] = log_init[j] + emi_log_probs[0, j]
+    for i in range(1, num_obs):
+        for j in range(num_states):
+            best = trans_prob[i - 1, 0] + log_trans[0, j]
+            best_id = 0
+            for k in range(1, num_states):
+                path = trans_prob[i - 1, k] + log_trans[k, j]
+                if path > best:
+                    best = path
+                    best_id = k
+            trans_prob[i, j] = best + emi_log_probs[i, j]
+            trans_id[i, j] = best_id
+
+    state = 0
+    for j in range(1, num_states):
+        if trans_prob[num_obs - 1, j] > trans_prob[num_obs - 1, state]:
+            state = j
+    labels[num_obs - 1] = state
+    for i in range(num_obs - 1, 0, -1):
+        state = trans_id[i, state]
+        labels[i - 1] = state
+
+
+@njit(cache=True, parallel=True)
+def _viterbi_batch(
+    log_init, log_trans, emi_log_probs, starts, trans_prob, trans_id, labels
+):
+    for i in prange(len(starts) - 1):
+        start, end = starts[i], starts[i + 1]
+        _viterbi(
+            log_init,
+            log_trans,
+            emi_log_probs[start:end],
+            trans_prob[start:end],
+            trans_id[start:end],
+            labels[start:end],
+        )
+
+
+@njit(cache=True)
+def _forward_backward(log_init, log_trans, emi_log_probs, log_posterior, log_beta):
+    # Write the log posterior probs of the states to log_posterior, which holds the
+    # forward log probs until the backward pass, using log_beta for the backward
+    # log probs. Sums of probs are computed relative to their maximum.
+    num_obs, num_states = emi_log_probs.shape
+    log_alpha = log_posterior
+    for j in range(num_states):
+        log_alpha[0, j] = log_init[j] + emi_log_probs[0, j]
+    for i in range(1, num_obs):
+        for j in range(num_states):
+            high = -np.inf
+            for k in range(num_states):
+                high = max(high, log_alpha[i - 1, k] + log_trans[k, j])
+            if high == -np.inf:
+                log_alpha[i, j] = -np.inf
+                continue
+            total = 0.0
+            for k in range(num_states):
+                total += np.exp(log_alpha[i - 1, k] + log_trans[k, j] - high)
+            log_alpha[i, j] = high + np.log(total) + emi_log_probs[i, j]
+
+    for j in range(num_states):
+        log_beta[num_obs - 1, j] = 0.0
+    for i in range(num_obs - 2, -1, -1):
+        for j in range(num_states):
+            high = -np.inf
+            for k in range(num_states):
+                high = max(
+                    high, log_trans[j, k] + emi_log_probs[i + 1, k] + log_beta[i + 1, k]
+                )
+            if high == -np.inf:
+                log_beta[i, j] = -np.inf
+                continue
+            total = 0.0
+            for k in range(num_states):
+                total += np.exp(
+                    log_trans[j, k]
+                    + emi_log_probs[i + 1, k]
+                    + log_beta[i + 1, k]
+                    - high
+                )
+            log_beta[i, j] = high + np.log(total)
+
+    high = -np.inf
+    for j in range(num_states):
+        high = max(high, log_alpha[num_obs - 1, j])
+    total = 0.0
+    for j in range(num_states):
+        total += np.exp(log_alpha[num_obs - 1, j] - high)
+    log_likelihood = high + np.log(total)
+    for i in range(num_obs):
+        for j in range(num_states):
+            log_posterior[i, j] = log_alpha[i, j] + log_beta[i, j] - log_likelihood
@@ -60,6 +60,31 @@ def entropy(X: npt.ArrayLike) -> float:
     return -np.sum(p * np.log(p))
 
 
+def _weighted_entropies(
+    cumsum: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    """Length weighted entropies of many segments from cumulative sums.
+
+    Parameters
+    ----------
+    cumsum: np.ndarray
+        Cumulative sums of the time series along the sequence index, with a leading
+        row of zeros, of shape (n_samples + 1, n_series).
+    starts, ends: np.ndarray
+        Start (inclusive) and end (exclusive) indexes of the segments.
+
+    Returns
+    -------
+    entropies: np.ndarray
+        The entropy of each segment multiplied by its length.
+    """
+    sums = cumsum[ends] - cumsum[starts]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = sums / np.sum(sums, axis=1, keepdims=True)
+        p_log_p = np.where(p > 0.0, p * np.log(p), 0.0)
+    return -(ends - starts) * np.sum(p_log_p, axis=1)
+
+
 def generate_segments(X: npt.ArrayLike, change_points: List[int]) -> npt.ArrayLike:
     """Generate separate segments from time series based on change points.
 
@@ -255,20 +280,58 @@ class IGTS:
             )
         self.intermediate_results_ = []
 
+        # the column sums of a segment are differences of the cumulative sums, so
+        # the entropy of any segment is computed in O(n_series)
+        cumsum = np.zeros((n_samples + 1, n_series))
+        np.cumsum(X, axis=0, out=cumsum[1:])
+        total_entropy = entropy(X)
+
         # by convention initialize with the identity segmentation
         current_change_points = self.identity(X)
 
+        candidates = np.array(
+            self.get_candidates(n_samples, current_change_points), dtype=int
+        )
+        available = np.ones(len(candidates), dtype=bool)
+        # change of the weighted entropy sum when splitting the segment containing
+        # each candidate, only updated for candidates in the segment split last
+        split_costs = np.zeros(len(candidates))
+        outdated = np.ones(len(candidates), dtype=bool)
+
         for k in range(self.k_max):
             ig_max = 0
+            change_points = np.array(current_change_points)
+            segments_entropy = np.sum(
+                _weighted_entropies(cumsum, change_points[:-1], change_points[1:])
+            )
+
+            update = np.flatnonzero(outdated & available)
+            if len(update) > 0:
+                split = candidates[update]
+                index = np.searchsorted(change_points, split)
+                starts = change_points[index - 1]
+                ends = change_points[index]
+                split_costs[update] = (
+                    _weighted_entropies(cumsum, starts, split)
+                    + _weighted_entropies(cumsum, split, ends)
+                    - _weighted_entropies(cumsum, starts, ends)
+                )
+                outdated[update] = False
+
             # find a point which maximizes score
-            for candidate in self.get_candidates(n_samples, current_change_points):
-                try_change_points = {candidate}
-                try_change_points.update(current_change_points)
-                try_change_points = sorted(try_change_points)
-                ig = self.information_gain_score(X, try_change_points)
-                if ig > ig_max:
-                    ig_max = ig
-                    best_candidate = candidate
+            scores = total_entropy - (segments_entropy + split_costs) / n_samples
+            scores[~available] = -np.inf
+            if len(scores) > 0 and scores.max() > ig_max:
+                best = np.argmax(scores)
+                ig_max = scores[best]
+                best_candidate = int(candidates[best])
+                available[best] = False
+
+                index = np.searchsorted(change_points, best_candidate)
+                outdated[
+                    (candidates > change_points[index - 1])
+                    & (candidates < change_points[index])
+                ] = True
 
             current_change_points.append(best_candidate)
             current_change_points.sort()
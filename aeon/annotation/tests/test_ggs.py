@@ -32,3 +32,45 @@ def test_GreedyGaussianSegmentation(univariate_mean_shift):
         "max_shuffles": 250,
         "random_state": None,
     }
+
+
+def test_GGS_add_new_change_point():
+    """Test the split search against the log likelihood of each split."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(60, 3))
+    data[25:] += 2
+    lamb = 1.0
+    ggs = GGS(lamb=lamb)
+
+    m, n = data.shape
+    orig_ll = ggs.log_likelihood(data)
+    expected_ll = np.zeros(m)
+    for i in range(2, m - 1):
+        # the left mean includes data[0] / n, as in the original implementation
+        mu_left = (data[0] / n + data[1:i].sum(axis=0)) / i
+        sig_left = data[:i].T @ data[:i] / i - np.outer(mu_left, mu_left)
+        sig_right = np.cov(data[i:].T, bias=True)
+        for sig, size in ((sig_left, i), (sig_right, m - i)):
+            sig = sig + lamb * np.identity(n) / size
+            expected_ll[i] += size * np.linalg.slogdet(sig)[1]
+            expected_ll[i] -= lamb * np.trace(np.linalg.inv(sig))
+    expected_index = np.argmin(expected_ll[2 : m - 1]) + 2
+
+    index, gain = ggs.add_new_change_point(data)
+    assert index == expected_index
+    np.testing.assert_almost_equal(gain, expected_ll[expected_index] - orig_ll)
+
+
+def test_GGS_find_change_points_in_place_update():
+    """Test the splits of data modified in place after a search are not reused."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(80, 2))
+    data[30:] += 3
+    ggs = GGS(k_max=2, lamb=1.0)
+    ggs.find_change_points(data)
+    assert ggs._splits is None and ggs._splits_data is None
+
+    data[:] = rng.normal(size=(80, 2))
+    data[55:] += 3
+    expected = GGS(k_max=2, lamb=1.0).find_change_points(data.copy())
+    assert ggs.find_change_points(data) == expected
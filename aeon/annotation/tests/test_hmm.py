@@ -84,3 +84,35 @@ def test_hmm_behaves_as_expected_on_simple_input():
     labels = hmm_est.predict(obs)
     ground_truth = asarray([0, 0, 0, 0, 1, 1, 1])
     assert array_equal(labels, ground_truth)
+
+
+def test_hmm_predict_scores_and_batch():
+    """Test the posterior probs and the labels of a batch of sequences."""
+    centers = [3.5, -5]
+    emi_funcs = [(norm.pdf, {"loc": mean, "scale": 1}) for mean in centers]
+    transition_matrix = asarray([[0.9, 0.1], [0.2, 0.8]])
+    hmm_est = HMM(emi_funcs, transition_matrix)
+    obs = asarray([3.7, 3.2, 3.4, 3.6, -5.1, -5.2, -4.9])
+    hmm_est = hmm_est.fit(obs)
+
+    # posterior probs by summing the probs of all possible paths
+    paths = np.array(np.meshgrid(*[[0, 1]] * len(obs))).reshape(len(obs), -1).T
+    emi_probs = np.array([norm.pdf(obs, loc=mean, scale=1) for mean in centers])
+    path_probs = 0.5 * emi_probs[paths[:, 0], 0]
+    for i in range(1, len(obs)):
+        path_probs *= transition_matrix[paths[:, i - 1], paths[:, i]]
+        path_probs *= emi_probs[paths[:, i], i]
+    expected = np.array(
+        [[path_probs[paths[:, i] == s].sum() for s in range(2)] for i in range(7)]
+    )
+    expected /= path_probs.sum()
+    np.testing.assert_almost_equal(hmm_est.predict_scores(obs), expected)
+
+    batch = [obs, obs[::-1], obs[:1]]
+    labels = hmm_est.predict_batch(batch)
+    assert len(labels) == len(batch)
+    for x, y in zip(batch, labels):
+        assert array_equal(y, hmm_est.predict(x))
+
+    with pytest.raises(TypeError, match="input must be"):
+        hmm_est.predict_batch([obs, list(obs)])
@@ -53,3 +53,14 @@ def test_InformationGainSegmentation(multivariate_mean_shift):
     )
     assert igts.change_points_ == [0, 5, 10, 15, 20]
     assert len(igts.intermediate_results_) == 3
+
+
+def test_IGTS_intermediate_scores():
+    """Test the scores found from cumulative sums match the information gain."""
+    X = np.random.RandomState(0).random((60, 3))
+    igts = IGTS(k_max=4, step=2)
+    igts.find_change_points(X)
+    for result in igts.intermediate_results_:
+        assert result.score == pytest.approx(
+            IGTS.information_gain_score(X, result.change_points)
+        )
@@ -28,6 +28,10 @@ Tag inspection and setter methods
     setting dynamic tags          - set_tags(**tag_dict: dict)
     set/clone dynamic tags        - clone_tags(estimator, tag_names=None)
 
+Config inspection and setter methods
+    inspect config flags          - get_config()
+    setting config flags          - set_config(**config_dict: dict)
+
 Blueprinting: resetting and cloning, post-init state with same hyper-parameters
     reset estimator to post-init  - reset()
     cloneestimator (copy&reset)   - clone()
@@ -72,6 +76,8 @@ class BaseObject(_BaseEstimator):
     Extends scikit-learn's BaseEstimator to include aeon interface for tags.
     """
 
+    _config = {}
+
     def __init__(self):
         self._tags_dynamic = dict()
         super(BaseObject, self).__init__()
@@ -110,9 +116,11 @@ class BaseObject(_BaseEstimator):
         Not affected by the reset are:
         object attributes containing double-underscores
         class and object methods, class attributes
+        config flags set with set_config
         """
-        # retrieve parameters to copy them later
+        # retrieve parameters and config to copy them later
         params = self.get_params(deep=False)
+        config = getattr(self, "_config_dynamic", None)
 
         # delete all object attributes in self
         attrs = [attr for attr in dir(self) if "__" not in attr]
@@ -123,6 +131,8 @@ class BaseObject(_BaseEstimator):
 
         # run init with a copy of parameters self had at the start
         self.__init__(**params)
+        if config:
+            self._config_dynamic = config
 
         return self
 
@@ -130,14 +140,18 @@ class BaseObject(_BaseEstimator):
         """Obtain a clone of the object with same hyper-parameters.
 
         A clone is a different object without shared references, in post-init state.
-        This function is equivalent to returning sklearn.clone of self.
+        This function is equivalent to returning sklearn.clone of self, with the
+        config flags of self.
         Equal in value to `type(self)(**self.get_params(deep=False))`.
 
         Returns
         -------
         instance of type(self), clone of self (see above)
         """
-        return clone(self)
+        self_clone = clone(self)
+        if getattr(self, "_config_dynamic", None):
+            self_clone._config_dynamic = deepcopy(self._config_dynamic)
+        return self_clone
 
     @classmethod
     def _get_init_signature(cls):
@@ -373,6 +387,73 @@ class BaseObject(_BaseEstimator):
 
         return self
 
+    def get_config(self):
+        """Get config flags from estimator class and dynamic config overrides.
+
+        Config flags set how the object runs, e.g., the parallel backend used. Unlike
+        tags they do not describe the object, and unlike parameters they do not
+        change its results.
+
+        Returns
+        -------
+        config_dict : dict
+            Dictionary of config name : config value pairs. Collected from _config
+            class attribute via nested inheritance and then any overrides
+            from _config_dynamic object attribute.
+        """
+        config_dict = dict()
+
+        # We exclude the last two parent classes: sklearn.base.BaseEstimator and
+        # the basic Python object.
+        for parent_class in reversed(inspect.getmro(self.__class__)[:-2]):
+            if hasattr(parent_class, "_config"):
+                config_dict.update(parent_class._config)
+
+        if hasattr(self, "_config_dynamic"):
+            config_dict.update(self._config_dynamic)
+
+        return deepcopy(config_dict)
+
+    def set_config(self, **config_dict):
+        """Set config flags to given values.
+
+        Config flags are kept by reset and clone, so they are not changed by fit.
+
+        Parameters
+        ----------
+        config_dict : dict
+            Dictionary of config name : config value pairs. Valid config names and
+            values are listed in aeon.registry.ESTIMATOR_CONFIG_REGISTER.
+
+        Returns
+        -------
+        Self :
+            Reference to self.
+
+        Raises
+        ------
+        ValueError if a config name is not a config flag of self, or the config value
+        is not valid for it.
+        """
+        from aeon.registry import check_config_is_valid
+
+        valid_configs = self.get_config()
+        for config_name, config_value in config_dict.items():
+            if config_name not in valid_configs:
+                raise ValueError(
+                    f"{config_name} is not a config flag of {type(self).__name__}, "
+                    f"valid config flags are {list(valid_configs)}."
+                )
+            check_config_is_valid(config_name, config_value)
+
+        config_update = deepcopy(config_dict)
+        if hasattr(self, "_config_dynamic"):
+            self._config_dynamic.update(config_update)
+        else:
+            self._config_dynamic = config_update
+
+        return self
+
     def clone_tags(self, estimator, tag_names=None):
         """clone/mirror tags from another estimator as dynamic override.
 
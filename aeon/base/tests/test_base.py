@@ -10,6 +10,7 @@ tests in this module:
     test_get_tags        - tests get_tags inheritance logic
     test_get_tag         - tests get_tag logic, incl default value
     test_set_tags        - tests set_tags logic and related get_tags inheritance
+    test_set_config      - tests set_config logic, incl keeping config in reset/clone
 
     test_reset           - tests reset logic on a simple, non-composite estimator
     test_reset_composite - tests reset logic on a composite estimator
@@ -28,6 +29,7 @@ __all__ = [
     "test_get_tags",
     "test_get_tag",
     "test_set_tags",
+    "test_set_config",
     "test_reset",
     "test_reset_composite",
     "test_components",
@@ -177,6 +179,39 @@ def test_set_tags():
     assert FIXTURE_OBJECT_SET.get_tags() == FIXTURE_OBJECT_SET_TAGS, msg
 
 
+class ConfigTester(BaseObject):
+    _config = {"backend:parallel": None, "backend:parallel:params": None}
+
+    def __init__(self, a=42):
+        self.a = a
+        super(ConfigTester, self).__init__()
+
+
+def test_set_config():
+    """Tests set_config method of BaseObject for correctness.
+
+    Raises
+    ------
+    AssertionError if set_config does not override the class config, or if the config
+        is not kept by reset and clone
+    """
+    x = ConfigTester()
+    assert x.get_config() == {"backend:parallel": None, "backend:parallel:params": None}
+
+    x.set_config(**{"backend:parallel": "threading"})
+    x.reset()
+    x_clone = x.clone()
+    for obj in [x, x_clone]:
+        assert obj.get_config()["backend:parallel"] == "threading"
+        assert obj.get_config()["backend:parallel:params"] is None
+    assert ConfigTester().get_config()["backend:parallel"] is None
+
+    with pytest.raises(ValueError, match="must be one of"):
+        x.set_config(**{"backend:parallel": "foo"})
+    with pytest.raises(ValueError, match="not a config flag"):
+        x.set_config(foo=42)
+
+
 class CompositionDummy(BaseObject):
     """Potentially composite object, for testing."""
 
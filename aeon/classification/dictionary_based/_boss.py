@@ -11,16 +11,17 @@ __all__ = ["BOSSEnsemble", "IndividualBOSS", "pairwise_distances"]
 from itertools import compress
 
 import numpy as np
-from joblib import Parallel, effective_n_jobs
+from numba import config, get_num_threads, njit, prange, set_num_threads
+from scipy.sparse import csr_matrix
 from sklearn.metrics import pairwise
-from sklearn.utils import check_random_state, gen_even_slices
+from sklearn.utils import check_random_state
 from sklearn.utils.extmath import safe_sparse_dot
-from sklearn.utils.fixes import delayed
 from sklearn.utils.sparsefuncs_fast import csr_row_norms
-from sklearn.utils.validation import _num_samples
 
 from aeon.classification.base import BaseClassifier
 from aeon.transformations.panel.dictionary_based import SFAFast
+from aeon.transformations.panel.dictionary_based._dft_cache import _DFTCache
+from aeon.utils.validation import check_n_jobs
 from aeon.utils.validation.panel import check_X_y
 
 
@@ -205,6 +206,7 @@ class BOSSEnsemble(BaseClassifier):
             )
         max_acc = -1
         min_max_acc = -1
+        dft_cache = _DFTCache(X)
         for normalise in self._norm_options:
             for win_size in range(self.min_window, max_window + 1, win_inc):
                 # max_word_len = min(self.min_window - 2, self.word_lengths[0])
@@ -219,6 +221,7 @@ class BOSSEnsemble(BaseClassifier):
                     n_jobs=self.n_jobs,
                     random_state=self.random_state,
                 )
+                boss._dft_cache = dft_cache
                 boss.fit(X, y)
 
                 best_classifier_for_win_size = boss
@@ -246,8 +249,8 @@ class BOSSEnsemble(BaseClassifier):
                     min_max_acc,
                     len(self.estimators_),
                 ):
-                    best_classifier_for_win_size._clean()
                     best_classifier_for_win_size._set_word_len(X, y, best_word_len)
+                    best_classifier_for_win_size._clean()
                     self.estimators_.append(best_classifier_for_win_size)
 
                     if best_acc_for_win_size > max_acc:
@@ -311,8 +314,12 @@ class BOSSEnsemble(BaseClassifier):
         """
         sums = np.zeros((X.shape[0], self.n_classes_))
 
-        for clf in self.estimators_:
+        # visit members by window size, so each DFT is computed once
+        dft_cache = _DFTCache(X, max_bytes=0)
+        for clf in sorted(self.estimators_, key=lambda clf: clf.window_size):
+            clf._dft_cache = dft_cache
             preds = clf.predict(X)
+            clf._dft_cache = None
             for i in range(X.shape[0]):
                 sums[i, self._class_dictionary[preds[i]]] += 1
         return sums / (np.ones(self.n_classes_) * self.n_estimators_)
@@ -566,6 +573,7 @@ class IndividualBOSS(BaseClassifier):
         self._accuracy = 0
         self._subsample = []
         self._train_predictions = []
+        self._dft_cache = None
 
         super(IndividualBOSS, self).__init__()
 
@@ -601,6 +609,7 @@ class IndividualBOSS(BaseClassifier):
             feature_selection=self.feature_selection,
             random_state=self.random_state,
         )
+        self._transformer._dft_cache = self._dft_cache
 
         self._transformed_data = self._transformer.fit_transform(X, y)
         self._class_vals = y
@@ -620,7 +629,9 @@ class IndividualBOSS(BaseClassifier):
         y : array-like, shape = [n_instances]
             Predicted class labels.
         """
+        self._transformer._dft_cache = self._dft_cache
         test_bags = self._transformer.transform(X)
+        self._transformer._dft_cache = None
         data_type = type(self._class_vals[0])
         if data_type in [np.str_, str]:
             data_type = "object"
@@ -676,6 +687,8 @@ class IndividualBOSS(BaseClassifier):
     def _clean(self):
         self._transformer.words = None
         self._transformer.save_words = False
+        self._transformer._dft_cache = None
+        self._dft_cache = None
 
     def _set_word_len(self, X, y, word_len):
         self.word_length = word_len
@@ -686,31 +699,29 @@ class IndividualBOSS(BaseClassifier):
         self._transformed_data = self._transformer.fit_transform(X, y)
 
 
-def _dist_wrapper(dist_matrix, X, Y, s, XX_all=None, XY_all=None):
-    """Write in-place to a slice of a distance matrix."""
-    for i in range(s.start, s.stop):
-        dist_matrix[i] = boss_distance(X, Y, i, XX_all, XY_all)
-
-
 def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
     """Find the euclidean distance between all pairs of bop-models."""
     if use_boss_distance:
         if Y is None:
             Y = X
 
-        XX_row_norms = csr_row_norms(X)
-        XY = safe_sparse_dot(X, Y.T, dense_output=True)
-
-        distance_matrix = np.zeros((X.shape[0], Y.shape[0]))
-
-        if effective_n_jobs(n_jobs) > 1:
-            Parallel(n_jobs=n_jobs, prefer="threads")(
-                delayed(_dist_wrapper)(distance_matrix, X, Y, s, XX_row_norms, XY)
-                for s in gen_even_slices(_num_samples(X), effective_n_jobs(n_jobs))
+        X_csr = csr_matrix(X)
+        Y_csr = X_csr if Y is X else csr_matrix(Y)
+
+        prev_threads = get_num_threads()
+        set_num_threads(min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS))
+        try:
+            distance_matrix = _boss_distance_matrix(
+                X_csr.indptr,
+                X_csr.indices,
+                X_csr.data.astype(np.float64),
+                Y_csr.indptr,
+                Y_csr.indices,
+                Y_csr.data.astype(np.float64),
+                X_csr.shape[1],
             )
-        else:
-            for i in range(len(distance_matrix)):
-                distance_matrix[i] = boss_distance(X, Y, i, XX_row_norms, XY)
+        finally:
+            set_num_threads(prev_threads)
 
     else:
         distance_matrix = pairwise.pairwise_distances(X, Y, n_jobs=n_jobs)
@@ -721,6 +732,33 @@ def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
     return distance_matrix
 
 
+@njit(cache=True, parallel=True)
+def _boss_distance_matrix(
+    X_indptr, X_indices, X_data, Y_indptr, Y_indices, Y_data, n_features
+):
+    n_x = len(X_indptr) - 1
+    n_y = len(Y_indptr) - 1
+    distance_matrix = np.zeros((n_x, n_y))
+
+    for i in prange(n_x):
+        # scatter the first histogram, only its words are measured
+        x = np.zeros(n_features)
+        xx = 0.0
+        for k in range(X_indptr[i], X_indptr[i + 1]):
+            x[X_indices[k]] = X_data[k]
+            xx += X_data[k] * X_data[k]
+
+        for j in range(n_y):
+            dist = xx
+            for k in range(Y_indptr[j], Y_indptr[j + 1]):
+                x_val = x[Y_indices[k]]
+                if x_val != 0:
+                    dist += Y_data[k] * Y_data[k] - 2 * x_val * Y_data[k]
+            distance_matrix[i, j] = dist
+
+    return distance_matrix
+
+
 # @njit(cache=True, fastmath=True)
 def boss_distance(X, Y, i, XX_all=None, XY_all=None):
     """Find the distance between two histograms.
@@ -18,6 +18,7 @@ from sklearn.utils import check_random_state
 from aeon.classification.base import BaseClassifier
 from aeon.classification.dictionary_based import IndividualBOSS
 from aeon.classification.dictionary_based._boss import pairwise_distances
+from aeon.transformations.panel.dictionary_based._dft_cache import _DFTCache
 from aeon.utils.validation.panel import check_X_y
 
 
@@ -226,6 +227,7 @@ class ContractableBOSS(BaseClassifier):
         lowest_acc_idx = 0
 
         rng = check_random_state(self.random_state)
+        dft_cache = _DFTCache(X)
 
         if time_limit > 0:
             n_parameter_samples = 0
@@ -259,6 +261,7 @@ class ContractableBOSS(BaseClassifier):
                 feature_selection=self.feature_selection,
                 random_state=self.random_state,
             )
+            boss._dft_cache = dft_cache.subset(rows=subsample)
             boss.fit(X_subsample, y_subsample)
             boss._clean()
             boss._subsample = subsample
@@ -331,8 +334,16 @@ class ContractableBOSS(BaseClassifier):
         """
         sums = np.zeros((X.shape[0], self.n_classes_))
 
-        for n, clf in enumerate(self.estimators_):
+        # visit members by window size, so each DFT is computed once
+        dft_cache = _DFTCache(X, max_bytes=0)
+        for n in sorted(
+            range(len(self.estimators_)),
+            key=lambda n: self.estimators_[n].window_size,
+        ):
+            clf = self.estimators_[n]
+            clf._dft_cache = dft_cache
             preds = clf.predict(X)
+            clf._dft_cache = None
             for i in range(X.shape[0]):
                 sums[i, self._class_dictionary[preds[i]]] += self.weights_[n]
 
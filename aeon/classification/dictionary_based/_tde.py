@@ -15,14 +15,16 @@ from collections import defaultdict
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit, types
+from numba import config, get_num_threads, njit, prange, set_num_threads, types
 from numba.typed import Dict
+from scipy.sparse import csr_matrix
 from sklearn import preprocessing
 from sklearn.kernel_ridge import KernelRidge
 from sklearn.utils import check_random_state
 
 from aeon.classification.base import BaseClassifier
 from aeon.transformations.panel.dictionary_based import SFA
+from aeon.transformations.panel.dictionary_based._dft_cache import _DFTCache
 from aeon.utils.validation.panel import check_X_y
 
 
@@ -82,11 +84,9 @@ class TemporalDictionaryEnsemble(BaseClassifier):
     contract_max_n_parameter_samples : int, default=np.inf
         Max number of parameter combinations to consider when time_limit_in_minutes is
         set.
-    typed_dict : bool, default=True
-        Use a numba typed Dict to store word counts. May increase memory usage, but will
-        be faster for larger datasets. As the Dict cannot be pickled currently, there
-        will be some overhead converting it to a python dict with multiple threads and
-        pickling.
+    typed_dict : str, default="deprecated"
+        No longer used, word counts are stored in a sparse matrix. This parameter will
+        be removed in a future version.
     save_train_predictions : bool, default=False
         Save the ensemble member train predictions in fit for use in _get_train_probs
         leave-one-out cross-validation.
@@ -168,7 +168,7 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         max_dims=20,
         time_limit_in_minutes=0.0,
         contract_max_n_parameter_samples=np.inf,
-        typed_dict=True,
+        typed_dict="deprecated",
         save_train_predictions=False,
         n_jobs=1,
         random_state=None,
@@ -283,6 +283,7 @@ class TemporalDictionaryEnsemble(BaseClassifier):
             contract_max_n_parameter_samples = np.inf
 
         rng = check_random_state(self.random_state)
+        dft_cache = _DFTCache(X)
 
         if self.bigrams is None:
             if self.n_dims_ > 1:
@@ -332,7 +333,9 @@ class TemporalDictionaryEnsemble(BaseClassifier):
                 n_jobs=self._threads_to_use,
                 random_state=self.random_state,
             )
+            tde._dft_cache = dft_cache.subset(rows=subsample)
             tde.fit(X_subsample, y_subsample)
+            tde._dft_cache = None
             tde._subsample = subsample
 
             tde._accuracy = self._individual_train_acc(
@@ -411,8 +414,16 @@ class TemporalDictionaryEnsemble(BaseClassifier):
 
         sums = np.zeros((X.shape[0], self.n_classes_))
 
-        for n, clf in enumerate(self.estimators_):
+        # visit members by window size, so each DFT is computed once
+        dft_cache = _DFTCache(X, max_bytes=0)
+        for n in sorted(
+            range(len(self.estimators_)),
+            key=lambda n: self.estimators_[n].window_size,
+        ):
+            clf = self.estimators_[n]
+            clf._dft_cache = dft_cache
             preds = clf.predict(X)
+            clf._dft_cache = None
             for i in range(0, X.shape[0]):
                 sums[i, self._class_dictionary[preds[i]]] += self.weights_[n]
 
@@ -637,9 +648,9 @@ class IndividualTDE(BaseClassifier):
     max_dims : int, default=20
         Maximum number of dimensions words are extracted from. Only applicable for
         multivariate data.
-    typed_dict : bool, default=True
-        Use a numba TypedDict to store word counts. May increase memory usage, but will
-        be faster for larger datasets.
+    typed_dict : str, default="deprecated"
+        No longer used, word counts are stored in a sparse matrix. This parameter will
+        be removed in a future version.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
@@ -704,7 +715,7 @@ class IndividualTDE(BaseClassifier):
         bigrams=True,
         dim_threshold=0.85,
         max_dims=20,
-        typed_dict=True,
+        typed_dict="deprecated",
         n_jobs=1,
         random_state=None,
     ):
@@ -730,47 +741,17 @@ class IndividualTDE(BaseClassifier):
 
         self._transformers = []
         self._transformed_data = []
+        self._vocabulary = {}
         self._class_vals = []
         self._dims = []
         self._highest_dim_bit = 0
         self._accuracy = 0
         self._subsample = []
         self._train_predictions = []
+        self._dft_cache = None
 
         super(IndividualTDE, self).__init__()
 
-    # todo remove along with BOSS and SFA workarounds when Dict becomes serialisable.
-    def __getstate__(self):
-        """Return state as dictionary for pickling, required for typed Dict objects."""
-        state = self.__dict__.copy()
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, ndict in enumerate(state["_transformed_data"]):
-                pdict = dict()
-                for key, val in ndict.items():
-                    pdict[key] = val
-                nl[i] = pdict
-            state["_transformed_data"] = nl
-        return state
-
-    def __setstate__(self, state):
-        """Set current state using input pickling, required for typed Dict objects."""
-        self.__dict__.update(state)
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, pdict in enumerate(self._transformed_data):
-                ndict = (
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
-                    )
-                    if self.levels > 1 or self.n_dims_ > 1
-                    else Dict.empty(key_type=types.int64, value_type=types.uint32)
-                )
-                for key, val in pdict.items():
-                    ndict[key] = val
-                nl[i] = ndict
-            self._transformed_data = nl
-
     def _fit(self, X, y):
         """Fit a single base TDE classifier on n_instances cases (X,y).
 
@@ -797,17 +778,9 @@ class IndividualTDE(BaseClassifier):
         # select dimensions using accuracy estimate if multivariate
         if self.n_dims_ > 1:
             self._dims, self._transformers = self._select_dims(X, y)
+            self._set_dft_cache(self._dft_cache)
 
-            words = (
-                [
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
-                    )
-                    for _ in range(self.n_instances_)
-                ]
-                if self.typed_dict
-                else [defaultdict(int) for _ in range(self.n_instances_)]
-            )
+            words = [defaultdict(int) for _ in range(self.n_instances_)]
 
             for i, dim in enumerate(self._dims):
                 X_dim = X[:, dim, :].reshape(self.n_instances_, 1, self.series_length_)
@@ -815,19 +788,10 @@ class IndividualTDE(BaseClassifier):
                 dim_words = dim_words[0]
 
                 for n in range(self.n_instances_):
-                    if self.typed_dict:
-                        for word, count in dim_words[n].items():
-                            if self.levels > 1:
-                                words[n][
-                                    (word[0], word[1] << self._highest_dim_bit | dim)
-                                ] = count
-                            else:
-                                words[n][(word, dim)] = count
-                    else:
-                        for word, count in dim_words[n].items():
-                            words[n][word << self._highest_dim_bit | dim] = count
-
-            self._transformed_data = words
+                    for word, count in dim_words[n].items():
+                        words[n][word << self._highest_dim_bit | dim] = count
+
+            bags = words
         else:
             self._transformers.append(
                 SFA(
@@ -842,14 +806,20 @@ class IndividualTDE(BaseClassifier):
                     lower_bounding=False,
                     save_words=False,
                     use_fallback_dft=True,
-                    typed_dict=self.typed_dict,
+                    typed_dict=False,
                     n_jobs=self._threads_to_use,
                 )
             )
+            self._set_dft_cache(self._dft_cache)
             # todo use fit_transform when SFA is interface compliant
             self._transformers[0].fit(X, y)
             sfa = self._transformers[0].transform(X, y)
-            self._transformed_data = sfa[0]
+            bags = sfa[0]
+
+        self._set_dft_cache(None)
+
+        # store the bags as a sparse matrix over the words seen in training
+        self._transformed_data, self._vocabulary = _bags_to_csr(bags)
 
     def _predict(self, X):
         """Predict class values of all instances in X.
@@ -865,18 +835,10 @@ class IndividualTDE(BaseClassifier):
             Predicted class labels.
         """
         num_cases = X.shape[0]
+        self._set_dft_cache(self._dft_cache)
 
         if self.n_dims_ > 1:
-            words = (
-                [
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
-                    )
-                    for _ in range(num_cases)
-                ]
-                if self.typed_dict
-                else [defaultdict(int) for _ in range(num_cases)]
-            )
+            words = [defaultdict(int) for _ in range(num_cases)]
 
             for i, dim in enumerate(self._dims):
                 X_dim = X[:, dim, :].reshape(num_cases, 1, self.series_length_)
@@ -884,40 +846,47 @@ class IndividualTDE(BaseClassifier):
                 dim_words = dim_words[0]
 
                 for n in range(num_cases):
-                    if self.typed_dict:
-                        for word, count in dim_words[n].items():
-                            if self.levels > 1:
-                                words[n][
-                                    (word[0], word[1] << self._highest_dim_bit | dim)
-                                ] = count
-                            else:
-                                words[n][(word, dim)] = count
-                    else:
-                        for word, count in dim_words[n].items():
-                            words[n][word << self._highest_dim_bit | dim] = count
+                    for word, count in dim_words[n].items():
+                        words[n][word << self._highest_dim_bit | dim] = count
 
             test_bags = words
         else:
             test_bags = self._transformers[0].transform(X)
             test_bags = test_bags[0]
 
-        classes = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
-            delayed(self._test_nn)(
-                test_bag,
+        self._set_dft_cache(None)
+
+        # words not seen in training do not contribute to the similarity
+        test_bags, _ = _bags_to_csr(test_bags, self._vocabulary)
+
+        prev_threads = get_num_threads()
+        set_num_threads(min(self._threads_to_use, config.NUMBA_NUM_THREADS))
+        try:
+            sims = _histogram_intersection_matrix(
+                test_bags.indptr,
+                test_bags.indices,
+                test_bags.data,
+                self._transformed_data.indptr,
+                self._transformed_data.indices,
+                self._transformed_data.data,
+                len(self._vocabulary),
             )
-            for test_bag in test_bags
-        )
+        finally:
+            set_num_threads(prev_threads)
 
-        return np.array(classes)
+        return np.array([self._test_nn(sims[i]) for i in range(num_cases)])
 
-    def _test_nn(self, test_bag):
+    def _test_nn(self, sims):
         rng = check_random_state(self.random_state)
 
         best_sim = -1
         nn = None
 
-        for n, bag in enumerate(self._transformed_data):
-            sim = histogram_intersection(test_bag, bag)
+        # only cases with a similarity at least the best so far can be chosen, ties
+        # are broken randomly in the order of the training cases
+        prev_best = np.maximum.accumulate(np.concatenate(([-1], sims[:-1])))
+        for n in np.flatnonzero(sims >= prev_best):
+            sim = sims[n]
 
             if sim > best_sim or (sim == best_sim and rng.random() < 0.5):
                 best_sim = sim
@@ -947,10 +916,12 @@ class IndividualTDE(BaseClassifier):
                     save_words=False,
                     keep_binning_dft=True,
                     use_fallback_dft=True,
-                    typed_dict=self.typed_dict,
+                    typed_dict=False,
                     n_jobs=self._threads_to_use,
                 )
             )
+            if self._dft_cache is not None:
+                transformers[i]._dft_cache = self._dft_cache.subset(dim=i)
 
             X_dim = X[:, i, :].reshape(self.n_instances_, 1, self.series_length_)
 
@@ -962,9 +933,10 @@ class IndividualTDE(BaseClassifier):
             transformers[i].keep_binning_dft = False
             transformers[i].binning_dft = None
 
+            bags, _ = _bags_to_csr(sfa[0])
             correct = 0
             for i in range(self.n_instances_):
-                if self._train_predict(i, sfa[0]) == y[i]:
+                if self._train_predict(i, bags) == y[i]:
                     correct = correct + 1
 
             accs.append(correct)
@@ -986,25 +958,32 @@ class IndividualTDE(BaseClassifier):
 
         return dims, fin_transformers
 
+    def _set_dft_cache(self, dft_cache):
+        # share the ensemble DFT cache with the SFA transformer of each dimension
+        dims = self._dims if self.n_dims_ > 1 else [0]
+        for transformer, dim in zip(self._transformers, dims):
+            transformer._dft_cache = (
+                None if dft_cache is None else dft_cache.subset(dim=dim)
+            )
+
     def _train_predict(self, train_num, bags=None):
         if bags is None:
             bags = self._transformed_data
 
-        test_bag = bags[train_num]
-        best_sim = -1
-        nn = None
-
-        for n, bag in enumerate(bags):
-            if n == train_num:
-                continue
-
-            sim = histogram_intersection(test_bag, bag)
-
-            if sim > best_sim:
-                best_sim = sim
-                nn = self._class_vals[n]
+        start, end = bags.indptr[train_num], bags.indptr[train_num + 1]
+        sims = _histogram_intersection_row(
+            bags.indices[start:end],
+            bags.data[start:end],
+            bags.indptr,
+            bags.indices,
+            bags.data,
+            bags.shape[1],
+        )
+        sims[train_num] = -1
 
-        return nn
+        # the first case with the highest similarity
+        nn = np.argmax(sims)
+        return self._class_vals[nn] if sims[nn] > -1 else None
 
 
 def histogram_intersection(first, second):
@@ -1042,6 +1021,74 @@ def histogram_intersection(first, second):
         )
 
 
+def _bags_to_csr(bags, vocabulary=None):
+    """Convert a list of bags to a sparse matrix with a column for each word.
+
+    Words not in vocabulary are dropped. If vocabulary is None, it is created from the
+    words of the bags in order of appearance.
+    """
+    if vocabulary is None:
+        vocabulary = {}
+        for bag in bags:
+            for word in bag.keys():
+                vocabulary.setdefault(word, len(vocabulary))
+
+    indptr = np.zeros(len(bags) + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for i, bag in enumerate(bags):
+        for word, count in bag.items():
+            column = vocabulary.get(word)
+            if column is not None:
+                indices.append(column)
+                data.append(count)
+        indptr[i + 1] = len(indices)
+
+    bags = csr_matrix(
+        (
+            np.array(data, dtype=np.uint32),
+            np.array(indices, dtype=np.int64),
+            indptr,
+        ),
+        shape=(len(bags), len(vocabulary)),
+    )
+    return bags, vocabulary
+
+
+@njit(fastmath=True, cache=True)
+def _histogram_intersection_row(indices, data, Y_indptr, Y_indices, Y_data, n_features):
+    # scatter the first histogram, only its words are measured
+    x = np.zeros(n_features, dtype=np.uint32)
+    for k in range(len(indices)):
+        x[indices[k]] = data[k]
+
+    sims = np.zeros(len(Y_indptr) - 1, dtype=np.int64)
+    for j in range(len(sims)):
+        sim = 0
+        for k in range(Y_indptr[j], Y_indptr[j + 1]):
+            sim += min(x[Y_indices[k]], Y_data[k])
+        sims[j] = sim
+
+    return sims
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _histogram_intersection_matrix(
+    X_indptr, X_indices, X_data, Y_indptr, Y_indices, Y_data, n_features
+):
+    sims = np.zeros((len(X_indptr) - 1, len(Y_indptr) - 1), dtype=np.int64)
+    for i in prange(len(X_indptr) - 1):
+        sims[i] = _histogram_intersection_row(
+            X_indices[X_indptr[i] : X_indptr[i + 1]],
+            X_data[X_indptr[i] : X_indptr[i + 1]],
+            Y_indptr,
+            Y_indices,
+            Y_data,
+            n_features,
+        )
+    return sims
+
+
 @njit(fastmath=True, cache=True)
 def _histogram_intersection_dict(first, second):
     sim = 0
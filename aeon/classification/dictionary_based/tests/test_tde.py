@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 """TDE test code."""
+import pickle
+
 import numpy as np
 
-from aeon.classification.dictionary_based._tde import TemporalDictionaryEnsemble
+from aeon.classification.dictionary_based._tde import (
+    IndividualTDE,
+    TemporalDictionaryEnsemble,
+    histogram_intersection,
+)
 from aeon.datasets import load_unit_test
 
 
@@ -25,3 +31,19 @@ def test_tde_oob_train_estimate():
     assert isinstance(train_proba, np.ndarray)
     assert train_proba.shape == (len(X_train), 2)
     np.testing.assert_almost_equal(train_proba.sum(axis=1), 1, decimal=4)
+
+
+def test_individual_tde_sparse_bags():
+    """Test IndividualTDE sparse bags against the dictionary histogram intersection."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+
+    tde = IndividualTDE(window_size=8, word_length=4, random_state=0)
+    tde.fit(X_train, y_train)
+    tde = pickle.loads(pickle.dumps(tde))
+
+    train_bags = tde._transformers[0].transform(X_train)[0]
+    test_bags = tde._transformers[0].transform(X_test[:5])[0]
+    for i, test_bag in enumerate(test_bags):
+        sims = [histogram_intersection(test_bag, bag) for bag in train_bags]
+        assert tde._predict(X_test[i : i + 1])[0] == y_train[np.argmax(sims)]
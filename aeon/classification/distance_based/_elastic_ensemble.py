@@ -15,6 +15,7 @@ from sklearn.metrics import accuracy_score
 from sklearn.model_selection import (
     GridSearchCV,
     LeaveOneOut,
+    ParameterSampler,
     RandomizedSearchCV,
     StratifiedShuffleSplit,
     cross_val_predict,
@@ -23,6 +24,7 @@ from sklearn.model_selection import (
 from aeon.classification.base import BaseClassifier
 from aeon.classification.distance_based._time_series_neighbors import (
     KNeighborsTimeSeriesClassifier,
+    _dtw_window_loocv,
 )
 from aeon.transformations.panel.summarize._extract import series_slope_derivative
 
@@ -243,22 +245,51 @@ class ElasticEnsemble(BaseClassifier):
                         "Currently evaluating {self._distance_measures[dm].__name__}"
                     )
 
+            param_options = ElasticEnsemble._get_100_param_options(
+                self._distance_measures[dm], X
+            )
+            search_acc = None
+
+            # dtw cannot decrease as the window shrinks, so the leave-one-out accuracy
+            # of every window is found in a single search rather than one
+            # cross-validation per window
+            if this_measure == "dtw":
+                if self.proportion_of_param_options < 1:
+                    param_options = [
+                        params["distance_params"]
+                        for params in ParameterSampler(
+                            param_options,
+                            n_iter=100 * self.proportion_of_param_options,
+                            random_state=rand,
+                        )
+                    ]
+                else:
+                    param_options = param_options["distance_params"]
+                accs = _dtw_window_loocv(
+                    param_train_to_use,
+                    param_train_y,
+                    [params["window"] for params in param_options],
+                    n_jobs=self._threads_to_use,
+                )
+                best_params = param_options[np.argmax(accs)]
+                if param_train_to_use is full_train_to_use:
+                    search_acc = np.max(accs)
+
             # If 100 parameter options are being considered per measure,
             # use a GridSearchCV
-            if self.proportion_of_param_options == 1:
+            elif self.proportion_of_param_options == 1:
                 grid = GridSearchCV(
                     estimator=KNeighborsTimeSeriesClassifier(
                         distance=this_measure, n_neighbors=1
                     ),
-                    param_grid=ElasticEnsemble._get_100_param_options(
-                        self._distance_measures[dm], X
-                    ),
+                    param_grid=param_options,
                     cv=LeaveOneOut(),
                     scoring="accuracy",
                     n_jobs=self._threads_to_use,
                     verbose=self.verbose,
                 )
                 grid.fit(param_train_to_use, param_train_y)
+                best_params = grid.best_params_["distance_params"]
 
             # Else, used RandomizedSearchCV to randomly sample parameter
             # options for each measure
@@ -267,9 +298,7 @@ class ElasticEnsemble(BaseClassifier):
                     estimator=KNeighborsTimeSeriesClassifier(
                         distance=this_measure, n_neighbors=1
                     ),
-                    param_distributions=ElasticEnsemble._get_100_param_options(
-                        self._distance_measures[dm], X
-                    ),
+                    param_distributions=param_options,
                     n_iter=100 * self.proportion_of_param_options,
                     cv=LeaveOneOut(),
                     scoring="accuracy",
@@ -278,9 +307,14 @@ class ElasticEnsemble(BaseClassifier):
                     verbose=self.verbose,
                 )
                 grid.fit(param_train_to_use, param_train_y)
+                best_params = grid.best_params_["distance_params"]
 
             if self.majority_vote:
                 acc = 1
+            # the window search already gives the training accuracy of the best
+            # window if it used the full training data
+            elif search_acc is not None:
+                acc = search_acc
             # once the best parameter option has been estimated on the
             # training data, perform a final pass with this parameter option
             # to get the individual predictions with cross_cal_predict (
@@ -291,7 +325,7 @@ class ElasticEnsemble(BaseClassifier):
                 best_model = KNeighborsTimeSeriesClassifier(
                     n_neighbors=1,
                     distance=this_measure,
-                    distance_params=grid.best_params_["distance_params"],
+                    distance_params=best_params,
                     n_jobs=self._threads_to_use,
                 )
                 preds = cross_val_predict(
@@ -309,7 +343,7 @@ class ElasticEnsemble(BaseClassifier):
             best_model = KNeighborsTimeSeriesClassifier(
                 n_neighbors=1,
                 distance=this_measure,
-                distance_params=grid.best_params_["distance_params"],
+                distance_params=best_params,
             )
             best_model.fit(full_train_to_use, y)
             end_build_time = time.time()
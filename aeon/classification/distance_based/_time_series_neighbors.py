@@ -10,11 +10,17 @@ __author__ = ["TonyBagnall", "GuiArcencio"]
 __all__ = ["KNeighborsTimeSeriesClassifier"]
 
 import numpy as np
+from numba import config, get_num_threads, njit, prange, set_num_threads
 
 from aeon.classification.base import BaseClassifier
-from aeon.distances import distance_factory
+from aeon.distances import pairwise_distance
+from aeon.distances._bounding_matrix import _sakoe_chiba_radius
+from aeon.distances._dtw import _dtw_distance, _dtw_distance_and_width
+from aeon.distances._lower_bounding import _keogh_envelope, _lb_keogh, _lb_kim
+from aeon.utils.validation import check_n_jobs
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
+ALGORITHMS_SUPPORTED = ["brute", "cascade"]
 
 
 class KNeighborsTimeSeriesClassifier(BaseClassifier):
@@ -44,12 +50,25 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         if callable, must be of signature (X: np.ndarray, X2: np.ndarray) -> np.ndarray
     distance_params : dict, optional. default = None.
         dictionary for metric parameters for the case that distance is a str
-    n_jobs : int, default=None
+    n_jobs : int, default=1
         The number of parallel jobs to run for neighbors search.
-        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
-        Parameter for compatibility purposes, still unimplemented.
+        The distances between the cases to predict and the training cases are
+        computed in parallel with this many threads.
+    algorithm : str, default="brute"
+        Algorithm used to find the nearest neighbours, one of "brute" or "cascade".
+        "brute" computes the distance from each query to every training case.
+        "cascade" is only available for ``distance="dtw"`` and finds the same
+        neighbours by visiting training cases in order of the LB_Kim lower bound,
+        pruning them with LB_Keogh and early abandoning the dtw distance once it
+        exceeds the k-th best distance found so far [1]_.
+
+    References
+    ----------
+    .. [1] Rakthanmanon T. et al.: Searching and mining trillions of time series
+    subsequences under dynamic time warping. Proceedings of the 18th ACM SIGKDD,
+    2012
 
     Examples
     --------
@@ -75,12 +94,20 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         n_neighbors=1,
         weights="uniform",
         n_jobs=1,
+        algorithm="brute",
     ):
         self.distance = distance
         self.distance_params = distance_params
         self.n_neighbors = n_neighbors
         self.n_jobs = n_jobs
 
+        if algorithm not in ALGORITHMS_SUPPORTED:
+            raise ValueError(
+                f"Unrecognised kNN algorithm: {algorithm}. "
+                f"Allowed values are: {ALGORITHMS_SUPPORTED}. "
+            )
+        self.algorithm = algorithm
+
         if weights not in WEIGHTS_SUPPORTED:
             raise ValueError(
                 f"Unrecognised kNN weights: {weights}. "
@@ -100,16 +127,22 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         y : array-like, shape = [n_instances]
             The class labels.
         """
-        if isinstance(self.distance, str):
-            if self.distance_params is None:
-                self.metric_ = distance_factory(X[0], X[0], metric=self.distance)
-            else:
-                self.metric_ = distance_factory(
-                    X[0], X[0], metric=self.distance, **self.distance_params
-                )
-
         self.X_ = X
         self.classes_, self.y_ = np.unique(y, return_inverse=True)
+
+        if self.algorithm == "cascade":
+            if self.distance != "dtw":
+                raise ValueError(
+                    f"The cascade algorithm is only available for the dtw distance, "
+                    f"got distance={self.distance}."
+                )
+            params = {} if self.distance_params is None else self.distance_params
+            self._window = params.get("window")
+            self._radius = _sakoe_chiba_radius(X.shape[2], X.shape[2], self._window)
+            self._upper = np.empty(X.shape)
+            self._lower = np.empty(X.shape)
+            for i in range(X.shape[0]):
+                self._upper[i], self._lower[i] = _keogh_envelope(X[i], self._radius)
         return self
 
     def _predict_proba(self, X):
@@ -128,16 +161,8 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         self.check_is_fitted()
 
-        preds = np.zeros((X.shape[0], len(self.classes_)))
-        for i in range(X.shape[0]):
-            idx, weights = self._kneighbors(X[i])
-            for id, w in zip(idx, weights):
-                predicted_class = self.y_[id]
-                preds[i, predicted_class] += w
-
-            preds[i] = preds[i] / np.sum(preds[i])
-
-        return preds
+        preds = self._class_scores(X)
+        return preds / np.sum(preds, axis=1, keepdims=True)
 
     def _predict(self, X):
         """Predict the class labels for the provided data.
@@ -154,55 +179,81 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         self.check_is_fitted()
 
-        preds = np.empty(X.shape[0], dtype=self.classes_.dtype)
-        for i in range(X.shape[0]):
-            scores = np.zeros(len(self.classes_))
-            idx, weights = self._kneighbors(X[i])
-            for id, w in zip(idx, weights):
-                predicted_class = self.y_[id]
-                scores[predicted_class] += w
+        scores = self._class_scores(X)
+        return self.classes_[np.argmax(scores, axis=1)]
 
-            preds[i] = self.classes_[np.argmax(scores)]
-
-        return preds
+    def _class_scores(self, X):
+        """Sum the weights of the K-neighbors of each case per class."""
+        idx, ws = self._kneighbors(X)
+        scores = np.zeros((X.shape[0], len(self.classes_)))
+        rows = np.repeat(np.arange(X.shape[0]), idx.shape[1])
+        np.add.at(scores, (rows, self.y_[idx].ravel()), ws.ravel())
+        return scores
 
     def _kneighbors(self, X):
-        """Find the K-neighbors of a point.
+        """Find the K-neighbors of each case in X.
 
-        Returns indices and weights of each point.
+        Returns indices and weights of the neighbors of each case.
 
         Parameters
         ----------
         X : 3D np.array of shape = [n_instances, n_dimensions, series_length]
-            The training data.
+            The cases to find the neighbors of.
 
         Returns
         -------
-        ind : array
+        ind : array of shape = [n_instances, n_neighbors]
             Indices of the nearest points in the population matrix.
-        ws : array
+        ws : array of shape = [n_instances, n_neighbors]
             Array representing the weights of each neighbor.
         """
-        distances = np.array(
-            [self.metric_(X, self.X_[j]) for j in range(self.X_.shape[0])]
-        )
+        n_train = self.X_.shape[0]
+        if self.n_neighbors > n_train:
+            raise ValueError(
+                f"Expected n_neighbors <= n_samples_fit, but n_neighbors = "
+                f"{self.n_neighbors}, n_samples_fit = {n_train}."
+            )
 
-        # Find indices of k nearest neighbors using partitioning:
-        # [0..k-1], [k], [k+1..n-1]
-        # They might not be ordered within themselves,
-        # but it is not necessary and partitioning is
-        # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        n_jobs = check_n_jobs(self.n_jobs)
+        if self.algorithm == "cascade":
+            prev_threads = get_num_threads()
+            set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+            try:
+                closest_idx, closest_distances = _cascade_kneighbors_batch(
+                    X,
+                    self.X_,
+                    self._upper,
+                    self._lower,
+                    self.n_neighbors,
+                    self._window,
+                    self._radius,
+                )
+            finally:
+                set_num_threads(prev_threads)
+        else:
+            params = {} if self.distance_params is None else self.distance_params
+            distances = pairwise_distance(
+                X, self.X_, metric=self.distance, n_jobs=n_jobs, **params
+            )
+
+            # Find indices of k nearest neighbors using partitioning:
+            # [0..k-1], [k], [k+1..n-1]
+            # They might not be ordered within themselves,
+            # but it is not necessary and partitioning is
+            # O(n) while sorting is O(nlogn)
+            kth = min(self.n_neighbors, n_train - 1)
+            closest_idx = np.argpartition(distances, kth, axis=1)
+            closest_idx = closest_idx[:, : self.n_neighbors]
+            closest_distances = np.take_along_axis(distances, closest_idx, axis=1)
 
         if self.weights == "distance":
-            ws = distances[closest_idx]
+            ws = closest_distances
             ws = ws**2
 
             # Using epsilon ~= 0 to avoid division by zero
             ws = 1 / (ws + np.finfo(float).eps)
         elif self.weights == "uniform":
-            ws = np.repeat(1.0, self.n_neighbors)
+            ws = np.ones(closest_idx.shape)
         else:
             raise Exception(f"Invalid kNN weights: {self.weights}")
 
@@ -228,5 +279,221 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         # non-default distance and algorithm
         params1 = {"distance": "euclidean"}
+        params2 = {"distance": "dtw", "algorithm": "cascade"}
+
+        return [params1, params2]
 
-        return [params1]
+
+@njit(cache=True, fastmath=True)
+def _cascade_kneighbors(x, X, upper, lower, n_neighbors, window, radius):
+    """Find the k nearest neighbours of x in X under dtw with a lower bound cascade.
+
+    Parameters
+    ----------
+    x : np.ndarray of shape (n_dimensions, series_length)
+        The query series.
+    X : np.ndarray of shape (n_instances, n_dimensions, series_length)
+        The training series.
+    upper, lower : np.ndarray of shape (n_instances, n_dimensions, series_length)
+        LB_Keogh envelopes of the training series.
+    n_neighbors : int
+        The number of neighbours to find.
+    window : float or None
+        The dtw window.
+    radius : int
+        The window radius the envelopes were built with.
+
+    Returns
+    -------
+    closest_idx : np.ndarray of shape (n_neighbors,)
+        Indices of the nearest training series, ordered by distance.
+    closest_distances : np.ndarray of shape (n_neighbors,)
+        The dtw distances to the nearest training series.
+    """
+    n_instances = X.shape[0]
+    lb_kim = np.empty(n_instances)
+    for j in range(n_instances):
+        lb_kim[j] = _lb_kim(x, X[j])
+    order = np.argsort(lb_kim, kind="mergesort")
+
+    # LB_Keogh is only a lower bound for equal length series.
+    equal_length = x.shape[1] == X.shape[2]
+    if equal_length:
+        x_upper, x_lower = _keogh_envelope(x, radius)
+    else:
+        x_upper, x_lower = np.empty((0, 0)), np.empty((0, 0))
+
+    closest_idx = np.full(n_neighbors, -1, dtype=np.int64)
+    closest_distances = np.full(n_neighbors, np.inf)
+    for j in order:
+        best_so_far = closest_distances[n_neighbors - 1]
+        # Candidates are visited in order of their bound, so no later one can
+        # be closer than the current k-th neighbour.
+        if lb_kim[j] > best_so_far:
+            break
+        if equal_length:
+            if _lb_keogh(x, upper[j], lower[j], best_so_far) > best_so_far:
+                continue
+            if _lb_keogh(X[j], x_upper, x_lower, best_so_far) > best_so_far:
+                continue
+        dist = _dtw_distance(x, X[j], window, best_so_far)
+
+        # Keep the neighbours sorted by (distance, index) for a deterministic order.
+        pos = n_neighbors
+        while pos > 0 and (
+            closest_idx[pos - 1] == -1
+            or dist < closest_distances[pos - 1]
+            or (dist == closest_distances[pos - 1] and j < closest_idx[pos - 1])
+        ):
+            pos -= 1
+        if pos < n_neighbors:
+            closest_idx[pos + 1 :] = closest_idx[pos:-1].copy()
+            closest_distances[pos + 1 :] = closest_distances[pos:-1].copy()
+            closest_idx[pos] = j
+            closest_distances[pos] = dist
+    return closest_idx, closest_distances
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _cascade_kneighbors_batch(X_test, X, upper, lower, n_neighbors, window, radius):
+    """Run _cascade_kneighbors for each case in X_test in parallel."""
+    n_cases = X_test.shape[0]
+    closest_idx = np.empty((n_cases, n_neighbors), dtype=np.int64)
+    closest_distances = np.empty((n_cases, n_neighbors))
+    for i in prange(n_cases):
+        closest_idx[i], closest_distances[i] = _cascade_kneighbors(
+            X_test[i], X, upper, lower, n_neighbors, window, radius
+        )
+    return closest_idx, closest_distances
+
+
+def _dtw_window_loocv(X, y, windows, n_jobs=1):
+    """Find the leave-one-out accuracy of 1-NN dtw classifiers for many windows.
+
+    Gives the accuracy of ``KNeighborsTimeSeriesClassifier(distance="dtw")`` with
+    each window under leave-one-out cross-validation on (X, y), without a separate
+    cross-validation per window. The dtw distance cannot increase with the window, and
+    a warping path of width w gives the same distance for every window of at least
+    that width, so the distance between two series is only recomputed once a window
+    is narrower than the path found for the previous one [1]_. Candidates are pruned
+    with LB_Kim and LB_Keogh and the distance is early abandoned against the nearest
+    neighbours found so far for all remaining windows.
+
+    Ties between equally distant neighbours are broken by the lowest index.
+
+    Parameters
+    ----------
+    X : 3D np.ndarray of shape (n_instances, n_dimensions, series_length)
+        The training series, must be of equal length.
+    y : 1D np.ndarray of shape (n_instances,)
+        The class labels.
+    windows : list of float
+        The dtw windows to evaluate.
+    n_jobs : int, default=1
+        The number of threads used to find the neighbours of the training series.
+
+    Returns
+    -------
+    accuracies : 1D np.ndarray of shape (len(windows),)
+        The leave-one-out accuracy of each window.
+
+    References
+    ----------
+    .. [1] Tan C.W., Herrmann M., Webb G.I.: Ultra fast warping window optimization
+    for Dynamic Time Warping. IEEE International Conference on Data Mining, 2021
+    """
+    X = np.asarray(X, dtype=np.float64)
+    series_length = X.shape[2]
+    radii = np.array(
+        [_sakoe_chiba_radius(series_length, series_length, w) for w in windows]
+    )
+    radii[(radii < 0) | (radii > series_length)] = series_length
+    unique_radii = np.unique(radii)[::-1].copy()
+
+    upper = np.empty(X.shape)
+    lower = np.empty(X.shape)
+    for i in range(X.shape[0]):
+        upper[i], lower[i] = _keogh_envelope(X[i], unique_radii[0])
+
+    prev_threads = get_num_threads()
+    set_num_threads(min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS))
+    try:
+        closest_idx = _window_search_neighbors_batch(X, upper, lower, unique_radii)
+    finally:
+        set_num_threads(prev_threads)
+
+    _, y = np.unique(y, return_inverse=True)
+    correct = y[closest_idx] == y[:, np.newaxis]
+    accuracies = correct.mean(axis=0)
+    return accuracies[np.searchsorted(-unique_radii, -radii)]
+
+
+@njit(cache=True, fastmath=True)
+def _window_search_neighbors(i, X, upper, lower, radii):
+    """Find the nearest neighbour of X[i] in the other cases of X for each radius.
+
+    Parameters
+    ----------
+    i : int
+        Index of the query series in X.
+    X : np.ndarray of shape (n_instances, n_dimensions, series_length)
+        The training series.
+    upper, lower : np.ndarray of shape (n_instances, n_dimensions, series_length)
+        LB_Keogh envelopes of the training series for the largest radius.
+    radii : np.ndarray of int
+        The window radii in time points, unique and in decreasing order.
+
+    Returns
+    -------
+    closest_idx : np.ndarray of shape (len(radii),)
+        Index of the nearest neighbour for each radius.
+    """
+    x = X[i]
+    n_instances = X.shape[0]
+    n_radii = len(radii)
+    lb_kim = np.empty(n_instances)
+    for j in range(n_instances):
+        lb_kim[j] = _lb_kim(x, X[j])
+    order = np.argsort(lb_kim, kind="mergesort")
+
+    closest_idx = np.full(n_radii, -1, dtype=np.int64)
+    closest_distances = np.full(n_radii, np.inf)
+    for j in order:
+        if j == i:
+            continue
+        # a lower bound for the largest radius is a lower bound for all of them
+        best_so_far = np.max(closest_distances)
+        if lb_kim[j] > best_so_far:
+            break
+        if _lb_keogh(x, upper[j], lower[j], best_so_far) > best_so_far:
+            continue
+        if _lb_keogh(X[j], upper[i], lower[i], best_so_far) > best_so_far:
+            continue
+
+        # the distance for smaller radii can only be larger, so it is abandoned once
+        # it exceeds the nearest neighbour distance of all remaining radii
+        k = 0
+        while k < n_radii:
+            dist, width = _dtw_distance_and_width(
+                x, X[j], radii[k], np.max(closest_distances[k:])
+            )
+            if dist == np.inf:
+                break
+            while k < n_radii and radii[k] >= width:
+                if dist < closest_distances[k] or (
+                    dist == closest_distances[k] and j < closest_idx[k]
+                ):
+                    closest_idx[k] = j
+                    closest_distances[k] = dist
+                k += 1
+    return closest_idx
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _window_search_neighbors_batch(X, upper, lower, radii):
+    """Run _window_search_neighbors for each case in X in parallel."""
+    n_cases = X.shape[0]
+    closest_idx = np.empty((n_cases, len(radii)), dtype=np.int64)
+    for i in prange(n_cases):
+        closest_idx[i] = _window_search_neighbors(i, X, upper, lower, radii)
+    return closest_idx
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 """Tests for KNeighborsTimeSeriesClassifier."""
+import numpy as np
 import pytest
 
 from aeon.classification.distance_based._time_series_neighbors import (
     KNeighborsTimeSeriesClassifier,
+    _cascade_kneighbors,
+    _dtw_window_loocv,
 )
 from aeon.datasets import load_unit_test
+from aeon.distances import dtw_distance, dtw_pairwise_distance
+from aeon.distances._bounding_matrix import _sakoe_chiba_radius
+from aeon.distances._lower_bounding import _keogh_envelope
 
 distance_functions = [
     "euclidean",
@@ -73,3 +79,92 @@ def test_knn_bounding_matrix(distance_key):
         if pred[j] == y_test[j]:
             correct = correct + 1
     assert correct == expected_correct_window[distance_key]
+
+
+@pytest.mark.parametrize("n_neighbors", [1, 3])
+def test_knn_cascade(n_neighbors):
+    """Test the lower bound cascade gives the same predictions as brute force."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    params = {"distance": "dtw", "n_neighbors": n_neighbors, "weights": "distance"}
+    brute = KNeighborsTimeSeriesClassifier(**params).fit(X_train, y_train)
+    cascade = KNeighborsTimeSeriesClassifier(algorithm="cascade", **params)
+    cascade.fit(X_train, y_train)
+    np.testing.assert_array_almost_equal(
+        brute.predict_proba(X_test), cascade.predict_proba(X_test)
+    )
+
+
+@pytest.mark.parametrize("window", [0.0, 0.1, 0.5])
+def test_cascade_kneighbors(window):
+    """Test the lower bound cascade finds the exact dtw neighbours."""
+    X_train, _ = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    radius = _sakoe_chiba_radius(X_train.shape[2], X_train.shape[2], window)
+    upper = np.empty(X_train.shape)
+    lower = np.empty(X_train.shape)
+    for i in range(X_train.shape[0]):
+        upper[i], lower[i] = _keogh_envelope(X_train[i], radius)
+    for x in X_test:
+        distances = np.array([dtw_distance(x, y, window=window) for y in X_train])
+        expected = np.argsort(distances, kind="stable")[:3]
+        idx, dists = _cascade_kneighbors(x, X_train, upper, lower, 3, window, radius)
+        np.testing.assert_array_equal(idx, expected)
+        np.testing.assert_array_almost_equal(dists, distances[expected])
+
+
+def test_dtw_window_loocv():
+    """Test the window search gives the leave-one-out accuracy of each window."""
+    X_train, y_train = load_unit_test(split="train")
+    X_train = X_train + np.random.RandomState(0).normal(scale=0.5, size=X_train.shape)
+    windows = [0.0, 0.05, 0.1, 0.2, 0.5, 0.99, 1.0]
+    accuracies = _dtw_window_loocv(X_train, y_train, windows)
+
+    for window, accuracy in zip(windows, accuracies):
+        distances = dtw_pairwise_distance(X_train, window=window)
+        np.fill_diagonal(distances, np.inf)
+        expected = np.mean(y_train[np.argmin(distances, axis=1)] == y_train)
+        assert accuracy == expected
+
+
+def test_knn_cascade_invalid_distance():
+    """Test the cascade raises an error for distances other than dtw."""
+    X_train, y_train = load_unit_test(split="train")
+    knn = KNeighborsTimeSeriesClassifier(distance="msm", algorithm="cascade")
+    with pytest.raises(ValueError, match="only available for the dtw distance"):
+        knn.fit(X_train, y_train)
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "cascade"])
+def test_knn_too_many_neighbors(algorithm):
+    """Test both algorithms use all training cases or raise for too many."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    n_train = len(y_train)
+    knn = KNeighborsTimeSeriesClassifier(n_neighbors=n_train, algorithm=algorithm)
+    knn.fit(X_train, y_train)
+    expected = np.mean(y_train[:, None] == knn.classes_, axis=0)
+    np.testing.assert_array_almost_equal(
+        knn.predict_proba(X_test[:2]), np.tile(expected, (2, 1))
+    )
+
+    knn.set_params(n_neighbors=n_train + 1)
+    knn.fit(X_train, y_train)
+    with pytest.raises(ValueError, match="Expected n_neighbors <= n_samples_fit"):
+        knn.predict(X_test)
+
+
+@pytest.mark.parametrize("distance_key", distance_functions)
+def test_knn_n_jobs(distance_key):
+    """Test predictions do not depend on the number of jobs."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    probas = [
+        KNeighborsTimeSeriesClassifier(
+            distance=distance_key, n_neighbors=3, weights="distance", n_jobs=n_jobs
+        )
+        .fit(X_train, y_train)
+        .predict_proba(X_test)
+        for n_jobs in [1, -1]
+    ]
+    np.testing.assert_array_almost_equal(probas[0], probas[1])
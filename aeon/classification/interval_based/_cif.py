@@ -19,9 +19,10 @@ from aeon.base._base import _clone_estimator
 from aeon.classification.base import BaseClassifier
 from aeon.classification.sklearn._continuous_interval_tree import (
     ContinuousIntervalTree,
-    _drcif_feature,
+    _drcif_features,
 )
 from aeon.transformations.panel.catch22 import Catch22
+from aeon.utils.numba.interval_stats import interval_stats_tables
 
 
 class CanonicalIntervalForest(BaseClassifier):
@@ -194,11 +195,13 @@ class CanonicalIntervalForest(BaseClassifier):
         if self._max_interval < self._min_interval:
             self._max_interval = self._min_interval
 
+        tables = interval_stats_tables(X, [0, 1, 2])
         fit = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
             delayed(self._fit_estimator)(
                 X,
                 y,
                 i,
+                tables,
             )
             for i in range(self.n_estimators)
         )
@@ -240,7 +243,7 @@ class CanonicalIntervalForest(BaseClassifier):
         )
         return output
 
-    def _fit_estimator(self, X, y, idx):
+    def _fit_estimator(self, X, y, idx, tables=None):
         c22 = Catch22(outlier_norm=True)
         rs = 255 if self.random_state == 0 else self.random_state
         rs = (
@@ -289,10 +292,7 @@ class CanonicalIntervalForest(BaseClassifier):
                 )
                 intervals[j][0] = intervals[j][1] - length
 
-            for a in range(0, self._att_subsample_size):
-                transformed_x[self._att_subsample_size * j + a] = _drcif_feature(
-                    X, intervals[j], dims[j], atts[a], c22, case_id=j
-                )
+        _drcif_features(X, intervals, dims, atts, c22, transformed_x, tables=tables)
 
         tree = _clone_estimator(self._base_estimator, random_state=rs)
         transformed_x = transformed_x.T
@@ -317,11 +317,7 @@ class CanonicalIntervalForest(BaseClassifier):
                 dtype=np.float32,
             )
 
-            for j in range(0, self._n_intervals):
-                for a in range(0, self._att_subsample_size):
-                    transformed_x[self._att_subsample_size * j + a] = _drcif_feature(
-                        X, intervals[j], dims[j], atts[a], c22, case_id=j
-                    )
+            _drcif_features(X, intervals, dims, atts, c22, transformed_x)
 
             transformed_x = transformed_x.T
             transformed_x.round(8)
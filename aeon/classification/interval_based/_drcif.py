@@ -21,9 +21,10 @@ from aeon.base._base import _clone_estimator
 from aeon.classification.base import BaseClassifier
 from aeon.classification.sklearn._continuous_interval_tree import (
     ContinuousIntervalTree,
-    _drcif_feature,
+    _drcif_features,
 )
 from aeon.transformations.panel.catch22 import Catch22
+from aeon.utils.numba.interval_stats import interval_stats_tables
 from aeon.utils.validation.panel import check_X_y
 
 
@@ -288,6 +289,8 @@ class DrCIF(BaseClassifier):
 
         self.total_intervals_ = sum(self._n_intervals)
 
+        tables = [interval_stats_tables(T, [0, 1, 2]) for T in (X, X_p, X_d)]
+
         if time_limit > 0:
             self._n_estimators = 0
             self.estimators_ = []
@@ -307,6 +310,7 @@ class DrCIF(BaseClassifier):
                         X_d,
                         y,
                         i,
+                        tables,
                     )
                     for i in range(self._threads_to_use)
                 )
@@ -335,6 +339,7 @@ class DrCIF(BaseClassifier):
                     X_d,
                     y,
                     i,
+                    tables,
                 )
                 for i in range(self._n_estimators)
             )
@@ -447,7 +452,7 @@ class DrCIF(BaseClassifier):
 
         return results
 
-    def _fit_estimator(self, X, X_p, X_d, y, idx):
+    def _fit_estimator(self, X, X_p, X_d, y, idx, tables=None):
         c22 = Catch22(outlier_norm=True)
         T = [X, X_p, X_d]
         rs = 255 if self.random_state == 0 else self.random_state
@@ -503,15 +508,21 @@ class DrCIF(BaseClassifier):
                         else self._min_interval[r]
                     )
                     intervals[j][0] = intervals[j][1] - length
-
-                for a in range(0, self._att_subsample_size):
-                    transformed_x[p] = _drcif_feature(
-                        T[r], intervals[j], dims[j], atts[a], c22, case_id=j
-                    )
-                    p += 1
-
                 j += 1
 
+            n = self._n_intervals[r]
+            _drcif_features(
+                T[r],
+                intervals[j - n : j],
+                dims[j - n : j],
+                atts,
+                c22,
+                transformed_x[p : p + n * self._att_subsample_size],
+                tables=None if tables is None else tables[r],
+                case_id_offset=j - n,
+            )
+            p += n * self._att_subsample_size
+
         tree = _clone_estimator(self._base_estimator, random_state=rs)
         transformed_x = transformed_x.T
         transformed_x = transformed_x.round(8)
@@ -550,13 +561,18 @@ class DrCIF(BaseClassifier):
             p = 0
             j = 0
             for r in range(0, len(T)):
-                for _ in range(0, self._n_intervals[r]):
-                    for a in range(0, self._att_subsample_size):
-                        transformed_x[p] = _drcif_feature(
-                            T[r], intervals[j], dims[j], atts[a], c22, case_id=j
-                        )
-                        p += 1
-                    j += 1
+                n = self._n_intervals[r]
+                _drcif_features(
+                    T[r],
+                    intervals[j : j + n],
+                    dims[j : j + n],
+                    atts,
+                    c22,
+                    transformed_x[p : p + n * self._att_subsample_size],
+                    case_id_offset=j,
+                )
+                p += n * self._att_subsample_size
+                j += n
 
             transformed_x = transformed_x.T
             transformed_x.round(8)
@@ -14,7 +14,10 @@ from sklearn.tree import DecisionTreeClassifier
 
 from aeon.classification.base import BaseClassifier
 from aeon.series_as_features.base.estimators.interval_based import BaseTimeSeriesForest
-from aeon.series_as_features.base.estimators.interval_based._tsf import _transform
+from aeon.series_as_features.base.estimators.interval_based._tsf import (
+    _transform,
+    _transform_tables,
+)
 
 
 class TimeSeriesForestClassifier(
@@ -160,9 +163,10 @@ class TimeSeriesForestClassifier(
             Predicted probabilities
         """
         X = X.squeeze(1)
+        tables = _transform_tables(X)
         y_probas = Parallel(n_jobs=self.n_jobs, prefer="threads")(
             delayed(_predict_single_classifier_proba)(
-                X, self.estimators_[i], self.intervals_[i]
+                X, self.estimators_[i], self.intervals_[i], tables
             )
             for i in range(self.n_estimators)
         )
@@ -205,7 +209,7 @@ class TimeSeriesForestClassifier(
             return {"n_estimators": 2}
 
 
-def _predict_single_classifier_proba(X, estimator, intervals):
+def _predict_single_classifier_proba(X, estimator, intervals, tables=None):
     """Find probability estimates for each class for all cases in X."""
-    Xt = _transform(X, intervals)
+    Xt = _transform(X, intervals, tables)
     return estimator.predict_proba(Xt)
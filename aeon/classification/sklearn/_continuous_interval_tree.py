@@ -19,6 +19,10 @@ from sklearn.base import BaseEstimator
 from sklearn.utils import check_random_state
 
 from aeon.exceptions import NotFittedError
+from aeon.utils.numba.interval_stats import (
+    interval_stats_from_tables,
+    interval_stats_tables,
+)
 from aeon.utils.numba.stats import iqr, mean, numba_max, numba_min, slope, std
 
 
@@ -146,7 +150,7 @@ class ContinuousIntervalTree(BaseEstimator):
         y = le.fit_transform(y)
 
         rng = check_random_state(self.random_state)
-        self._root = _TreeNode(random_state=rng)
+        root = _TreeNode(random_state=rng)
 
         thresholds = np.linspace(np.min(X, axis=0), np.max(X, axis=0), self.thresholds)
 
@@ -156,7 +160,7 @@ class ContinuousIntervalTree(BaseEstimator):
 
         entropy = _entropy(distribution, distribution.sum())
 
-        self._root.build_tree(
+        root.build_tree(
             X,
             y,
             thresholds,
@@ -167,6 +171,7 @@ class ContinuousIntervalTree(BaseEstimator):
             self.n_classes_,
             False,
         )
+        self._flatten_tree(root)
 
         self._is_fitted = True
         return self
@@ -225,10 +230,13 @@ class ContinuousIntervalTree(BaseEstimator):
             )
         X = self._validate_data(X=X, reset=False, force_all_finite="allow-nan")
 
-        dists = np.zeros((X.shape[0], self.n_classes_))
-        for i in range(X.shape[0]):
-            dists[i] = self._root.predict_proba(X[i], self.n_classes_)
-        return dists
+        return _predict_proba_nodes(
+            X,
+            self._nodes_att,
+            self._nodes_threshold,
+            self._nodes_children,
+            self._nodes_distribution,
+        )
 
     def _predict_proba_cif(self, X, c22, intervals, dims, atts):
         """Embedded predict proba for the CIF classifier."""
@@ -237,19 +245,10 @@ class ContinuousIntervalTree(BaseEstimator):
                 f"This instance of {self.__class__.__name__} has not "
                 f"been fitted yet; please call `fit` first."
             )
-        n_instances, n_dims, series_length = X.shape
 
-        dists = np.zeros((n_instances, self.n_classes_))
-        for i in range(n_instances):
-            dists[i] = self._root.predict_proba_cif(
-                X[i].reshape((1, n_dims, series_length)),
-                c22,
-                intervals,
-                dims,
-                atts,
-                self.n_classes_,
-            )
-        return dists
+        return self._predict_proba_intervals(
+            [X], c22, [len(intervals)], intervals, dims, atts
+        )
 
     def _predict_proba_drcif(
         self, X, X_p, X_d, c22, n_intervals, intervals, dims, atts
@@ -260,44 +259,106 @@ class ContinuousIntervalTree(BaseEstimator):
                 f"This instance of {self.__class__.__name__} has not "
                 f"been fitted yet; please call `fit` first."
             )
-        n_instances, n_dims, series_length = X.shape
+
+        return self._predict_proba_intervals(
+            [X, X_p, X_d], c22, n_intervals, intervals, dims, atts
+        )
+
+    def _predict_proba_intervals(self, T, c22, n_intervals, intervals, dims, atts):
+        """Route all cases through the tree, extracting interval features lazily.
+
+        Nodes are stored in preorder, so all cases reaching a node are known when it is
+        visited. The feature of a node is only extracted for the cases which reach it,
+        and is stored for cases which reach a node with the same split further down.
+        """
+        n_instances = T[0].shape[0]
+        n_atts = len(atts)
+        rep_ends = np.cumsum(n_intervals) * n_atts
 
         dists = np.zeros((n_instances, self.n_classes_))
-        for i in range(n_instances):
-            r = [
-                X[i].reshape((1, n_dims, series_length)),
-                X_p[i].reshape((1, n_dims, X_p.shape[2])),
-                X_d[i].reshape((1, n_dims, X_d.shape[2])),
-            ]
-            dists[i] = self._root.predict_proba_drcif(
-                r,
-                c22,
-                n_intervals,
-                intervals,
-                dims,
-                atts,
-                self.n_classes_,
-            )
+        node_cases = [None] * len(self._nodes_att)
+        node_cases[0] = np.arange(n_instances)
+        values = {}
+
+        for node, cases in enumerate(node_cases):
+            if cases is None or len(cases) == 0:
+                continue
+
+            split = self._nodes_att[node]
+            if split == -1:
+                dists[cases] = self._nodes_distribution[node]
+                continue
+
+            if split not in values:
+                values[split] = (np.zeros(n_instances), np.zeros(n_instances, bool))
+            split_values, extracted = values[split]
+
+            new_cases = cases[~extracted[cases]]
+            if len(new_cases) > 0:
+                rep = int(np.searchsorted(rep_ends, split, side="right"))
+                interval = int(split / n_atts)
+                value = _drcif_feature(
+                    T[rep][new_cases],
+                    intervals[interval],
+                    dims[interval],
+                    atts[split % n_atts],
+                    c22,
+                )
+                value = value.round(8)
+                split_values[new_cases] = np.nan_to_num(
+                    value, False, posinf=np.nan, neginf=np.nan
+                )
+                extracted[new_cases] = True
+
+            value = split_values[cases]
+            threshold = self._nodes_threshold[node]
+            left = value <= threshold
+            right = value > threshold
+            children = self._nodes_children[node]
+            node_cases[children[0]] = cases[left]
+            node_cases[children[1]] = cases[right]
+            node_cases[children[2]] = cases[~(left | right)]
+
         return dists
 
     def tree_node_splits_and_gain(self):
-        """Recursively find the split and information gain for each tree node."""
-        splits = []
+        """Find the split and information gain for each tree node."""
+        # nodes are stored in preorder, the order of the recursive tree traversal
+        is_split = self._nodes_att > -1
+        return list(self._nodes_att[is_split]), list(self._nodes_gain[is_split])
+
+    def _flatten_tree(self, root):
+        """Store the tree built from root as arrays of its nodes in preorder."""
+        atts = []
+        thresholds = []
         gains = []
+        children = []
+        distributions = []
+
+        def _add_node(node):
+            idx = len(atts)
+            atts.append(node.best_split)
+            thresholds.append(node.best_threshold)
+            gains.append(node.best_gain)
+            children.append([-1, -1, -1])
+            distributions.append(
+                node.leaf_distribution
+                if node.best_split == -1
+                else np.zeros(self.n_classes_)
+            )
 
-        if self._root.best_split > -1:
-            self._find_splits_gain(self._root, splits, gains)
-
-        return splits, gains
+            if node.best_split > -1:
+                for i, child in enumerate(node.children):
+                    children[idx][i] = _add_node(child)
+            return idx
 
-    def _find_splits_gain(self, node, splits, gains):
-        """Recursively find the split and information gain for each tree node."""
-        splits.append(node.best_split)
-        gains.append(node.best_gain)
+        _add_node(root)
 
-        for next_node in node.children:
-            if next_node.best_split > -1:
-                self._find_splits_gain(next_node, splits, gains)
+        self._nodes_att = np.array(atts, dtype=np.int_)
+        self._nodes_threshold = np.array(thresholds, dtype=np.float64)
+        self._nodes_gain = np.array(gains, dtype=np.float64)
+        self._nodes_children = np.array(children, dtype=np.int_)
+        self._nodes_distribution = np.array(distributions, dtype=np.float64)
 
 
 class _TreeNode:
@@ -457,118 +518,6 @@ class _TreeNode:
 
         return self
 
-    def predict_proba(self, X, n_classes):
-        if self.best_split > -1:
-            if X[self.best_split] <= self.best_threshold:
-                return self.children[0].predict_proba(X, n_classes)
-            elif X[self.best_split] > self.best_threshold:
-                return self.children[1].predict_proba(X, n_classes)
-            else:
-                return self.children[2].predict_proba(X, n_classes)
-        else:
-            return self.leaf_distribution
-
-    def predict_proba_cif(self, X, c22, intervals, dims, atts, n_classes):
-        if self.best_split > -1:
-            interval = int(self.best_split / len(atts))
-            att = self.best_split % len(atts)
-            value = _drcif_feature(
-                X, intervals[interval], dims[interval], atts[att], c22
-            )
-            value = value.round(8)
-            value = np.nan_to_num(value, False, posinf=np.nan, neginf=np.nan)
-
-            if value <= self.best_threshold:
-                return self.children[0].predict_proba_cif(
-                    X,
-                    c22,
-                    intervals,
-                    dims,
-                    atts,
-                    n_classes,
-                )
-            elif value > self.best_threshold:
-                return self.children[1].predict_proba_cif(
-                    X,
-                    c22,
-                    intervals,
-                    dims,
-                    atts,
-                    n_classes,
-                )
-            else:
-                return self.children[2].predict_proba_cif(
-                    X,
-                    c22,
-                    intervals,
-                    dims,
-                    atts,
-                    n_classes,
-                )
-        else:
-            return self.leaf_distribution
-
-    def predict_proba_drcif(
-        self,
-        X,
-        c22,
-        n_intervals,
-        intervals,
-        dims,
-        atts,
-        n_classes,
-    ):
-        if self.best_split > -1:
-            rep = -1
-            rep_sum = 0
-            for i in range(len(X)):
-                rep_sum += n_intervals[i] * len(atts)
-                if self.best_split < rep_sum:
-                    rep = i
-                    break
-
-            interval = int(self.best_split / len(atts))
-            att = self.best_split % len(atts)
-
-            value = _drcif_feature(
-                X[rep], intervals[interval], dims[interval], atts[att], c22
-            )
-            value = value.round(8)
-            value = np.nan_to_num(value, False, posinf=np.nan, neginf=np.nan)
-
-            if value <= self.best_threshold:
-                return self.children[0].predict_proba_drcif(
-                    X,
-                    c22,
-                    n_intervals,
-                    intervals,
-                    dims,
-                    atts,
-                    n_classes,
-                )
-            elif value > self.best_threshold:
-                return self.children[1].predict_proba_drcif(
-                    X,
-                    c22,
-                    n_intervals,
-                    intervals,
-                    dims,
-                    atts,
-                    n_classes,
-                )
-            else:
-                return self.children[2].predict_proba_drcif(
-                    X,
-                    c22,
-                    n_intervals,
-                    intervals,
-                    dims,
-                    atts,
-                    n_classes,
-                )
-        else:
-            return self.leaf_distribution
-
     @staticmethod
     @njit(fastmath=True, cache=True)
     def information_gain(X, y, attribute, threshold, parent_entropy, n_classes):
@@ -662,6 +611,23 @@ def _entropy(x, s):
     return e
 
 
+@njit(cache=True)
+def _predict_proba_nodes(X, atts, thresholds, children, distributions):
+    dists = np.zeros((X.shape[0], distributions.shape[1]))
+    for i in range(X.shape[0]):
+        node = 0
+        while atts[node] > -1:
+            value = X[i, atts[node]]
+            if value <= thresholds[node]:
+                node = children[node, 0]
+            elif value > thresholds[node]:
+                node = children[node, 1]
+            else:
+                node = children[node, 2]
+        dists[i] = distributions[node]
+    return dists
+
+
 def _drcif_feature(X, interval, dim, att, c22, case_id=None):
     if att > 21:
         return _summary_stat(X[:, dim, interval[0] : interval[1]], att)
@@ -671,6 +637,45 @@ def _drcif_feature(X, interval, dim, att, c22, case_id=None):
         )
 
 
+def _drcif_features(
+    X, intervals, dims, atts, c22, transformed_x, tables=None, case_id_offset=0
+):
+    """Write the features of all intervals to the rows of transformed_x.
+
+    Row len(atts) * j + a of transformed_x is set to attribute atts[a] extracted from
+    interval j. The summary statistic attributes are extracted for all intervals in a
+    single pass using the prefix sum tables of X, see interval_stats_tables. These are
+    computed if tables is None.
+    """
+    n_atts = len(atts)
+    for j in range(len(intervals)):
+        for a in range(n_atts):
+            if atts[a] <= 21:
+                transformed_x[n_atts * j + a] = _drcif_feature(
+                    X, intervals[j], dims[j], atts[a], c22, case_id=case_id_offset + j
+                )
+
+    summary = np.flatnonzero(np.asarray(atts) > 21)
+    n_summary = len(summary)
+    if n_summary == 0 or len(intervals) == 0:
+        return
+
+    if tables is None:
+        tables = interval_stats_tables(X, [0, 1, 2])
+
+    intervals = np.asarray(intervals)
+    Xt = interval_stats_from_tables(
+        X,
+        tables,
+        np.repeat(intervals[:, 0], n_summary),
+        np.repeat(intervals[:, 1], n_summary),
+        np.repeat(dims, n_summary),
+        np.tile(np.asarray(atts)[summary] - 22, len(intervals)),
+    )
+    rows = (n_atts * np.arange(len(intervals))[:, None] + summary).ravel()
+    transformed_x[rows] = Xt.T
+
+
 def _summary_stat(X, att):
     if att == 22:
         function = mean
@@ -3,7 +3,11 @@
 import numpy as np
 import pytest
 
+from aeon.classification.interval_based import CanonicalIntervalForest
 from aeon.classification.sklearn import ContinuousIntervalTree
+from aeon.classification.sklearn._continuous_interval_tree import _drcif_feature
+from aeon.datasets import load_unit_test
+from aeon.transformations.panel.catch22 import Catch22
 
 
 def test_nan_values():
@@ -22,3 +26,29 @@ def test_nan_values():
     X[0:3, 0] = np.inf
     with pytest.raises(ValueError):
         clf.fit(X, y)
+
+
+def test_predict_proba_cif_matches_features():
+    """Test the embedded CIF predict matches predicting on extracted features."""
+    X, y = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+
+    cif = CanonicalIntervalForest(n_estimators=2, n_intervals=3, random_state=0)
+    cif.fit(X, y)
+    c22 = Catch22(outlier_norm=True)
+
+    for i, tree in enumerate(cif.estimators_):
+        intervals, dims, atts = cif.intervals_[i], cif.dims_[i], cif.atts_[i]
+
+        features = np.zeros((X_test.shape[0], len(intervals) * len(atts)))
+        for j in range(len(intervals)):
+            for a in range(len(atts)):
+                features[:, len(atts) * j + a] = _drcif_feature(
+                    X_test, intervals[j], dims[j], atts[a], c22
+                )
+        features = np.nan_to_num(features.round(8), False, posinf=np.nan, neginf=np.nan)
+
+        np.testing.assert_array_equal(
+            tree._predict_proba_cif(X_test, c22, intervals, dims, atts),
+            tree.predict_proba(features),
+        )
@@ -2,14 +2,14 @@
 """Time series kmeans."""
 __author__ = ["chrisholder", "TonyBagnall"]
 
-from typing import Callable, Union
+from typing import Callable, Tuple, Union
 
 import numpy as np
 from numpy.random import RandomState
 
 from aeon.clustering.metrics.averaging import _resolve_average_callable
 from aeon.clustering.partitioning import TimeSeriesLloyds
-from aeon.distances import pairwise_distance
+from aeon.distances import distance_factory, pairwise_distance
 
 
 class TimeSeriesKMeans(TimeSeriesLloyds):
@@ -156,17 +156,9 @@ class TimeSeriesKMeans(TimeSeriesLloyds):
             curr_indexes = np.where(assignment_indexes == i)[0]
 
             if self.averaging_method == "dba":
-                distance_matrix = np.zeros((len(curr_indexes), len(curr_indexes)))
-                for j in range(len(curr_indexes)):
-                    curr_j = curr_indexes[j]
-                    for k in range(len(curr_indexes)):
-                        distance_matrix[j, k] = self._precomputed_pairwise[
-                            curr_j, curr_indexes[k]
-                        ]
-
                 self._average_params[
                     "precomputed_medoids_pairwise_distance"
-                ] = distance_matrix
+                ] = self._precomputed_pairwise[np.ix_(curr_indexes, curr_indexes)]
 
             result = self._averaging_method(X[curr_indexes], **self._average_params)
             if result.shape[0] > 0:
@@ -199,3 +191,375 @@ class TimeSeriesKMeans(TimeSeriesLloyds):
             "max_iter": 10,
             "random_state": 0,
         }
+
+
+class TimeSeriesMiniBatchKMeans(TimeSeriesKMeans):
+    """Time series mini-batch K-means clustering algorithm.
+
+    Each iteration assigns a random batch of series to their closest centers and
+    moves each center towards the average of its members in the batch, with a step
+    size of the number of members over the number of series assigned to the center
+    so far [1]_. Only batch_size series are read per iteration, so X can be a memory
+    mapped array, and partial_fit can be used to cluster data that arrives in
+    chunks, for example from a generator.
+
+    Parameters
+    ----------
+    n_clusters: int, defaults = 8
+        The number of clusters to form as well as the number of
+        centroids to generate.
+    init_algorithm: str, defaults = 'random'
+        Method for initializing cluster centers. Any of the following are valid:
+        ['kmeans++', 'random', 'forgy']. The centers are initialised from a random
+        sample of 3 * batch_size series.
+    metric: str or Callable, defaults = 'dtw'
+        Distance metric to compute similarity between time series. Any of the following
+        are valid: ['dtw', 'euclidean', 'erp', 'edr', 'lcss', 'squared', 'ddtw', 'wdtw',
+        'wddtw'].
+    n_init: int, defaults = 3
+        Number of times the algorithm will be run with different centroid seeds. The
+        final result is the run with the lowest inertia on a random validation batch.
+    max_iter: int, defaults = 100
+        Maximum number of batches for a single run.
+    tol: float, defaults = 0.0
+        A run stops when the sum of the squared changes of the centers over one batch
+        is below tol. The default of 0.0 runs all max_iter batches.
+    verbose: bool, defaults = False
+        Verbosity mode.
+    random_state: int or np.random.RandomState instance or None, defaults = None
+        Determines random number generation for centroid initialization and batches.
+    averaging_method: str or Callable, defaults = 'mean'
+        Averaging method to compute the average of the members of a cluster in a
+        batch. Any of the following strings are valid: ['mean', 'dba']. If a Callable
+        is provided must take the form Callable[[np.ndarray], np.ndarray].
+    distance_params: dict, defaults = None = no parameters
+        Dictonary containing kwargs for the distance metric being used.
+    average_params: dict, defaults = None = no parameters
+        Dictonary containing kwargs for averaging_method.
+    batch_size: int, defaults = 1024
+        Number of series in each batch.
+
+    Attributes
+    ----------
+    cluster_centers_: np.ndarray (3d array of shape (n_clusters, n_dimensions,
+        series_length))
+        Time series that represent each of the cluster centers.
+    labels_: np.ndarray (1d array of shape (n_instance,))
+        Labels that is the index each time series belongs to. After partial_fit
+        these are the labels of the last batch.
+    inertia_: float
+        Sum of distances of samples to their closest cluster center. After
+        partial_fit this is the inertia of the last batch.
+    n_iter_: int
+        Number of batches run.
+
+    References
+    ----------
+    .. [1] Sculley D.: Web-scale k-means clustering. Proceedings of the 19th
+    International Conference on World Wide Web, 1177-1178, 2010
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 8,
+        init_algorithm: Union[str, Callable] = "random",
+        metric: Union[str, Callable] = "dtw",
+        n_init: int = 3,
+        max_iter: int = 100,
+        tol: float = 0.0,
+        verbose: bool = False,
+        random_state: Union[int, RandomState] = None,
+        averaging_method: Union[str, Callable[[np.ndarray], np.ndarray]] = "mean",
+        distance_params: dict = None,
+        average_params: dict = None,
+        batch_size: int = 1024,
+    ):
+        self.batch_size = batch_size
+        self._counts = None
+
+        super(TimeSeriesMiniBatchKMeans, self).__init__(
+            n_clusters,
+            init_algorithm,
+            metric,
+            n_init,
+            max_iter,
+            tol,
+            verbose,
+            random_state,
+            averaging_method,
+            distance_params,
+            average_params,
+        )
+
+    def _check_params(self, X: np.ndarray) -> None:
+        super(TimeSeriesMiniBatchKMeans, self)._check_params(X)
+        # The batches are already differentiated for ddtw and wddtw, so they are
+        # compared with dtw and wdtw.
+        self._batch_metric = self.metric
+        if self.metric == "ddtw":
+            self._batch_metric = "dtw"
+        elif self.metric == "wddtw":
+            self._batch_metric = "wdtw"
+        self._distance_metric = distance_factory(
+            X[0], X[1], metric=self._batch_metric, **self._distance_params
+        )
+
+    def partial_fit(self, X: np.ndarray, y=None):
+        """Update the cluster centers with a single batch of time series.
+
+        On the first call the centers are initialised from X, so it must contain
+        at least n_clusters series.
+
+        Parameters
+        ----------
+        X : np.ndarray (2d or 3d array of shape (n_instances, series_length) or shape
+            (n_instances, n_dimensions, series_length))
+            Batch of time series instances.
+        y: ignored, exists for API consistency reasons.
+
+        Returns
+        -------
+        self:
+            Fitted estimator.
+        """
+        X = self._check_clusterer_input(X)
+        if not self._is_fitted:
+            self._check_params(X)
+            X = self._get_batch(X, slice(None))
+            self.cluster_centers_ = self._init_algorithm(
+                X,
+                self.n_clusters,
+                self._random_state,
+                distance_metric=self._distance_metric,
+            ).astype(float)
+            self._counts = np.zeros(self.n_clusters)
+            self.n_iter_ = 0
+        else:
+            X = self._get_batch(X, slice(None))
+
+        self.labels_, self.inertia_, _ = self._mini_batch_step(
+            X, self.cluster_centers_, self._counts
+        )
+        self.n_iter_ += 1
+        self._is_fitted = True
+        return self
+
+    def _fit(self, X: np.ndarray, y=None) -> np.ndarray:
+        """Fit time series clusterer to training data.
+
+        Parameters
+        ----------
+        X : np.ndarray (3d array of shape (n_instances, n_dimensions, series_length))
+            Training time series instances to cluster.
+        y: ignored, exists for API consistency reasons.
+
+        Returns
+        -------
+        self:
+            Fitted estimator.
+        """
+        self._check_params(X)
+        n_instances = X.shape[0]
+        batch_size = min(self.batch_size, n_instances)
+        validation_batch = self._get_batch(
+            X, self._sample_indexes(n_instances, batch_size)
+        )
+
+        best_inertia = np.inf
+        for _ in range(self.n_init):
+            centers, counts, n_iters = self._fit_one_init_mini_batch(X, batch_size)
+            inertia = self._assign_clusters(validation_batch, centers)[1]
+            if inertia < best_inertia:
+                best_inertia = inertia
+                self.cluster_centers_ = centers
+                self._counts = counts
+                self.n_iter_ = n_iters
+
+        # Assign all series in chunks so X is never loaded at once.
+        labels = []
+        self.inertia_ = 0.0
+        for start in range(0, n_instances, batch_size):
+            batch = self._get_batch(X, slice(start, start + batch_size))
+            batch_labels, batch_inertia = self._assign_clusters(
+                batch, self.cluster_centers_
+            )
+            labels.append(batch_labels)
+            self.inertia_ += batch_inertia
+        self.labels_ = np.concatenate(labels)
+        return self
+
+    def _predict(self, X: np.ndarray, y=None) -> np.ndarray:
+        """Predict the closest cluster each sample in X belongs to.
+
+        Parameters
+        ----------
+        X : np.ndarray (3d array of shape (n_instances, n_dimensions, series_length))
+            Time series instances to predict their cluster indexes.
+        y: ignored, exists for API consistency reasons.
+
+        Returns
+        -------
+        np.ndarray (1d array of shape (n_instances,))
+            Index of the cluster each time series in X belongs to.
+        """
+        batch_size = max(self.batch_size, 1)
+        return np.concatenate(
+            [
+                super(TimeSeriesMiniBatchKMeans, self)._predict(
+                    X[start : start + batch_size]
+                )
+                for start in range(0, X.shape[0], batch_size)
+            ]
+        )
+
+    def _assign_clusters(
+        self, X: np.ndarray, cluster_centres: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """Assign each series of a batch to its closest cluster.
+
+        Parameters
+        ----------
+        X : np.ndarray (3d array of shape (n_instances, n_dimensions, series_length))
+            Batch of time series instances, differentiated for ddtw and wddtw.
+        cluster_centres: np.ndarray (3d array of shape
+                                        (n_clusters, n_dimensions, series_length))
+            Cluster centers to assign to.
+
+        Returns
+        -------
+        np.ndarray (1d array of shape (n_instance,))
+            Array of indexes of each instance closest cluster.
+        float
+            Sum of distances of the series to their closest center.
+        """
+        pairwise = pairwise_distance(
+            X, cluster_centres, metric=self._batch_metric, **self._distance_params
+        )
+        return pairwise.argmin(axis=1), pairwise.min(axis=1).sum()
+
+    def _fit_one_init_mini_batch(
+        self, X: np.ndarray, batch_size: int
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Perform one run of mini-batch k-means.
+
+        Parameters
+        ----------
+        X : np.ndarray (3d array of shape (n_instances, n_dimensions, series_length))
+            Training time series instances to cluster.
+        batch_size: int
+            Number of series in each batch.
+
+        Returns
+        -------
+        np.ndarray (3d array of shape (n_clusters, n_dimensions, series_length))
+            Time series that represent each of the cluster centres.
+        np.ndarray (1d array of shape (n_clusters,))
+            Number of series assigned to each center over all batches.
+        int
+            Number of batches run.
+        """
+        n_instances = X.shape[0]
+        init_batch = self._get_batch(
+            X, self._sample_indexes(n_instances, min(3 * batch_size, n_instances))
+        )
+        centers = self._init_algorithm(
+            init_batch,
+            self.n_clusters,
+            self._random_state,
+            distance_metric=self._distance_metric,
+        ).astype(float)
+        counts = np.zeros(self.n_clusters)
+        for i in range(self.max_iter):
+            batch = self._get_batch(X, self._sample_indexes(n_instances, batch_size))
+            _, inertia, shift = self._mini_batch_step(batch, centers, counts)
+            if self.verbose is True:
+                print(f"Batch {i}, inertia {inertia}.")  # noqa: T001, T201
+            if shift < self.tol:
+                break
+        return centers, counts, i + 1
+
+    def _mini_batch_step(
+        self, X: np.ndarray, centers: np.ndarray, counts: np.ndarray
+    ) -> Tuple[np.ndarray, float, float]:
+        """Move the centers towards the average of their members in a batch.
+
+        centers and counts are updated in place.
+
+        Parameters
+        ----------
+        X : np.ndarray (3d array of shape (n_instances, n_dimensions, series_length))
+            Batch of time series instances.
+        centers: np.ndarray (3d array of shape (n_clusters, n_dimensions,
+            series_length))
+            Cluster centers.
+        counts: np.ndarray (1d array of shape (n_clusters,))
+            Number of series assigned to each center in previous batches.
+
+        Returns
+        -------
+        np.ndarray (1d array of shape (n_instances,))
+            Index of the closest center of each series in the batch.
+        float
+            Sum of distances of the batch to their closest center.
+        float
+            Sum of the squared changes of the centers.
+        """
+        labels, inertia = self._assign_clusters(X, centers)
+        # The medoids of a batch are found from its own distances.
+        average_params = {
+            key: value
+            for key, value in self._average_params.items()
+            if key != "precomputed_medoids_pairwise_distance"
+        }
+        shift = 0.0
+        for i in range(self.n_clusters):
+            members = X[labels == i]
+            if members.shape[0] == 0:
+                continue
+            counts[i] += members.shape[0]
+            average = self._averaging_method(members, **average_params)
+            step = (members.shape[0] / counts[i]) * (
+                average.reshape(centers[i].shape) - centers[i]
+            )
+            centers[i] += step
+            shift += np.sum(step**2)
+        return labels, inertia, shift
+
+    def _get_batch(self, X: np.ndarray, indexes) -> np.ndarray:
+        """Read a batch of series from X, as derivatives for ddtw and wddtw."""
+        batch = np.asarray(X[indexes], dtype=float)
+        if self.metric == "ddtw" or self.metric == "wddtw":
+            batch = self._derivative_transform(batch)
+        return batch
+
+    def _sample_indexes(self, n_instances: int, size: int) -> np.ndarray:
+        """Sample sorted indexes, so memory mapped arrays are read in order."""
+        return np.sort(self._random_state.choice(n_instances, size, replace=False))
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+
+        Returns
+        -------
+        params : dict or list of dict, default = {}
+            Parameters to create testing instances of the class
+            Each dict are parameters to construct an "interesting" test instance, i.e.,
+            `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
+            `create_test_instance` uses the first (or only) dictionary in `params`
+        """
+        return {
+            "n_clusters": 2,
+            "metric": "euclidean",
+            "n_init": 1,
+            "max_iter": 5,
+            "batch_size": 5,
+            "random_state": 0,
+        }
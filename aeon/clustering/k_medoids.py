@@ -2,7 +2,8 @@
 """Time series kmedoids."""
 __author__ = ["chrisholder", "TonyBagnall"]
 
-from typing import Callable, Union
+from functools import lru_cache, partial
+from typing import Callable, Tuple, Union
 
 import numpy as np
 from numpy.random import RandomState
@@ -11,10 +12,22 @@ from aeon.clustering.metrics.medoids import medoids
 from aeon.clustering.partitioning import TimeSeriesLloyds
 from aeon.distances import pairwise_distance
 
+METHODS_SUPPORTED = ["alternate", "pam", "clara"]
+
 
 class TimeSeriesKMedoids(TimeSeriesLloyds):
     """Time series K-medoids implementation.
 
+    Three algorithms are available. "alternate" is the Lloyd style algorithm that
+    alternates between assigning series to the closest medoid and choosing the
+    medoid of each cluster, using a precomputed n x n distance matrix. "pam" is the
+    FasterPAM swap algorithm [1]_, which computes the distances to a candidate
+    medoid when they are needed and keeps the most recently used ones in a cache
+    of ``distance_cache_size`` columns, so memory grows linearly with the number of
+    series. "clara" [2]_ runs FasterPAM on a random sample of ``sample_size``
+    series for each of the ``n_init`` runs and assigns all series to the medoids
+    of the sample.
+
     Parameters
     ----------
     n_clusters: int, defaults = 8
@@ -44,6 +57,16 @@ class TimeSeriesKMedoids(TimeSeriesLloyds):
         Determines random number generation for centroid initialization.
     distance_params: dict, defaults = None
         Dictonary containing kwargs for the distance metric being used.
+    method: str, defaults = 'alternate'
+        Algorithm used to find the medoids, one of ['alternate', 'pam', 'clara'].
+        For 'pam' and 'clara' the initial medoids are chosen at random and
+        init_algorithm is not used, and max_iter is the maximum number of passes
+        over all candidate medoids.
+    sample_size: int, defaults = None
+        Number of series sampled in each run of 'clara'. If None, 40 + 2 *
+        n_clusters series are sampled.
+    distance_cache_size: int, defaults = 100
+        Maximum number of columns of the distance matrix kept in memory by 'pam'.
 
     Attributes
     ----------
@@ -58,6 +81,14 @@ class TimeSeriesKMedoids(TimeSeriesLloyds):
         the sample weights if provided.
     n_iter_: int
         Number of iterations run.
+
+    References
+    ----------
+    .. [1] Schubert E. and Rousseeuw P.: Fast and eager k-medoids clustering: O(k)
+    runtime improvement of the PAM, CLARA, and CLARANS algorithms. Information
+    Systems 101, 2021
+    .. [2] Kaufman L. and Rousseeuw P.: Clustering large data sets. Pattern
+    Recognition in Practice, 425-437, 1986
     """
 
     def __init__(
@@ -71,7 +102,14 @@ class TimeSeriesKMedoids(TimeSeriesLloyds):
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
         distance_params: dict = None,
+        method: str = "alternate",
+        sample_size: int = None,
+        distance_cache_size: int = 100,
     ):
+        self.method = method
+        self.sample_size = sample_size
+        self.distance_cache_size = distance_cache_size
+
         self._precomputed_pairwise = None
 
         super(TimeSeriesKMedoids, self).__init__(
@@ -102,11 +140,80 @@ class TimeSeriesKMedoids(TimeSeriesLloyds):
             Fitted estimator.
         """
         self._check_params(X)
-        self._precomputed_pairwise = pairwise_distance(
-            X, metric=self.metric, **self._distance_params
-        )
+        if self.method not in METHODS_SUPPORTED:
+            raise ValueError(
+                f"The value provided for method: {self.method} is invalid. The "
+                f"following are a list of valid methods: {METHODS_SUPPORTED}"
+            )
+        if self.method == "alternate":
+            self._precomputed_pairwise = pairwise_distance(
+                X, metric=self.metric, **self._distance_params
+            )
         return super()._fit(X, y)
 
+    def _fit_one_init(self, X) -> Tuple[np.ndarray, np.ndarray, float, int]:
+        """Perform one run of k-medoids.
+
+        Parameters
+        ----------
+        X : np.ndarray (3d array of shape (n_instances, n_dimensions, series_length))
+            Training time series instances to cluster.
+
+        Returns
+        -------
+        np.ndarray (1d array of shape (n_instance,))
+            Labels that is the index each time series belongs to.
+        np.ndarray (3d array of shape (n_clusters, n_dimensions, series_length))
+            Time series that are the medoids of each cluster.
+        float
+            Sum of distances of samples to their closest medoid.
+        int
+            Number of iterations run.
+        """
+        if self.method == "alternate":
+            return super()._fit_one_init(X)
+
+        n_instances = X.shape[0]
+        if self.method == "pam":
+            column = lru_cache(maxsize=self.distance_cache_size)(
+                partial(self._distance_column, X, X)
+            )
+            medoid_indexes = self._random_state.choice(
+                n_instances, self.n_clusters, replace=False
+            )
+            medoid_indexes, labels, distances, n_iters = _faster_pam(
+                column, n_instances, medoid_indexes, self.max_iter
+            )
+            return labels, X[medoid_indexes], distances.sum(), n_iters
+
+        sample_size = self.sample_size
+        if sample_size is None:
+            sample_size = 40 + 2 * self.n_clusters
+        sample = self._random_state.choice(
+            n_instances, min(sample_size, n_instances), replace=False
+        )
+        sample_pairwise = pairwise_distance(
+            X[sample], metric=self.metric, **self._distance_params
+        )
+        medoid_indexes = self._random_state.choice(
+            sample.shape[0], self.n_clusters, replace=False
+        )
+        medoid_indexes, _, _, n_iters = _faster_pam(
+            lambda c: sample_pairwise[:, c],
+            sample.shape[0],
+            medoid_indexes,
+            self.max_iter,
+        )
+        centres = X[sample[medoid_indexes]]
+        labels, inertia = self._assign_clusters(X, centres)
+        return labels, centres, inertia, n_iters
+
+    def _distance_column(self, X: np.ndarray, Y: np.ndarray, index: int) -> np.ndarray:
+        """Compute the distances between each series in X and Y[index]."""
+        return pairwise_distance(
+            X, Y[index : index + 1], metric=self.metric, **self._distance_params
+        )[:, 0]
+
     def _compute_new_cluster_centers(
         self, X: np.ndarray, assignment_indexes: np.ndarray
     ) -> np.ndarray:
@@ -127,13 +234,9 @@ class TimeSeriesKMedoids(TimeSeriesLloyds):
         new_centers = np.zeros((self.n_clusters, X.shape[1], X.shape[2]))
         for i in range(self.n_clusters):
             curr_indexes = np.where(assignment_indexes == i)[0]
-            distance_matrix = np.zeros((len(curr_indexes), len(curr_indexes)))
-            for j in range(len(curr_indexes)):
-                curr_j = curr_indexes[j]
-                for k in range(len(curr_indexes)):
-                    distance_matrix[j, k] = self._precomputed_pairwise[
-                        curr_j, curr_indexes[k]
-                    ]
+            distance_matrix = self._precomputed_pairwise[
+                np.ix_(curr_indexes, curr_indexes)
+            ]
             result = medoids(
                 X[curr_indexes], precomputed_pairwise_distance=distance_matrix
             )
@@ -170,3 +273,108 @@ class TimeSeriesKMedoids(TimeSeriesLloyds):
             "verbose": False,
             "random_state": 1,
         }
+
+
+def _faster_pam(
+    column: Callable[[int], np.ndarray],
+    n_instances: int,
+    medoid_indexes: np.ndarray,
+    max_iter: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Improve a set of medoids with the eager FasterPAM swap algorithm.
+
+    Each instance is considered in turn as a replacement for the medoid whose swap
+    reduces the total deviation the most, and the swap is made immediately if it
+    reduces it at all. Only the distances from the candidate to all instances are
+    needed to evaluate a swap with any of the medoids.
+
+    Parameters
+    ----------
+    column: Callable[[int], np.ndarray]
+        Function that returns the distances between each instance and the instance
+        at the given index.
+    n_instances: int
+        Number of instances.
+    medoid_indexes: np.ndarray (1d array of shape (n_clusters,))
+        Indexes of the initial medoids.
+    max_iter: int
+        Maximum number of passes over all instances.
+
+    Returns
+    -------
+    np.ndarray (1d array of shape (n_clusters,))
+        Indexes of the medoids.
+    np.ndarray (1d array of shape (n_instances,))
+        Index of the closest medoid of each instance.
+    np.ndarray (1d array of shape (n_instances,))
+        Distance of each instance to its closest medoid.
+    int
+        Number of passes run.
+    """
+    medoid_indexes = np.array(medoid_indexes)
+    n_clusters = medoid_indexes.shape[0]
+    medoid_distances = np.stack([column(m) for m in medoid_indexes], axis=1)
+    nearest, dnearest, dsecond = _nearest_medoids(medoid_distances)
+
+    n_iters = 0
+    last_swap = -1
+    candidate = 0
+    converged = False
+    while n_iters < max_iter and not converged:
+        n_iters += 1
+        for _ in range(n_instances):
+            if candidate == last_swap:
+                # Every instance has been tried since the last swap.
+                converged = True
+                break
+            if candidate not in medoid_indexes:
+                dc = column(candidate)
+                closer = dc < dnearest
+                if n_clusters == 1:
+                    i = 0
+                    total = np.sum(dc - dnearest)
+                else:
+                    # Change in deviation from removing each medoid, corrected for
+                    # the points that move to the candidate instead of their second
+                    # closest medoid.
+                    delta = np.bincount(
+                        nearest, weights=dsecond - dnearest, minlength=n_clusters
+                    )
+                    delta += np.bincount(
+                        nearest[closer],
+                        weights=dnearest[closer] - dsecond[closer],
+                        minlength=n_clusters,
+                    )
+                    between = ~closer & (dc < dsecond)
+                    delta += np.bincount(
+                        nearest[between],
+                        weights=dc[between] - dsecond[between],
+                        minlength=n_clusters,
+                    )
+                    i = np.argmin(delta)
+                    total = delta[i] + np.sum(dc[closer] - dnearest[closer])
+                if total < 0:
+                    medoid_indexes[i] = candidate
+                    medoid_distances[:, i] = dc
+                    nearest, dnearest, dsecond = _nearest_medoids(medoid_distances)
+                    last_swap = candidate
+            candidate = (candidate + 1) % n_instances
+        if last_swap == -1:
+            converged = True
+
+    return medoid_indexes, nearest, dnearest, n_iters
+
+
+def _nearest_medoids(
+    medoid_distances: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the closest and second closest medoid distance of each instance."""
+    order = np.argsort(medoid_distances, axis=1)
+    nearest = order[:, 0]
+    rows = np.arange(medoid_distances.shape[0])
+    dnearest = medoid_distances[rows, nearest]
+    if medoid_distances.shape[1] > 1:
+        dsecond = medoid_distances[rows, order[:, 1]]
+    else:
+        dsecond = np.full(medoid_distances.shape[0], np.inf)
+    return nearest, dnearest, dsecond
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 __author__ = ["chrisholder"]
 
-from typing import Tuple
+from typing import Tuple, Union
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
+from sklearn.utils import check_random_state
 
 from aeon.clustering.metrics.medoids import medoids
 from aeon.distances import distance_alignment_path_factory
+from aeon.distances._bounding_matrix import _bounding_band, _sakoe_chiba_radius
 from aeon.distances.base import DistanceAlignmentPathCallable
 
 
@@ -19,12 +21,20 @@ def dba(
     medoids_distance_metric: str = "dtw",
     precomputed_medoids_pairwise_distance: np.ndarray = None,
     verbose: bool = False,
+    batch_size: int = None,
+    random_state: Union[int, np.random.RandomState] = None,
     **kwargs,
 ) -> np.ndarray:
     """Compute the dtw barycenter average of time series.
 
     This implements the'petitjean' version (orginal) DBA algorithm [1]_.
 
+    When averaging_distance_metric is 'dtw' the alignment of all series to the
+    center is compiled and run in parallel, and supports the window kwarg. If
+    batch_size is set each iteration only aligns a random batch of series. Each point
+    of the center is then the average of all values aligned to it so far, so the
+    average of a batch is blended into the center weighted by the number of values
+    aligned to each point before, as the centers of MiniBatchKMeans in scikit-learn.
 
     Parameters
     ----------
@@ -45,6 +55,13 @@ def dba(
         Precomputed medoids pairwise.
     verbose: bool, defaults = False
         Boolean that controls the verbosity.
+    batch_size: int, defaults = None
+        Number of series aligned in each iteration. If None all series are used. If
+        set the initial center is the medoid of a random batch, unless
+        precomputed_medoids_pairwise_distance is given, and all max_iters
+        iterations are run.
+    random_state: int or np.random.RandomState instance or None, defaults = None
+        Determines the random batches.
 
     Returns
     -------
@@ -61,19 +78,53 @@ def dba(
     if len(X) <= 1:
         return X
 
+    _random_state = check_random_state(random_state)
+    if batch_size is not None and batch_size >= len(X):
+        batch_size = None
+
     # center = X.mean(axis=0)
-    center = medoids(
-        X,
-        distance_metric=medoids_distance_metric,
-        precomputed_pairwise_distance=precomputed_medoids_pairwise_distance,
-    )
-    path_callable = distance_alignment_path_factory(
-        X[0], X[1], metric=averaging_distance_metric, **kwargs
-    )
+    if batch_size is None or precomputed_medoids_pairwise_distance is not None:
+        center = medoids(
+            X,
+            distance_metric=medoids_distance_metric,
+            precomputed_pairwise_distance=precomputed_medoids_pairwise_distance,
+        )
+    else:
+        center = medoids(
+            X[_random_state.choice(len(X), batch_size, replace=False)],
+            distance_metric=medoids_distance_metric,
+        )
+    if averaging_distance_metric == "dtw":
+        window = kwargs.get("window")
+    else:
+        path_callable = distance_alignment_path_factory(
+            X[0], X[1], metric=averaging_distance_metric, **kwargs
+        )
 
+    # number of values aligned to each point of the center over all batches
+    counts = np.zeros(center.shape[1])
     cost_prev = np.inf
     for i in range(max_iters):
-        center, cost = _dba_update(center, X, path_callable)
+        if batch_size is None:
+            batch = X
+        else:
+            batch = X[_random_state.choice(len(X), batch_size, replace=False)]
+        if averaging_distance_metric == "dtw":
+            batch_center, cost, batch_counts = _dtw_dba_update(center, batch, window)
+        else:
+            batch_center, cost, batch_counts = _dba_update(center, batch, path_callable)
+
+        if batch_size is None:
+            center = batch_center
+        else:
+            counts += batch_counts
+            center = center + (batch_counts / counts) * (batch_center - center)
+
+        if verbose:
+            print(f"[DBA aeon] epoch {i}, cost {cost}")  # noqa: T001, T201
+        if batch_size is not None:
+            # The costs of different batches are not comparable.
+            continue
 
         if abs(cost_prev - cost) < tol:
             break
@@ -81,16 +132,13 @@ def dba(
             break
         else:
             cost_prev = cost
-
-        if verbose:
-            print(f"[DBA aeon] epoch {i}, cost {cost}")  # noqa: T001, T201
     return center
 
 
 @njit(fastmath=True)
 def _dba_update(
     center: np.ndarray, X: np.ndarray, path_callable: DistanceAlignmentPathCallable
-) -> Tuple[np.ndarray, float]:
+) -> Tuple[np.ndarray, float, np.ndarray]:
     """Perform an update iteration for dba.
 
     Parameters
@@ -109,6 +157,10 @@ def _dba_update(
     np.ndarray (2d array of shape (m, p) where m is the number of dimensions and p is
                 the number of time points.)
         The time series that is the computed average series.
+    float
+        Sum of the squared distances between the aligned points, divided by p.
+    np.ndarray (1d array of shape (p,))
+        The number of values aligned to each point of the center.
     """
     X_size, X_dims, X_timepoints = X.shape
     sum = np.zeros((X_timepoints))
@@ -123,4 +175,130 @@ def _dba_update(
             sum[k] += 1
             cost += np.linalg.norm(curr_ts[:, j] - center[:, k]) ** 2
 
-    return alignment / sum, cost / X_timepoints
+    return alignment / sum, cost / X_timepoints, sum
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _dtw_dba_update(
+    center: np.ndarray, X: np.ndarray, window: float
+) -> Tuple[np.ndarray, float, np.ndarray]:
+    """Perform an update iteration for dba with the dtw distance.
+
+    The series are split into chunks that are aligned in parallel. Each chunk reuses
+    a single cost matrix buffer and accumulates the aligned values and counts into
+    its own arrays, which are summed at the end.
+
+    Parameters
+    ----------
+    center: np.ndarray (2d array of shape (m, p) where m is the number of dimensions
+                        and p is the number of time point)
+        Time series that is the current center (or average).
+    X : np.ndarray (3d array of shape (n, m, p) where n is number of instances, m
+                    is the dimensions and p is the timepoints))
+        Time series instances compute average from.
+    window: float
+        The dtw window, or None for no window.
+
+    Returns
+    -------
+    np.ndarray (2d array of shape (m, p) where m is the number of dimensions and p is
+                the number of time points.)
+        The time series that is the computed average series.
+    float
+        Sum of the squared distances between the aligned points, divided by p.
+    np.ndarray (1d array of shape (p,))
+        The number of values aligned to each point of the center.
+    """
+    X_size, X_dims, X_timepoints = X.shape
+    center_timepoints = center.shape[1]
+    # A fixed number of chunks keeps the result independent of the thread count.
+    n_chunks = min(X_size, 64)
+    alignment = np.zeros((n_chunks, X_dims, center_timepoints))
+    sum = np.zeros((n_chunks, center_timepoints))
+    cost = np.zeros(n_chunks)
+    for c in prange(n_chunks):
+        cost_matrix = np.empty((X_timepoints, center_timepoints))
+        for i in range(c, X_size, n_chunks):
+            cost[c] += _dtw_dba_align(
+                X[i], center, window, cost_matrix, alignment[c], sum[c]
+            )
+
+    total_sum = sum[0].copy()
+    total_alignment = alignment[0].copy()
+    for c in range(1, n_chunks):
+        total_sum += sum[c]
+        total_alignment += alignment[c]
+    return total_alignment / total_sum, cost.sum() / X_timepoints, total_sum
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_dba_align(
+    x: np.ndarray,
+    center: np.ndarray,
+    window: float,
+    cost_matrix: np.ndarray,
+    alignment: np.ndarray,
+    sum: np.ndarray,
+) -> float:
+    """Align x to the center and add its values to the alignment sums.
+
+    The dtw cost matrix is written into the cost_matrix buffer and the path is
+    traced back through it with the same tie breaking as
+    ``compute_min_return_path``.
+
+    Returns
+    -------
+    float
+        Sum of the squared distances between the aligned points.
+    """
+    n_channels = x.shape[0]
+    x_size = x.shape[1]
+    y_size = center.shape[1]
+    radius = _sakoe_chiba_radius(x_size, y_size, window)
+    for i in range(x_size):
+        lower, upper = _bounding_band(i, x_size, y_size, radius)
+        cost_matrix[i, :] = np.inf
+        for j in range(lower, upper):
+            squared_dist = 0.0
+            for k in range(n_channels):
+                difference = x[k, i] - center[k, j]
+                squared_dist += difference * difference
+            if i == 0 and j == 0:
+                cost_matrix[i, j] = squared_dist
+                continue
+            best = np.inf
+            if i > 0:
+                best = min(best, cost_matrix[i - 1, j])
+                if j > 0:
+                    best = min(best, cost_matrix[i - 1, j - 1])
+            if j > 0:
+                best = min(best, cost_matrix[i, j - 1])
+            cost_matrix[i, j] = squared_dist + best
+
+    cost = 0.0
+    i = x_size - 1
+    j = y_size - 1
+    while True:
+        for k in range(n_channels):
+            alignment[k, j] += x[k, i]
+            difference = x[k, i] - center[k, j]
+            cost += difference * difference
+        sum[j] += 1
+        if i == 0 and j == 0:
+            break
+        if i == 0:
+            j -= 1
+        elif j == 0:
+            i -= 1
+        else:
+            diagonal = cost_matrix[i - 1, j - 1]
+            up = cost_matrix[i - 1, j]
+            left = cost_matrix[i, j - 1]
+            if diagonal <= up and diagonal <= left:
+                i -= 1
+                j -= 1
+            elif up <= left:
+                i -= 1
+            else:
+                j -= 1
+    return cost
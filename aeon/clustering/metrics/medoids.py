@@ -35,9 +35,4 @@ def medoids(
     if precomputed_pairwise_distance is None:
         precomputed_pairwise_distance = pairwise_distance(X, metric=distance_metric)
 
-    x_size = X.shape[0]
-    distance_matrix = np.zeros((x_size, x_size))
-    for j in range(x_size):
-        for k in range(x_size):
-            distance_matrix[j, k] = precomputed_pairwise_distance[j, k]
-    return X[np.argmin(sum(distance_matrix))]
+    return X[np.argmin(precomputed_pairwise_distance.sum(axis=0))]
@@ -302,10 +302,7 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         """
         self._check_params(X)
         if self.metric == "wddtw" or self.metric == "ddtw":
-            derivative_X = np.zeros((X.shape[0], X.shape[1], X.shape[2] - 2))
-            for i in range(X.shape[0]):
-                derivative_X[i] = average_of_slope(X[i])
-            X = derivative_X
+            X = self._derivative_transform(X)
             if self.metric == "ddtw":
                 self._distance_metric = distance_factory(
                     X[0], X[1], metric="dtw", **self._distance_params
@@ -352,12 +349,17 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
             Index of the cluster each time series in X belongs to.
         """
         if self.metric == "ddtw" or self.metric == "wddtw":
-            derivative_X = np.zeros((X.shape[0], X.shape[1], X.shape[2] - 2))
-            for i in range(X.shape[0]):
-                derivative_X[i] = average_of_slope(X[i])
-            X = derivative_X
+            X = self._derivative_transform(X)
         return self._assign_clusters(X, self.cluster_centers_)[0]
 
+    @staticmethod
+    def _derivative_transform(X: np.ndarray) -> np.ndarray:
+        """Replace each series by its derivative, for the ddtw and wddtw metrics."""
+        derivative_X = np.zeros((X.shape[0], X.shape[1], X.shape[2] - 2))
+        for i in range(X.shape[0]):
+            derivative_X[i] = average_of_slope(X[i])
+        return derivative_X
+
     def _fit_one_init(self, X) -> Tuple[np.ndarray, np.ndarray, float, int]:
         """Perform one pass of kmeans.
 
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 """Tests for DBA."""
 import numpy as np
+import pytest
+from numba import njit
 
 from aeon.clustering.metrics.averaging import dba
+from aeon.clustering.metrics.averaging._dba import _dba_update, _dtw_dba_update
+from aeon.clustering.metrics.medoids import medoids
+from aeon.distances import dtw_alignment_path
 from aeon.distances.tests._utils import create_test_distance_numpy
 
 expected_dba = np.array(
@@ -140,3 +145,52 @@ def test_dba():
     assert isinstance(average_ts, np.ndarray)
     assert average_ts.shape == X_train[0].shape
     assert np.allclose(average_ts, expected_dba)
+
+
+@pytest.mark.parametrize("window", [None, 0.2])
+def test_dtw_dba_update(window):
+    """Test the compiled dtw update matches the update from alignment paths."""
+
+    @njit
+    def path_callable(x, y):
+        return dtw_alignment_path(x, y, window)
+
+    X_train = create_test_distance_numpy(10, 3, 20)
+    center = X_train[0].copy()
+    expected_center, expected_cost, expected_counts = _dba_update(
+        center, X_train, path_callable
+    )
+    center, cost, counts = _dtw_dba_update(center, X_train, window)
+
+    assert np.allclose(center, expected_center)
+    assert np.isclose(cost, expected_cost)
+    assert np.array_equal(counts, expected_counts)
+
+
+def test_dba_batch_size():
+    """Test dba with random batches."""
+    X_train = create_test_distance_numpy(20, 2, 10)
+
+    average_ts = dba(X_train, batch_size=5, random_state=0)
+
+    assert average_ts.shape == X_train[0].shape
+    assert np.array_equal(average_ts, dba(X_train, batch_size=5, random_state=0))
+
+
+def test_dba_batch_size_blends_batches():
+    """Test each batch average is blended into the center weighted by counts."""
+    X_train = create_test_distance_numpy(20, 2, 10)
+
+    rng = np.random.RandomState(0)
+    center = medoids(X_train[rng.choice(20, 5, replace=False)])
+    counts = np.zeros(center.shape[1])
+    for _ in range(3):
+        batch = X_train[rng.choice(20, 5, replace=False)]
+        batch_center, _, batch_counts = _dtw_dba_update(center, batch, None)
+        new_counts = counts + batch_counts
+        center = (center * counts + batch_center * batch_counts) / new_counts
+        counts = new_counts
+
+    average_ts = dba(X_train, max_iters=3, batch_size=5, random_state=0)
+
+    assert np.allclose(average_ts, center)
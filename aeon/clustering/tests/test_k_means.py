@@ -4,8 +4,9 @@ import numpy as np
 import pytest
 from sklearn import metrics
 
-from aeon.clustering.k_means import TimeSeriesKMeans
+from aeon.clustering.k_means import TimeSeriesKMeans, TimeSeriesMiniBatchKMeans
 from aeon.datasets import load_basic_motions
+from aeon.distances import pairwise_distance
 from aeon.utils.validation._dependencies import _check_estimator_deps
 
 expected_results = {
@@ -179,3 +180,101 @@ def test_kmeans_dba():
 
     for val in proba:
         assert np.count_nonzero(val == 1.0) == 1
+
+
+def test_mini_batch_kmeans_mean():
+    """Test mini-batch kmeans on random batches."""
+    X_train, _ = load_basic_motions(split="train")
+
+    kmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=3,
+        metric="euclidean",
+        n_init=2,
+        max_iter=10,
+        batch_size=10,
+        random_state=1,
+    )
+    labels = kmeans.fit_predict(X_train)
+
+    assert labels.shape == (X_train.shape[0],)
+    assert np.array_equal(labels, kmeans.labels_)
+    assert kmeans.cluster_centers_.shape == (3,) + X_train.shape[1:]
+    assert kmeans.n_iter_ == 10
+    pairwise = pairwise_distance(X_train, kmeans.cluster_centers_, "euclidean")
+    assert np.isclose(kmeans.inertia_, pairwise.min(axis=1).sum())
+
+
+@pytest.mark.parametrize("averaging_method", ["mean", "dba"])
+def test_mini_batch_kmeans_partial_fit(averaging_method):
+    """Test partial_fit on chunks from a generator."""
+    X_train, _ = load_basic_motions(split="train")
+
+    def chunks():
+        for start in range(0, X_train.shape[0], 8):
+            yield X_train[start : start + 8]
+
+    kmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=2,
+        metric="dtw",
+        averaging_method=averaging_method,
+        distance_params={"window": 0.2},
+        random_state=1,
+    )
+    for chunk in chunks():
+        kmeans.partial_fit(chunk)
+
+    assert kmeans.n_iter_ == 5
+    assert kmeans._counts.sum() == X_train.shape[0]
+    assert kmeans.labels_.shape == (8,)
+    assert kmeans.predict(X_train).shape == (X_train.shape[0],)
+
+
+def test_mini_batch_kmeans_partial_fit_mean():
+    """Test the centers after partial_fit are the means of all series assigned."""
+    X_train, _ = load_basic_motions(split="train")
+
+    kmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=1, metric="euclidean", init_algorithm="forgy", random_state=1
+    )
+    kmeans.partial_fit(X_train[:20])
+    kmeans.partial_fit(X_train[20:])
+
+    assert np.allclose(kmeans.cluster_centers_[0], X_train.mean(axis=0))
+
+
+@pytest.mark.parametrize("metric, batch_metric", [("ddtw", "dtw"), ("wddtw", "wdtw")])
+def test_mini_batch_kmeans_derivative_metrics(metric, batch_metric):
+    """Test ddtw and wddtw are not applied to the already differentiated batches."""
+    X_train, _ = load_basic_motions(split="train")
+    X_train = X_train[:20]
+
+    kmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=2, metric=metric, batch_size=7, max_iter=3, random_state=1
+    ).fit(X_train)
+
+    # The series are differentiated once and aligned with dtw or wdtw.
+    derivative_X = TimeSeriesKMeans._derivative_transform(X_train)
+    pairwise = pairwise_distance(
+        derivative_X, kmeans.cluster_centers_, metric=batch_metric
+    )
+    assert np.isclose(kmeans.inertia_, pairwise.min(axis=1).sum())
+    assert np.array_equal(kmeans.labels_, pairwise.argmin(axis=1))
+    assert np.array_equal(kmeans.predict(X_train), pairwise.argmin(axis=1))
+
+
+def test_mini_batch_kmeans_memmap(tmp_path):
+    """Test fitting a memory mapped array."""
+    X_train, _ = load_basic_motions(split="train")
+    X_mmap = np.lib.format.open_memmap(
+        tmp_path / "X.npy", mode="w+", dtype=X_train.dtype, shape=X_train.shape
+    )
+    X_mmap[:] = X_train
+    X_mmap.flush()
+    X_mmap = np.load(tmp_path / "X.npy", mmap_mode="r")
+
+    params = {"n_clusters": 2, "metric": "euclidean", "batch_size": 7}
+    kmeans = TimeSeriesMiniBatchKMeans(random_state=0, **params).fit(X_mmap)
+    expected = TimeSeriesMiniBatchKMeans(random_state=0, **params).fit(X_train)
+
+    assert np.array_equal(kmeans.labels_, expected.labels_)
+    assert np.allclose(kmeans.cluster_centers_, expected.cluster_centers_)
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 """Tests for time series k-medoids."""
 import numpy as np
+import pytest
 from sklearn import metrics
 
 from aeon.clustering.k_medoids import TimeSeriesKMedoids
 from aeon.datasets import load_basic_motions
+from aeon.distances import pairwise_distance
 
 expected_results = {
     "medoids": [
@@ -133,3 +135,56 @@ def test_kmedoids():
 
     for val in proba:
         assert np.count_nonzero(val == 1.0) == 1
+
+
+@pytest.mark.parametrize("n_clusters", [1, 3])
+def test_kmedoids_pam(n_clusters):
+    """Test no single swap improves the medoids found by FasterPAM."""
+    X_train, _ = load_basic_motions(split="train")
+    kmedoids = TimeSeriesKMedoids(
+        n_clusters=n_clusters,
+        metric="euclidean",
+        method="pam",
+        n_init=1,
+        random_state=1,
+        distance_cache_size=5,
+    )
+    kmedoids.fit(X_train)
+    pairwise = pairwise_distance(X_train, metric="euclidean")
+    medoid_indexes = [
+        np.where((X_train == centre).all(axis=(1, 2)))[0][0]
+        for centre in kmedoids.cluster_centers_
+    ]
+    deviation = pairwise[:, medoid_indexes].min(axis=1).sum()
+    assert np.isclose(kmedoids.inertia_, deviation)
+    assert np.array_equal(kmedoids.labels_, pairwise[:, medoid_indexes].argmin(axis=1))
+    for i in range(n_clusters):
+        for candidate in range(X_train.shape[0]):
+            swapped = list(medoid_indexes)
+            swapped[i] = candidate
+            assert pairwise[:, swapped].min(axis=1).sum() >= deviation - 1e-8
+
+
+def test_kmedoids_clara():
+    """Test CLARA runs on samples and assigns every series."""
+    X_train, _ = load_basic_motions(split="train")
+    kmedoids = TimeSeriesKMedoids(
+        n_clusters=3,
+        metric="euclidean",
+        method="clara",
+        sample_size=10,
+        n_init=3,
+        random_state=1,
+    )
+    labels = kmedoids.fit_predict(X_train)
+    assert labels.shape == (X_train.shape[0],)
+    assert kmedoids.cluster_centers_.shape == (3,) + X_train.shape[1:]
+    pairwise = pairwise_distance(X_train, kmedoids.cluster_centers_, "euclidean")
+    assert np.isclose(kmedoids.inertia_, pairwise.min(axis=1).sum())
+
+
+def test_kmedoids_invalid_method():
+    """Test an unknown method raises an error."""
+    X_train, _ = load_basic_motions(split="train")
+    with pytest.raises(ValueError, match="method"):
+        TimeSeriesKMedoids(method="fast").fit(X_train)
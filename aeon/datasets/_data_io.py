@@ -23,7 +23,9 @@ __all__ = [
     "write_tabular_transformation_to_arff",
 ]
 
+import hashlib
 import itertools
+import json
 import os
 import shutil
 import tempfile
@@ -51,6 +53,9 @@ from aeon.utils.validation.panel import check_X, check_X_y
 DIRNAME = "data"
 MODULE = os.path.dirname(__file__)
 
+# return types that load_from_tsfile parses into directly, without pandas
+_NUMPY_RETURN_TYPES = ["numpy3D", "numpyflat", "np-list"]
+
 
 # Return appropriate return_type in case an alias was used
 def _alias_datatype_check(return_type):
@@ -142,7 +147,9 @@ def _list_available_datasets(extract_path):
     return datasets
 
 
-def _load_dataset(name, split, return_X_y=True, return_type=None, extract_path=None):
+def _load_dataset(
+    name, split, return_X_y=True, return_type=None, extract_path=None, cache_dir=None
+):
     """Load time series classification datasets (helper function).
 
     Parameters
@@ -165,6 +172,8 @@ def _load_dataset(name, split, return_X_y=True, return_type=None, extract_path=N
     extract_path : optional (default = None)
         Path of the location for the data file. If none, data is written to
         os.path.dirname(__file__)/data/
+    cache_dir : optional (default = None)
+        Directory of an on-disk cache of parsed files, see ``load_from_tsfile``.
 
     Raises
     ------
@@ -214,7 +223,7 @@ def _load_dataset(name, split, return_X_y=True, return_type=None, extract_path=N
                 ) from e
 
     return _load_provided_dataset(
-        name, split, return_X_y, return_type, local_module, local_dirname
+        name, split, return_X_y, return_type, local_module, local_dirname, cache_dir
     )
 
 
@@ -225,6 +234,7 @@ def _load_provided_dataset(
     return_type=None,
     local_module=MODULE,
     local_dirname=DIRNAME,
+    cache_dir=None,
 ):
     """Load baked in time series classification datasets (helper function).
 
@@ -249,6 +259,8 @@ def _load_provided_dataset(
         will not be supported longterm.
     local_module: default = os.path.dirname(__file__),
     local_dirname: default = "data"
+    cache_dir: default = None
+        Directory of an on-disk cache of parsed files, see ``load_from_tsfile``.
 
     Raises
     ------
@@ -265,6 +277,32 @@ def _load_provided_dataset(
     if isinstance(split, str):
         split = split.upper()
 
+    return_type = _alias_datatype_check(return_type)
+    if return_X_y and return_type in _NUMPY_RETURN_TYPES:
+        # Load straight into the requested numpy type.
+        if split in ("TRAIN", "TEST"):
+            splits = [split]
+        elif split is None:
+            splits = ["TRAIN", "TEST"]
+        else:
+            raise ValueError("Invalid `split` value =", split)
+        loaded = [
+            load_from_tsfile(
+                os.path.join(local_module, local_dirname, name, f"{name}_{s}.ts"),
+                return_data_type=return_type,
+                cache_dir=cache_dir,
+            )
+            for s in splits
+        ]
+        if len(loaded) == 1:
+            return loaded[0]
+        (X_train, y_train), (X_test, y_test) = loaded
+        if return_type == "np-list":
+            X = X_train + X_test
+        else:
+            X = np.concatenate([X_train, X_test])
+        return X, np.concatenate([y_train, y_test])
+
     if split in ("TRAIN", "TEST"):
         fname = name + "_" + split + ".ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
@@ -286,7 +324,6 @@ def _load_provided_dataset(
     else:
         raise ValueError("Invalid `split` value =", split)
 
-    return_type = _alias_datatype_check(return_type)
     if return_X_y:
         X = convert(X, from_type="nested_univ", to_type=return_type)
         return X, y
@@ -385,6 +422,7 @@ def load_from_tsfile(
     replace_missing_vals_with="NaN",
     return_y=True,
     return_data_type="nested_univ",
+    cache_dir=None,
 ):
     """Load time series .ts file into X and (optionally) y.
 
@@ -409,6 +447,13 @@ def load_from_tsfile(
         "nested_univ": nested pd.DataFrame, pd.Series in cells, use for unequal
         length series. There other options, see datatypes.SCITYPE_REGISTER, but these
         will not be supported longterm.
+    cache_dir : str, optional, default = None
+        Directory of an on-disk cache of parsed files, used if return_data_type is
+        "numpy3D" or "numpyflat". The first load of a file saves X and y as .npy
+        files in cache_dir, with a .json file of metadata. Later loads of the same
+        file with the same return_data_type, as long as the file is unchanged, read
+        them back instead of parsing the text. X is then a read-only array memory
+        mapped from the cache, so processes loading the same file share its pages.
 
     Returns
     -------
@@ -439,14 +484,45 @@ def load_from_tsfile(
             f"but found {return_data_type}"
         )
 
-    # Initialize flags and variables used when parsing the file
-    X, y = load_from_tsfile_to_dataframe(
-        full_file_path_and_name=full_file_path_and_name,
-        return_separate_X_and_y=True,
-        replace_missing_vals_with=replace_missing_vals_with,
-    )
+    use_cache = cache_dir is not None and return_data_type in ["numpy3D", "numpyflat"]
+    if use_cache:
+        cache_path = _cache_path(
+            cache_dir,
+            full_file_path_and_name,
+            return_data_type,
+            replace_missing_vals_with,
+        )
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            X, y = cached
+            if return_y:
+                return X, y
+            else:
+                return X
+
+    X = None
+    if return_data_type in _NUMPY_RETURN_TYPES:
+        # Parse straight into numpy, without building a pd.Series per series.
+        with open(full_file_path_and_name, "r", encoding="utf-8") as file:
+            meta_data = _read_header(file, full_file_path_and_name)
+            if not meta_data["has_timestamps"]:
+                X, y = _read_data_to_numpy(
+                    file, meta_data, replace_missing_vals_with, full_file_path_and_name
+                )
+        if X is not None:
+            X = _numpy_to_return_type(X, return_data_type)
+
+    if X is None:
+        X, y = load_from_tsfile_to_dataframe(
+            full_file_path_and_name=full_file_path_and_name,
+            return_separate_X_and_y=True,
+            replace_missing_vals_with=replace_missing_vals_with,
+        )
+
+        X = convert(X, from_type="nested_univ", to_type=return_data_type)
 
-    X = convert(X, from_type="nested_univ", to_type=return_data_type)
+    if use_cache:
+        _write_cache(cache_path, full_file_path_and_name, return_data_type, X, y)
 
     if return_y:
         return X, y
@@ -454,6 +530,189 @@ def load_from_tsfile(
         return X
 
 
+def _cache_path(
+    cache_dir, full_file_path_and_name, return_data_type, replace_missing_vals_with
+):
+    """Return the path prefix of the cache files of a .ts file.
+
+    The key includes the modification time and size of the file, so a changed file
+    is parsed again.
+    """
+    stat = os.stat(full_file_path_and_name)
+    key = "|".join(
+        [
+            os.path.abspath(full_file_path_and_name),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            return_data_type,
+            str(replace_missing_vals_with),
+        ]
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(full_file_path_and_name))[0]
+    return os.path.join(cache_dir, f"{name}_{digest}")
+
+
+def _read_cache(cache_path):
+    """Read X memory mapped and y from the cache, None if they are not cached."""
+    # The metadata is written last, so if it exists the arrays are complete.
+    if not os.path.exists(cache_path + ".json"):
+        return None
+    with open(cache_path + ".json", "r", encoding="utf-8") as file:
+        meta_data = json.load(file)
+    X = np.load(cache_path + "_X.npy", mmap_mode="r")
+    y = np.load(cache_path + "_y.npy") if meta_data["has_y"] else None
+    return X, y
+
+
+def _write_cache(cache_path, full_file_path_and_name, return_data_type, X, y):
+    """Write X, y and their metadata to the cache."""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    def _atomic_write(path, write):
+        # Write to a temporary file first so concurrent readers never see a
+        # partially written file.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    _atomic_write(cache_path + "_X.npy", lambda file: np.save(file, X))
+    if y is not None:
+        _atomic_write(cache_path + "_y.npy", lambda file: np.save(file, y))
+    meta_data = {
+        "source": os.path.abspath(full_file_path_and_name),
+        "return_data_type": return_data_type,
+        "shape": list(X.shape),
+        "has_y": y is not None,
+    }
+    _atomic_write(
+        cache_path + ".json",
+        lambda file: file.write(json.dumps(meta_data).encode("utf-8")),
+    )
+
+
+def _read_data_to_numpy(
+    file, meta_data, replace_missing_vals_with, full_file_path_and_name
+):
+    """Read the data section of a .ts file without timestamps into numpy.
+
+    The file is read line by line. While all cases have the same number of channels
+    and series length they are written into a preallocated 3D array that doubles in
+    size when full. Once a case of a different length is read the cases are kept as a
+    list of 2D arrays instead.
+
+    Parameters
+    ----------
+    file : file object
+        The .ts file, positioned after the @data tag.
+    meta_data : dict
+        Meta information returned by ``_read_header``.
+    replace_missing_vals_with : str
+       The value that missing values in the text file should be replaced with prior
+       to parsing.
+    full_file_path_and_name : str
+        The file name, used in error messages.
+
+    Returns
+    -------
+    X : np.ndarray of shape (n_cases, n_channels, series_length) or list of
+        np.ndarray of shape (n_channels, series_length_i)
+        The time series.
+    y : np.ndarray of shape (n_cases,) or None
+        The class labels or target values as strings, None if the file has none.
+    """
+    has_class_labels = meta_data["has_class_labels"]
+    buffer = None
+    X_list = None
+    class_val_list = []
+    n_cases = 0
+    n_channels = None
+    for line_num, line in enumerate(file):
+        line = line.strip().lower()
+        if not line:
+            continue
+        line = line.replace("?", replace_missing_vals_with)
+        dimensions = line.split(":")
+        if has_class_labels:
+            class_val_list.append(dimensions.pop().strip())
+        if n_channels is None:
+            n_channels = len(dimensions)
+        elif len(dimensions) != n_channels:
+            raise IOError(
+                f"inconsistent number of dimensions in file {full_file_path_and_name}."
+                f" Expecting {n_channels} but have read {len(dimensions)} on data "
+                f"line {line_num + 1}"
+            )
+
+        series = [
+            np.array(dimension.split(","), dtype=float)
+            if dimension.strip()
+            else np.empty(0)
+            for dimension in dimensions
+        ]
+        series_length = len(series[0])
+        if any(len(s) != series_length for s in series):
+            raise ValueError(
+                f"the channels of the case on data line {line_num + 1} of file "
+                f"{full_file_path_and_name} have different lengths, which cannot be "
+                f"stored in numpy, use return_data_type='nested_univ'"
+            )
+
+        if X_list is None:
+            if buffer is None:
+                buffer = np.empty((64, n_channels, series_length))
+            if series_length == buffer.shape[2]:
+                if n_cases == buffer.shape[0]:
+                    buffer.resize(
+                        (2 * n_cases, n_channels, series_length), refcheck=False
+                    )
+                for channel in range(n_channels):
+                    buffer[n_cases, channel] = series[channel]
+                n_cases += 1
+                continue
+            # Unequal length, switch to a list of 2D arrays.
+            X_list = [case.copy() for case in buffer[:n_cases]]
+            buffer = None
+        X_list.append(np.stack(series) if series_length else np.empty((n_channels, 0)))
+        n_cases += 1
+
+    if n_cases == 0:
+        raise IOError(f"file {full_file_path_and_name} contained metadata but no data")
+    if X_list is None:
+        buffer.resize((n_cases, n_channels, buffer.shape[2]), refcheck=False)
+        X = buffer
+    else:
+        X = X_list
+    y = np.asarray(class_val_list) if has_class_labels else None
+    return X, y
+
+
+def _numpy_to_return_type(X, return_data_type):
+    """Convert the output of ``_read_data_to_numpy`` to a numpy return type."""
+    if return_data_type == "np-list":
+        return list(X)
+    if isinstance(X, list):
+        raise ValueError(
+            f"return_data_type={return_data_type} requires equal length series, but "
+            f"the series have unequal length, use return_data_type='np-list' or "
+            f"'nested_univ'"
+        )
+    if return_data_type == "numpyflat":
+        if X.shape[1] > 1:
+            raise ValueError(
+                "return_data_type=numpyflat requires univariate series, but the series "
+                "are multivariate, use return_data_type='numpy3D'"
+            )
+        return X[:, 0, :]
+    return X
+
+
 def load_from_tsfile_to_dataframe(
     full_file_path_and_name,
     return_separate_X_and_y=True,
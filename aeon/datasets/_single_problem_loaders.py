@@ -60,7 +60,12 @@ MODULE = os.path.dirname(__file__)
 
 
 def load_UCR_UEA_dataset(
-    name, split=None, return_X_y=True, return_type=None, extract_path=None
+    name,
+    split=None,
+    return_X_y=True,
+    return_type=None,
+    extract_path=None,
+    cache_dir=None,
 ):
     """Load dataset from UCR UEA time series archive.
 
@@ -99,6 +104,11 @@ def load_UCR_UEA_dataset(
         the path to look for the data. If no path is provided, the function
         looks in `aeon/datasets/data/`. If a path is given, it can be absolute,
         e.g. C:/Temp or relative, e.g. Temp or ./Temp.
+    cache_dir : str, optional (default=None)
+        Directory of an on-disk cache of parsed files, used if return_type is
+        "numpy3D" or "numpy2D" and return_X_y is True. Later loads of the same split
+        read X memory mapped from the cache instead of parsing the .ts file, see
+        load_from_tsfile.
 
     Returns
     -------
@@ -116,7 +126,7 @@ def load_UCR_UEA_dataset(
     >>> from aeon.datasets import load_UCR_UEA_dataset
     >>> X, y = load_UCR_UEA_dataset(name="ArrowHead", return_type="numpy3d")
     """
-    return _load_dataset(name, split, return_X_y, return_type, extract_path)
+    return _load_dataset(name, split, return_X_y, return_type, extract_path, cache_dir)
 
 
 def load_gunpoint(split=None, return_X_y=True, return_type="numpy3d"):
@@ -31,7 +31,7 @@ from aeon.datasets._data_io import (
     _convert_tsf_to_hierarchical,
     _load_provided_dataset,
 )
-from aeon.datatypes import check_is_mtype, scitype_to_mtype
+from aeon.datatypes import check_is_mtype, convert, scitype_to_mtype
 
 # using this and not a direct import
 # in order to avoid mtypes that require soft dependencies
@@ -151,6 +151,77 @@ def test_load_from_tsfile():
     assert X.shape == (270, 12) and y.shape == (270,)
 
 
+@pytest.mark.parametrize(
+    "dataset_name", ["UnitTest", "BasicMotions", "PLAID", "JapaneseVowels"]
+)
+@pytest.mark.parametrize("return_type", ["numpy3D", "np-list"])
+def test_load_from_tsfile_to_numpy(dataset_name, return_type):
+    """Test loading straight into numpy matches converting the nested DataFrame."""
+    data_path = f"{MODULE}/data/{dataset_name}/{dataset_name}_TRAIN.ts"
+    X_df, y_df = load_from_tsfile_to_dataframe(data_path)
+    if return_type == "numpy3D" and dataset_name in ["PLAID", "JapaneseVowels"]:
+        with pytest.raises(ValueError, match="requires equal length series"):
+            load_from_tsfile(data_path, return_data_type=return_type)
+        return
+
+    X, y = load_from_tsfile(data_path, return_data_type=return_type)
+    expected = convert(X_df, from_type="nested_univ", to_type=return_type)
+    assert np.array_equal(y, y_df)
+    if return_type == "numpy3D":
+        assert isinstance(X, np.ndarray)
+        np.testing.assert_array_equal(X, expected)
+    else:
+        assert isinstance(X, list) and len(X) == len(expected)
+        for x, x_expected in zip(X, expected):
+            np.testing.assert_array_equal(x, x_expected)
+
+
+def test_load_from_tsfile_to_numpy_missing(tmp_path):
+    """Test missing values, growing the buffer and inconsistent dimensions."""
+    header = "@problemName test\n@timestamps false\n@univariate false\n"
+    header += "@classLabel true a b\n@data\n"
+    lines = [f"{i},?,3:4,5,{i}:a" for i in range(100)]
+    with open(tmp_path / "test.ts", "w") as file:
+        file.write(header + "\n".join(lines))
+    X, y = load_from_tsfile(str(tmp_path / "test.ts"), return_data_type="numpy3D")
+    assert X.shape == (100, 2, 3) and y.shape == (100,)
+    assert np.isnan(X[:, 0, 1]).all()
+    np.testing.assert_array_equal(X[:, 1, 2], np.arange(100))
+
+    with open(tmp_path / "test.ts", "w") as file:
+        file.write(header + "1,2:3,4:a\n1,2:a\n")
+    with pytest.raises(IOError, match="inconsistent number of dimensions"):
+        load_from_tsfile(str(tmp_path / "test.ts"), return_data_type="numpy3D")
+
+
+def test_load_from_tsfile_cache(tmp_path):
+    """Test the second load of a file is read memory mapped from the cache."""
+    data_path = str(tmp_path / "BasicMotions_TRAIN.ts")
+    shutil.copy(f"{MODULE}/data/BasicMotions/BasicMotions_TRAIN.ts", data_path)
+    cache_dir = str(tmp_path / "cache")
+
+    X, y = load_from_tsfile(data_path, return_data_type="numpy3D", cache_dir=cache_dir)
+    assert not isinstance(X, np.memmap)
+    assert len(os.listdir(cache_dir)) == 3
+
+    X2, y2 = load_from_tsfile(
+        data_path, return_data_type="numpy3D", cache_dir=cache_dir
+    )
+    assert isinstance(X2, np.memmap) and not X2.flags.writeable
+    np.testing.assert_array_equal(X, X2)
+    np.testing.assert_array_equal(y, y2)
+
+    # a changed file is parsed again
+    with open(data_path, "a") as file:
+        file.write("\n")
+    os.utime(data_path, ns=(0, 0))
+    X3 = load_from_tsfile(
+        data_path, return_y=False, return_data_type="numpy3D", cache_dir=cache_dir
+    )
+    assert not isinstance(X3, np.memmap)
+    assert len(os.listdir(cache_dir)) == 6
+
+
 def test_load_UCR_UEA_dataset():
     """Tests load_UCR_UEA_dataset correctly loads a baked in data set.
 
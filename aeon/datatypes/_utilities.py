@@ -299,11 +299,15 @@ def get_cutoff(
     # pd-multiindex (Panel) and pd_multiindex_hier (Hierarchical)
     if isinstance(obj, pd.DataFrame) and isinstance(obj.index, pd.MultiIndex):
         idx = obj.index
-        series_idx = [
-            obj.loc[x].index.get_level_values(-1) for x in idx.droplevel(-1).unique()
-        ]
-        cutoffs = [sub_idx(x, ix, return_index) for x in series_idx]
-        return agg(cutoffs)
+        # find the first series with the latest (or earliest) cutoff without
+        # iterating over the series, only that series is sliced from obj
+        inst_codes, instances = pd.factorize(idx.droplevel(-1))
+        rows = pd.Series(np.arange(len(idx))).groupby(inst_codes)
+        rows = rows.min() if reverse_order else rows.max()
+        times = idx.get_level_values(-1)[rows.to_numpy()]
+        series = times.argmin() if reverse_order else times.argmax()
+        series_idx = obj.loc[instances[series]].index.get_level_values(-1)
+        return sub_idx(series_idx, ix, return_index)
 
     # df-list (Panel)
     if isinstance(obj, list):
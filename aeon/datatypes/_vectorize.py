@@ -6,11 +6,15 @@ Contains VectorizedDF class.
 """
 from itertools import product
 
+import numpy as np
 import pandas as pd
 
 from aeon.datatypes._check import check_is_scitype, mtype
 from aeon.datatypes._convert import convert_to
 from aeon.utils.multiindex import flatten_multiindex
+from aeon.utils.validation._dependencies import _check_soft_dependencies
+
+BACKENDS_SUPPORTED = [None, "loky", "threading", "multiprocessing", "dask"]
 
 
 class VectorizedDF:
@@ -467,6 +471,8 @@ class VectorizedDF:
         rowname_default="estimators",
         colname_default="estimators",
         varname_of_self=None,
+        backend=None,
+        backend_params=None,
         **kwargs,
     ):
         """Vectorize application of estimator method, return results DataFrame or list.
@@ -526,6 +532,17 @@ class VectorizedDF:
             used as index name of single column if no column vectorization is performed
         varname_of_self : str, optional, default=None
             if not None, self will be passed as kwarg under name "varname_of_self"
+        backend : str or None, optional, default=None
+            backend used to run `method` on the vectorization slices, one of
+            None - sequential loop in the current process
+            "loky", "threading", "multiprocessing" - `joblib.Parallel` backends
+            "dask" - `dask.compute` on delayed calls, requires `dask` installed
+            with process based backends, entries of `estimator` (if `DataFrame`)
+            are replaced by the copies on which `method` was executed
+        backend_params : dict, optional, default=None
+            additional keyword arguments passed to the backend, i.e., to
+            `joblib.Parallel` for joblib backends, or to `dask.compute` for "dask".
+            For joblib backends, `n_jobs` defaults to -1 if not passed.
         kwargs : will be passed to invoked methods of estimator(s) in `estimator`
 
         Returns
@@ -551,11 +568,7 @@ class VectorizedDF:
         if col_idx is None:
             col_idx = [colname_default]
 
-        if return_type == "pd.DataFrame":
-            est_frame_new = pd.DataFrame(index=row_idx, columns=col_idx)
-        elif return_type == "list":
-            est_frame_new = []
-        else:
+        if return_type not in ["pd.DataFrame", "list"]:
             raise ValueError('return_type must be one of "pd.DataFrame" or "list"')
 
         if varname_of_self is not None and isinstance(varname_of_self, str):
@@ -567,6 +580,9 @@ class VectorizedDF:
 
             return {k: fun(v) for k, v in d.items()}
 
+        # collect estimator and arguments per slice first, so the method calls
+        # are independent of each other and can be dispatched to a backend
+        jobs = []
         for i in range(len(self)):
             row_ind, col_ind = self.get_iloc_indexer(i)
 
@@ -577,17 +593,82 @@ class VectorizedDF:
             if not isinstance(estimator, pd.DataFrame):
                 est_i = estimator
             else:
-                est_i = estimator.iloc[row_ind].iloc[col_ind]
+                est_i = estimator.iloc[row_ind, col_ind]
+
+            jobs.append((est_i, args_i))
+
+        results = _parallelize(
+            _call_method,
+            jobs,
+            method=method,
+            backend=backend,
+            backend_params=backend_params,
+        )
+
+        # process based backends run the method on copies of the estimators,
+        # write those back so state changes are not lost, e.g., for fit_transform
+        if isinstance(estimator, pd.DataFrame) and backend not in [None, "threading"]:
+            for i, (est_i, _) in enumerate(results):
+                row_ind, col_ind = self.get_iloc_indexer(i)
+                estimator.iloc[row_ind, col_ind] = est_i
+
+        est_results = [res for _, res in results]
+
+        if return_type == "list":
+            return est_results
+
+        # assemble the return frame in one pass, slices are in row-major order
+        values = np.empty(len(est_results), dtype="object")
+        for i, est_result in enumerate(est_results):
+            values[i] = est_result
+        values = values.reshape(len(row_idx), len(col_idx))
+        return pd.DataFrame(values, index=row_idx, columns=col_idx)
+
+
+def _call_method(job, method):
+    """Call method of estimator on arguments in job, return estimator and result."""
+    est, args = job
+    return est, getattr(est, method)(**args)
+
+
+def _parallelize(fun, iter, method, backend=None, backend_params=None):
+    """Apply fun to all elements of iter, using the chosen backend.
+
+    Parameters
+    ----------
+    fun : callable, called as fun(x, method=method) for x in iter
+    iter : list of arguments to apply fun to
+    method : str, passed to fun as keyword argument
+    backend : str or None, one of BACKENDS_SUPPORTED, default=None (sequential)
+    backend_params : dict or None, passed to the backend, default=None
+
+    Returns
+    -------
+    list of fun(x, method=method), in the order of iter
+    """
+    if backend not in BACKENDS_SUPPORTED:
+        raise ValueError(
+            f"backend must be one of {BACKENDS_SUPPORTED}, found {backend}"
+        )
+
+    params = {} if backend_params is None else backend_params.copy()
+
+    if backend is None:
+        return [fun(x, method=method) for x in iter]
+
+    if backend == "dask":
+        _check_soft_dependencies("dask")
+
+        from dask import compute, delayed
 
-            est_i_method = getattr(est_i, method)
-            est_i_result = est_i_method(**args_i)
+        lazy = [delayed(fun)(x, method=method) for x in iter]
+        return list(compute(*lazy, **params))
 
-            if return_type == "pd.DataFrame":
-                est_frame_new.iloc[row_ind].iloc[col_ind] = est_i_result
-            else:  # if return_type == "list"
-                est_frame_new += [est_i_result]
+    from joblib import Parallel, delayed
 
-        return est_frame_new
+    params["backend"] = backend
+    params.setdefault("n_jobs", -1)
+    return Parallel(**params)(delayed(fun)(x, method=method) for x in iter)
 
 
 def _enforce_index_freq(item: pd.Series) -> pd.Series:
@@ -472,3 +472,89 @@ def test_vectorize_est(
     assert result.shape == (n_rows, n_cols)
     is_fcst_frame = result.applymap(lambda x: isinstance(x, NaiveForecaster))
     assert is_fcst_frame.all().all()
+
+
+@pytest.mark.parametrize("backend", ["loky", "threading", "multiprocessing"])
+def test_vectorize_est_backend(backend):
+    """Tests that vectorize_est with parallel backend agrees with sequential loop."""
+    from aeon.forecasting.naive import NaiveForecaster
+    from aeon.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical(hierarchy_levels=(2, 2), n_columns=2, random_state=0)
+    X_vect = VectorizedDF(X=X, iterate_as="Series", is_scitype=None, iterate_cols=True)
+    backend_params = {"n_jobs": 2}
+
+    est_clones = X_vect.vectorize_est(NaiveForecaster(strategy="mean"), "clone")
+    seq = X_vect.vectorize_est(est_clones, method="fit", y=X_vect, fh=[1, 2])
+    seq_pred = X_vect.vectorize_est(seq, method="predict", return_type="list")
+
+    est_clones = X_vect.vectorize_est(
+        NaiveForecaster(strategy="mean"),
+        "clone",
+        backend=backend,
+        backend_params=backend_params,
+    )
+    par = X_vect.vectorize_est(
+        est_clones,
+        method="fit",
+        y=X_vect,
+        fh=[1, 2],
+        backend=backend,
+        backend_params=backend_params,
+    )
+    par_pred = X_vect.vectorize_est(
+        par,
+        method="predict",
+        return_type="list",
+        backend=backend,
+        backend_params=backend_params,
+    )
+
+    assert par.shape == seq.shape
+    assert (par.index == seq.index).all() and (par.columns == seq.columns).all()
+    assert par.applymap(lambda x: x.is_fitted).all().all()
+    assert len(par_pred) == len(seq_pred)
+    for y_par, y_seq in zip(par_pred, seq_pred):
+        pd.testing.assert_frame_equal(y_par, y_seq)
+
+
+def test_vectorize_est_backend_config():
+    """Tests that forecaster vectorization respects the backend:parallel config."""
+    from aeon.forecasting.trend import TrendForecaster
+    from aeon.utils._testing.hierarchical import _make_hierarchical
+
+    y = _make_hierarchical(hierarchy_levels=(3,), random_state=0)
+
+    y_pred = TrendForecaster().fit(y, fh=[1, 2]).predict()
+    forecaster = TrendForecaster().set_config(
+        **{"backend:parallel": "loky", "backend:parallel:params": {"n_jobs": 2}}
+    )
+    y_pred_par = forecaster.fit(y, fh=[1, 2]).predict()
+
+    pd.testing.assert_frame_equal(y_pred, y_pred_par)
+    assert forecaster.forecasters_.shape == (3, 1)
+    # the config is kept by fit, which resets the forecaster, and by clone
+    assert forecaster.get_config()["backend:parallel"] == "loky"
+    assert forecaster.clone().get_config()["backend:parallel:params"] == {"n_jobs": 2}
+
+
+@pytest.mark.parametrize(
+    "config", [{"backend:parallel": "foo"}, {"backend:parallel:params": 2}, {"foo": 1}]
+)
+def test_vectorize_est_backend_config_invalid(config):
+    """Tests that set_config raises an error for invalid config flags."""
+    from aeon.forecasting.trend import TrendForecaster
+
+    with pytest.raises(ValueError):
+        TrendForecaster().set_config(**config)
+
+
+def test_vectorize_est_backend_invalid():
+    """Tests that vectorize_est raises an error for unknown backends."""
+    from aeon.forecasting.naive import NaiveForecaster
+
+    X = get_examples(mtype="pd-multiindex", as_scitype="Panel")[0]
+    X_vect = VectorizedDF(X=X, iterate_as="Series", is_scitype=None)
+
+    with pytest.raises(ValueError, match="backend must be one of"):
+        X_vect.vectorize_est(NaiveForecaster(), "clone", backend="foo")
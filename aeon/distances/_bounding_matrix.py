@@ -2,6 +2,7 @@
 __author__ = ["chrisholder"]
 
 import math
+from typing import Tuple
 
 import numpy as np
 from numba import njit
@@ -48,17 +49,74 @@ def create_bounding_matrix(x_size: int, y_size: int, window: float = None):
 def _sakoe_chiba_bounding(
     x_size: int, y_size: int, radius_percent: float
 ) -> np.ndarray:
-    one_percent = min(x_size, y_size) / 100
-    radius = math.floor(((radius_percent * one_percent) * 100))
+    radius = _sakoe_chiba_radius(x_size, y_size, radius_percent)
     bounding_matrix = np.full((x_size, y_size), False)
 
-    smallest_size = min(x_size, y_size)
-    largest_size = max(x_size, y_size)
-
-    width = largest_size - smallest_size + radius
-    for i in range(smallest_size):
-        lower = max(0, i - radius)
-        upper = min(largest_size, i + width) + 1
+    for i in range(x_size):
+        lower, upper = _bounding_band(i, x_size, y_size, radius)
         bounding_matrix[i, lower:upper] = True
 
     return bounding_matrix
+
+
+@njit(cache=True)
+def _sakoe_chiba_radius(x_size: int, y_size: int, window: float = None) -> int:
+    """Convert a window to the radius of a Sakoe-Chiba band.
+
+    Parameters
+    ----------
+    x_size: int
+        Size of the first time series.
+    y_size: int
+        Size of the second time series.
+    window: float, defaults=None
+        Window size as a percentage of the smallest time series.
+
+    Returns
+    -------
+    int
+        Radius of the band in number of time points, or -1 if the window does not
+        restrict the warping (window is None or >= 1).
+    """
+    if window is None or window >= 1:
+        return -1
+    one_percent = min(x_size, y_size) / 100
+    return math.floor(((window * one_percent) * 100))
+
+
+@njit(cache=True)
+def _bounding_band(i: int, x_size: int, y_size: int, radius: int) -> Tuple[int, int]:
+    """Find the columns of a row of the bounding matrix that are in bound.
+
+    This gives the same bounds as ``create_bounding_matrix`` without materialising
+    the matrix, so a distance only needs O(x_size) work to find its band.
+
+    Parameters
+    ----------
+    i: int
+        Row (index into the first time series).
+    x_size: int
+        Size of the first time series.
+    y_size: int
+        Size of the second time series.
+    radius: int
+        Radius of the band, as returned by ``_sakoe_chiba_radius``.
+
+    Returns
+    -------
+    int
+        First column in bound.
+    int
+        One past the last column in bound. If it is not greater than the first
+        column the whole row is out of bounds.
+    """
+    if radius < 0:
+        return 0, y_size
+    smallest_size = min(x_size, y_size)
+    if i >= smallest_size:
+        return 0, 0
+    largest_size = max(x_size, y_size)
+    width = largest_size - smallest_size + radius
+    lower = max(0, i - radius)
+    upper = min(min(largest_size, i + width) + 1, y_size)
+    return lower, upper
@@ -24,10 +24,16 @@ __author__ = ["chrisholder", "tonybagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance, create_bounding_matrix
+from aeon.distances._dtw import (
+    _dtw_cost_matrix,
+    _dtw_distance,
+    _dtw_rows_distance,
+    create_bounding_matrix,
+)
+from aeon.distances._numba_utils import _pairwise_tiles
 
 
 @njit(cache=True, fastmath=True)
@@ -69,20 +75,17 @@ def ddtw_distance(x: np.ndarray, y: np.ndarray, window: float = None) -> float:
     if x.ndim == 1 and y.ndim == 1:
         _x = average_of_slope(x.reshape((1, x.shape[0])))
         _y = average_of_slope(y.reshape((1, y.shape[0])))
-        bounding_matrix = create_bounding_matrix(_x.shape[1], _y.shape[1], window)
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, window)
     if x.ndim == 2 and y.ndim == 2:
         _x = average_of_slope(x)
         _y = average_of_slope(y)
-        bounding_matrix = create_bounding_matrix(_x.shape[1], _y.shape[1], window)
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, window)
     if x.ndim == 3 and y.ndim == 3:
         distance = 0
-        bounding_matrix = create_bounding_matrix(x.shape[2] - 2, y.shape[2] - 2, window)
         for curr_x, curr_y in zip(x, y):
             _x = average_of_slope(curr_x)
             _y = average_of_slope(curr_y)
-            distance += _dtw_distance(_x, _y, bounding_matrix)
+            distance += _dtw_distance(_x, _y, window)
         return distance
     raise ValueError("x and y must be 1D, 2D, or 3D arrays")
 
@@ -248,47 +251,53 @@ def ddtw_pairwise_distance(
             raise ValueError("x and y must be 2D or 3D arrays")
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_pairwise_distance(X: np.ndarray, window: float) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(X.shape[2] - 2, X.shape[2] - 2, window)
 
     X_average_of_slope = np.zeros((n_instances, X.shape[1], X.shape[2] - 2))
-    for i in range(n_instances):
+    for i in prange(n_instances):
         X_average_of_slope[i] = average_of_slope(X[i])
 
-    for i in range(n_instances):
-        for j in range(i + 1, n_instances):
-            distances[i, j] = _dtw_distance(
-                X_average_of_slope[i], X_average_of_slope[j], bounding_matrix
-            )
-            distances[j, i] = distances[i, j]
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        rows = np.empty((2, X.shape[2] - 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _dtw_rows_distance(
+                    X_average_of_slope[i], X_average_of_slope[j], window, np.inf, rows
+                )
+                distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
 
     # Derive the arrays before so that we dont have to redo every iteration
     derive_x = np.zeros((x.shape[0], x.shape[1], x.shape[2] - 2))
-    for i in range(x.shape[0]):
+    for i in prange(x.shape[0]):
         derive_x[i] = average_of_slope(x[i])
 
     derive_y = np.zeros((y.shape[0], y.shape[1], y.shape[2] - 2))
-    for i in range(y.shape[0]):
+    for i in prange(y.shape[0]):
         derive_y[i] = average_of_slope(y[i])
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], bounding_matrix)
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        rows = np.empty((2, y.shape[2] - 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _dtw_rows_distance(
+                    derive_x[i], derive_y[j], window, np.inf, rows
+                )
     return distances
 
 
@@ -4,7 +4,7 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import Any, Callable, Union
 
 import numpy as np
-from numba import njit
+from numba import config, get_num_threads, njit, set_num_threads
 
 from aeon.distances._ddtw import (
     average_of_slope,
@@ -13,11 +13,27 @@ from aeon.distances._ddtw import (
     ddtw_pairwise_distance,
 )
 from aeon.distances._dtw import dtw_alignment_path, dtw_distance, dtw_pairwise_distance
-from aeon.distances._edr import _EdrDistance
-from aeon.distances._erp import _ErpDistance
+from aeon.distances._edr import (
+    _edr_from_multiple_to_multiple_distance,
+    _edr_pairwise_distance,
+    _EdrDistance,
+)
+from aeon.distances._erp import (
+    _erp_from_multiple_to_multiple_distance,
+    _erp_pairwise_distance,
+    _ErpDistance,
+)
 from aeon.distances._euclidean import euclidean_distance, euclidean_pairwise_distance
-from aeon.distances._lcss import _LcssDistance
-from aeon.distances._msm import _MsmDistance
+from aeon.distances._lcss import (
+    _lcss_from_multiple_to_multiple_distance,
+    _lcss_pairwise_distance,
+    _LcssDistance,
+)
+from aeon.distances._msm import (
+    _msm_from_multiple_to_multiple_distance,
+    _msm_pairwise_distance,
+    _MsmDistance,
+)
 from aeon.distances._numba_utils import (
     _compute_pairwise_distance,
     _make_3d_series,
@@ -29,7 +45,11 @@ from aeon.distances._resolve_metric import (
     _resolve_metric_to_factory,
 )
 from aeon.distances._squared import squared_distance, squared_pairwise_distance
-from aeon.distances._twe import _TweDistance
+from aeon.distances._twe import (
+    _twe_from_multiple_to_multiple_distance,
+    _twe_pairwise_distance,
+    _TweDistance,
+)
 from aeon.distances._wddtw import _WddtwDistance
 from aeon.distances._wdtw import (
     wdtw_alignment_path,
@@ -43,6 +63,7 @@ from aeon.distances.base import (
     MetricInfo,
     NumbaDistance,
 )
+from aeon.utils.validation import check_n_jobs
 
 
 def erp_distance(
@@ -965,6 +986,37 @@ def twe_alignment_path(
 
 NEW_DISTANCES = ["squared", "euclidean", "dtw", "ddtw", "wdtw"]
 
+# Elastic distances that have a compiled, parallel pairwise implementation. Each
+# entry maps the metric name to the (X to self, X to y) functions and the names and
+# default values of the parameters they take after window.
+PARALLEL_PAIRWISE_DISTANCES = {
+    "erp": (
+        _erp_pairwise_distance,
+        _erp_from_multiple_to_multiple_distance,
+        {"g": 0.0},
+    ),
+    "edr": (
+        _edr_pairwise_distance,
+        _edr_from_multiple_to_multiple_distance,
+        {"epsilon": None},
+    ),
+    "lcss": (
+        _lcss_pairwise_distance,
+        _lcss_from_multiple_to_multiple_distance,
+        {"epsilon": 1.0},
+    ),
+    "msm": (
+        _msm_pairwise_distance,
+        _msm_from_multiple_to_multiple_distance,
+        {"c": 1.0},
+    ),
+    "twe": (
+        _twe_pairwise_distance,
+        _twe_from_multiple_to_multiple_distance,
+        {"lmbda": 1.0, "nu": 0.001, "p": 2},
+    ),
+}
+
 
 def distance(
     x: np.ndarray,
@@ -1165,6 +1217,7 @@ def pairwise_distance(
         Callable[[np.ndarray, np.ndarray], float],
         NumbaDistance,
     ] = "euclidean",
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> np.ndarray:
     """Compute the pairwise distance matrix between two time series.
@@ -1195,6 +1248,10 @@ def pairwise_distance(
         A distance factory takes the form (must return a no_python callable):
         Callable[[np.ndarray, np.ndarray, bool, dict], Callable[[np.ndarray,
         np.ndarray], float]].
+    n_jobs: int, defaults = 1
+        The number of threads used to fill the distance matrix. Only used by the
+        compiled pairwise implementations of 'dtw', 'ddtw', 'wdtw', 'erp', 'edr',
+        'lcss', 'msm' and 'twe'. ``-1`` means using all processors.
     kwargs: Any
         Extra arguments for metric. Refer to each metric documentation for a list of
         possible arguments.
@@ -1245,26 +1302,57 @@ def pairwise_distance(
            [ 58., 256.]])
     """
     _x = _make_3d_series(x)
+    if metric in NEW_DISTANCES or metric in PARALLEL_PAIRWISE_DISTANCES:
+        _y = None if y is None else _make_3d_series(y)
+        if _y is not None and np.array_equal(_x, _y):
+            _y = None
+        prev_threads = get_num_threads()
+        set_num_threads(min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS))
+        try:
+            return _compiled_pairwise_distance(_x, _y, metric, **kwargs)
+        finally:
+            set_num_threads(prev_threads)
+
     if y is None:
         y = x
     _y = _make_3d_series(y)
+    symmetric = np.array_equal(_x, _y)
+    _metric_callable = _resolve_metric_to_factory(
+        metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
+    )
+    return _compute_pairwise_distance(_x, _y, symmetric, _metric_callable)
+
+
+def _compiled_pairwise_distance(
+    x: np.ndarray, y: np.ndarray, metric: str, **kwargs: Any
+) -> np.ndarray:
+    """Compute a pairwise matrix with the compiled kernels of a named metric.
+
+    If y is None the distances between the instances of x are computed, which only
+    evaluates the upper triangle of the (symmetric) matrix.
+    """
     if metric in NEW_DISTANCES:
         if metric == "euclidean":
-            return euclidean_pairwise_distance(_x, _y)
+            return euclidean_pairwise_distance(x, x if y is None else y)
         elif metric == "squared":
-            return squared_pairwise_distance(_x, _y)
+            return squared_pairwise_distance(x, x if y is None else y)
         elif metric == "dtw":
-            return dtw_pairwise_distance(_x, _y, **kwargs)
+            return dtw_pairwise_distance(x, y, **kwargs)
         elif metric == "ddtw":
-            return ddtw_pairwise_distance(_x, _y, **kwargs)
+            return ddtw_pairwise_distance(x, y, **kwargs)
         elif metric == "wdtw":
-            return wdtw_pairwise_distance(_x, _y, **kwargs)
+            return wdtw_pairwise_distance(x, y, **kwargs)
 
-    symmetric = np.array_equal(_x, _y)
-    _metric_callable = _resolve_metric_to_factory(
-        metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
+    # the distance factory validates the parameters, as for the other metrics
+    _resolve_metric_to_factory(
+        metric, x[0], x[0] if y is None else y[0], _METRIC_INFOS, **kwargs
     )
-    return _compute_pairwise_distance(_x, _y, symmetric, _metric_callable)
+    to_self, to_multiple, defaults = PARALLEL_PAIRWISE_DISTANCES[metric]
+    params = [kwargs.get(name, default) for name, default in defaults.items()]
+    window = kwargs.get("window")
+    if y is None:
+        return to_self(x, window, *params)
+    return to_multiple(x, y, window, *params)
 
 
 def distance_alignment_path(
@@ -39,10 +39,15 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _bounding_band,
+    _sakoe_chiba_radius,
+    create_bounding_matrix,
+)
+from aeon.distances._numba_utils import _pairwise_tiles
 from aeon.distances._squared import _univariate_squared_distance
 
 
@@ -101,16 +106,13 @@ def dtw_distance(x: np.ndarray, y: np.ndarray, window: float = None) -> float:
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(_x.shape[1], _y.shape[1], window)
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, window)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(x.shape[1], y.shape[1], window)
-        return _dtw_distance(x, y, bounding_matrix)
+        return _dtw_distance(x, y, window)
     if x.ndim == 3 and y.ndim == 3:
         distance = 0
-        bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
         for curr_x, curr_y in zip(x, y):
-            distance += _dtw_distance(curr_x, curr_y, bounding_matrix)
+            distance += _dtw_distance(curr_x, curr_y, window)
         return distance
     raise ValueError("x and y must be 1D, 2D, or 3D arrays")
 
@@ -179,8 +181,105 @@ def dtw_cost_matrix(x: np.ndarray, y: np.ndarray, window: float = None) -> np.nd
 
 
 @njit(cache=True, fastmath=True)
-def _dtw_distance(x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray) -> float:
-    return _dtw_cost_matrix(x, y, bounding_matrix)[x.shape[1] - 1, y.shape[1] - 1]
+def _dtw_distance(
+    x: np.ndarray, y: np.ndarray, window: float, abandon_threshold: float = np.inf
+) -> float:
+    rows = np.empty((2, y.shape[1] + 1))
+    return _dtw_rows_distance(x, y, window, abandon_threshold, rows)
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_rows_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float,
+    abandon_threshold: float,
+    rows: np.ndarray,
+) -> float:
+    # Only the last two rows of the cost matrix are kept, in the scratch buffer rows
+    # of shape (2, >= y_size + 1), and only the cells inside the band are visited,
+    # so this is O(x_size * band width) time and O(y_size) memory. Every warping
+    # path crosses every row, so once all cells of a row exceed abandon_threshold
+    # the distance must too and np.inf is returned early.
+    n_channels = min(x.shape[0], y.shape[0])
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    radius = _sakoe_chiba_radius(x_size, y_size, window)
+    prev_row = rows[0, : y_size + 1]
+    curr_row = rows[1, : y_size + 1]
+    prev_row[:] = np.inf
+    curr_row[:] = np.inf
+    prev_row[0] = 0.0
+
+    for i in range(x_size):
+        lower, upper = _bounding_band(i, x_size, y_size, radius)
+        if lower >= upper:
+            return np.inf
+        curr_row[lower : upper + 1] = np.inf
+        row_min = np.inf
+        for j in range(lower, upper):
+            squared_dist = 0.0
+            for k in range(n_channels):
+                difference = x[k, i] - y[k, j]
+                squared_dist += difference * difference
+            curr_row[j + 1] = squared_dist + min(
+                prev_row[j + 1],
+                curr_row[j],
+                prev_row[j],
+            )
+            row_min = min(row_min, curr_row[j + 1])
+        if row_min > abandon_threshold:
+            return np.inf
+        prev_row, curr_row = curr_row, prev_row
+
+    return prev_row[y_size]
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_distance_and_width(
+    x: np.ndarray, y: np.ndarray, radius: int, abandon_threshold: float = np.inf
+) -> Tuple[float, int]:
+    # Same recursion as _dtw_distance for equal length series and a band radius in
+    # time points, also tracking the largest |i - j| on an optimal warping path. The
+    # path is inside the band of every radius at least this width, so the distance
+    # is the same for all of them. Of equally good paths the narrowest is followed.
+    n_channels = min(x.shape[0], y.shape[0])
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_width = np.zeros(y_size + 1, dtype=np.int64)
+    curr_width = np.zeros(y_size + 1, dtype=np.int64)
+    prev_row[0] = 0.0
+
+    for i in range(x_size):
+        lower, upper = _bounding_band(i, x_size, y_size, radius)
+        if lower >= upper:
+            return np.inf, 0
+        curr_row[lower : upper + 1] = np.inf
+        row_min = np.inf
+        for j in range(lower, upper):
+            squared_dist = 0.0
+            for k in range(n_channels):
+                difference = x[k, i] - y[k, j]
+                squared_dist += difference * difference
+            best = min(prev_row[j + 1], curr_row[j], prev_row[j])
+            width = x_size + y_size
+            if prev_row[j + 1] == best:
+                width = prev_width[j + 1]
+            if curr_row[j] == best:
+                width = min(width, curr_width[j])
+            if prev_row[j] == best:
+                width = min(width, prev_width[j])
+            curr_row[j + 1] = squared_dist + best
+            curr_width[j + 1] = max(width, abs(i - j))
+            row_min = min(row_min, curr_row[j + 1])
+        if row_min > abandon_threshold:
+            return np.inf, 0
+        prev_row, curr_row = curr_row, prev_row
+        prev_width, curr_width = curr_width, prev_width
+
+    return prev_row[y_size], prev_width[y_size]
 
 
 @njit(cache=True, fastmath=True)
@@ -302,32 +401,36 @@ def dtw_pairwise_distance(
             raise ValueError("x and y must be 2D or 3D arrays")
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_pairwise_distance(X: np.ndarray, window: float) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(X.shape[2], X.shape[2], window)
 
-    for i in range(n_instances):
-        for j in range(i + 1, n_instances):
-            distances[i, j] = _dtw_distance(X[i], X[j], bounding_matrix)
-            distances[j, i] = distances[i, j]
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        rows = np.empty((2, X.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _dtw_rows_distance(X[i], X[j], window, np.inf, rows)
+                distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _dtw_distance(x[i], y[j], bounding_matrix)
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        rows = np.empty((2, y.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _dtw_rows_distance(x[i], y[j], window, np.inf, rows)
     return distances
 
 
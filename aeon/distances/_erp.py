@@ -5,7 +5,7 @@ import warnings
 from typing import Any, List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from numba.core.errors import NumbaWarning
 
 from aeon.distances._alignment_paths import (
@@ -13,6 +13,7 @@ from aeon.distances._alignment_paths import (
     compute_min_return_path,
 )
 from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._numba_utils import _pairwise_tiles
 from aeon.distances.base import (
     DistanceAlignmentPathCallable,
     DistanceCallable,
@@ -148,9 +149,7 @@ class _ErpDistance(NumbaDistance):
 
         @njit(cache=True)
         def numba_erp_distance(_x: np.ndarray, _y: np.ndarray) -> float:
-            cost_matrix = _erp_cost_matrix(_x, _y, _bounding_matrix, g)
-
-            return cost_matrix[-1, -1]
+            return _erp_distance(_x, _y, _bounding_matrix, g)
 
         return numba_erp_distance
 
@@ -179,12 +178,32 @@ def _erp_cost_matrix(
     np.ndarray (2d of size mxn where m is len(x) and n is len(y))
         Erp cost matrix between x and y.
     """
+    cost_matrix = np.zeros((x.shape[1] + 1, y.shape[1] + 1))
+    scratch = np.zeros(x.shape[1] + y.shape[1])
+    _erp_fill_cost_matrix(x, y, bounding_matrix, g, cost_matrix, scratch)
+    return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _erp_fill_cost_matrix(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    g: float,
+    cost_matrix: np.ndarray,
+    scratch: np.ndarray,
+) -> float:
+    # Fill cost_matrix, of shape (x_size + 1, y_size + 1), and return the distance.
+    # Only the cells inside bounding_matrix and the first row and column are
+    # written, so the same buffers can be reused for series of the same lengths.
+    # scratch must hold at least x_size + y_size values.
     dimensions = x.shape[0]
     x_size = x.shape[1]
     y_size = y.shape[1]
-    cost_matrix = np.zeros((x_size + 1, y_size + 1))
-    gx_distance = np.zeros(x_size)
-    gy_distance = np.zeros(y_size)
+    gx_distance = scratch[:x_size]
+    gy_distance = scratch[x_size : x_size + y_size]
+    gx_distance[:] = 0.0
+    gy_distance[:] = 0.0
     for j in range(x_size):
         for i in range(dimensions):
             gx_distance[j] += (x[i][j] - g) * (x[i][j] - g)
@@ -210,4 +229,52 @@ def _erp_cost_matrix(
                     cost_matrix[i - 1, j] + gx_distance[i - 1],
                     cost_matrix[i, j - 1] + gy_distance[j - 1],
                 )
-    return cost_matrix[1:, 1:]
+    return cost_matrix[x_size, y_size]
+
+
+@njit(cache=True)
+def _erp_distance(
+    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, g: float
+) -> float:
+    return _erp_cost_matrix(x, y, bounding_matrix, g)[-1, -1]
+
+
+@njit(cache=True, parallel=True)
+def _erp_pairwise_distance(X: np.ndarray, window: float, g: float) -> np.ndarray:
+    n_instances = X.shape[0]
+    distances = np.zeros((n_instances, n_instances))
+    bounding_matrix = create_bounding_matrix(X.shape[2], X.shape[2], window)
+
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((X.shape[2] + 1, X.shape[2] + 1))
+        scratch = np.zeros(2 * X.shape[2])
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _erp_fill_cost_matrix(
+                    X[i], X[j], bounding_matrix, g, cost_matrix, scratch
+                )
+                distances[j, i] = distances[i, j]
+
+    return distances
+
+
+@njit(cache=True, parallel=True)
+def _erp_from_multiple_to_multiple_distance(
+    x: np.ndarray, y: np.ndarray, window: float, g: float
+) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    distances = np.zeros((n_instances, m_instances))
+    bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
+
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((x.shape[2] + 1, y.shape[2] + 1))
+        scratch = np.zeros(x.shape[2] + y.shape[2])
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _erp_fill_cost_matrix(
+                    x[i], y[j], bounding_matrix, g, cost_matrix, scratch
+                )
+    return distances
@@ -6,7 +6,7 @@ import warnings
 from typing import Any, List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from numba.core.errors import NumbaWarning
 
 from aeon.distances._alignment_paths import (
@@ -14,6 +14,7 @@ from aeon.distances._alignment_paths import (
     compute_lcss_return_path,
 )
 from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._numba_utils import _pairwise_tiles
 from aeon.distances.base import (
     DistanceAlignmentPathCallable,
     DistanceCallable,
@@ -205,10 +206,7 @@ class _LcssDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            x_size = _x.shape[1]
-            y_size = _y.shape[1]
-            cost_matrix = _sequence_cost_matrix(_x, _y, _bounding_matrix, epsilon)
-            return 1 - float(cost_matrix[x_size - 1, y_size - 1] / min(x_size, y_size))
+            return _lcss_distance(_x, _y, _bounding_matrix, epsilon)
 
         return numba_lcss_distance
 
@@ -238,10 +236,25 @@ def _sequence_cost_matrix(
     np.ndarray (2d of size mxn where m is len(x) and n is len(y))
         Lcss cost matrix between x and y.
     """
+    cost_matrix = np.zeros((x.shape[1] + 1, y.shape[1] + 1))
+    _lcss_fill_cost_matrix(x, y, bounding_matrix, epsilon, cost_matrix)
+    return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _lcss_fill_cost_matrix(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    epsilon: float,
+    cost_matrix: np.ndarray,
+) -> float:
+    # Fill cost_matrix, of shape (x_size + 1, y_size + 1), and return its last cell.
+    # Only the cells inside bounding_matrix are written, so the same buffer can be
+    # reused for series of the same lengths.
     dimensions = x.shape[0]
     x_size = x.shape[1]
     y_size = y.shape[1]
-    cost_matrix = np.zeros((x_size + 1, y_size + 1))
     for i in range(1, x_size + 1):
         for j in range(1, y_size + 1):
             if bounding_matrix[i - 1, j - 1]:
@@ -255,4 +268,63 @@ def _sequence_cost_matrix(
                     cost_matrix[i, j] = max(
                         cost_matrix[i, j - 1], cost_matrix[i - 1, j]
                     )
-    return cost_matrix[1:, 1:]
+    return cost_matrix[x_size, y_size]
+
+
+@njit(cache=True)
+def _lcss_distance(
+    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float
+) -> float:
+    cost_matrix = np.zeros((x.shape[1] + 1, y.shape[1] + 1))
+    return _lcss_scratch_distance(x, y, bounding_matrix, epsilon, cost_matrix)
+
+
+@njit(cache=True)
+def _lcss_scratch_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    epsilon: float,
+    cost_matrix: np.ndarray,
+) -> float:
+    distance = _lcss_fill_cost_matrix(x, y, bounding_matrix, epsilon, cost_matrix)
+    return 1 - float(distance / min(x.shape[1], y.shape[1]))
+
+
+@njit(cache=True, parallel=True)
+def _lcss_pairwise_distance(X: np.ndarray, window: float, epsilon: float) -> np.ndarray:
+    n_instances = X.shape[0]
+    distances = np.zeros((n_instances, n_instances))
+    bounding_matrix = create_bounding_matrix(X.shape[2], X.shape[2], window)
+
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((X.shape[2] + 1, X.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _lcss_scratch_distance(
+                    X[i], X[j], bounding_matrix, epsilon, cost_matrix
+                )
+                distances[j, i] = distances[i, j]
+
+    return distances
+
+
+@njit(cache=True, parallel=True)
+def _lcss_from_multiple_to_multiple_distance(
+    x: np.ndarray, y: np.ndarray, window: float, epsilon: float
+) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    distances = np.zeros((n_instances, m_instances))
+    bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
+
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((x.shape[2] + 1, y.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _lcss_scratch_distance(
+                    x[i], y[j], bounding_matrix, epsilon, cost_matrix
+                )
+    return distances
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+r"""Lower bounds for the dtw distance.
+
+Lower bounds are cheap to compute and never exceed the dtw distance between two
+series, so they can be used to discard candidates in a nearest neighbour search
+without computing the full distance [1]_. The bounds here are for the dtw
+distance as computed in ``aeon.distances``, i.e. the sum of squared pointwise
+distances along the warping path.
+
+LB_Kim uses the fact that the first and last points of both series must be aligned.
+LB_Keogh [2]_ builds an envelope around one series from the maximum and minimum
+values within the warping window and sums the squared distance of the other series
+to the envelope. It is only valid for equal length series.
+
+References
+----------
+.. [1] Rakthanmanon T. et al.: Searching and mining trillions of time series
+subsequences under dynamic time warping. Proceedings of the 18th ACM SIGKDD, 2012
+.. [2] Keogh E. and Ratanamahatana C.: Exact indexing of dynamic time warping.
+Knowledge and Information Systems 7(3):358–386, 2005
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute the LB_Kim lower bound between two time series.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape (d, m1))
+        First time series.
+    y: np.ndarray (2d array of shape (d, m2))
+        Second time series.
+
+    Returns
+    -------
+    float
+        Squared distance between the first points plus the squared distance between
+        the last points of x and y.
+    """
+    n_channels = min(x.shape[0], y.shape[0])
+    bound = 0.0
+    for k in range(n_channels):
+        difference = x[k, 0] - y[k, 0]
+        bound += difference * difference
+    if x.shape[1] > 1 and y.shape[1] > 1:
+        for k in range(n_channels):
+            difference = x[k, -1] - y[k, -1]
+            bound += difference * difference
+    return bound
+
+
+@njit(cache=True, fastmath=True)
+def _keogh_envelope(x: np.ndarray, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the upper and lower LB_Keogh envelope of a time series.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape (d, m))
+        Time series.
+    radius: int
+        Radius of the warping window in time points, as returned by
+        ``_sakoe_chiba_radius``. If negative the window is unbounded.
+
+    Returns
+    -------
+    np.ndarray (2d array of shape (d, m))
+        Maximum of x within the window around each time point.
+    np.ndarray (2d array of shape (d, m))
+        Minimum of x within the window around each time point.
+    """
+    n_channels, n_timepoints = x.shape
+    if radius < 0:
+        radius = n_timepoints
+    upper = np.empty((n_channels, n_timepoints))
+    lower = np.empty((n_channels, n_timepoints))
+    for k in range(n_channels):
+        for i in range(n_timepoints):
+            start = max(0, i - radius)
+            end = min(n_timepoints, i + radius + 1)
+            upper[k, i] = np.max(x[k, start:end])
+            lower[k, i] = np.min(x[k, start:end])
+    return upper, lower
+
+
+@njit(cache=True, fastmath=True)
+def _lb_keogh(
+    x: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    abandon_threshold: float = np.inf,
+) -> float:
+    """Compute the LB_Keogh lower bound between a series and an envelope.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape (d, m))
+        Time series.
+    upper: np.ndarray (2d array of shape (d, m))
+        Upper envelope of the other time series.
+    lower: np.ndarray (2d array of shape (d, m))
+        Lower envelope of the other time series.
+    abandon_threshold: float, defaults = np.inf
+        The summation stops as soon as the bound exceeds this value.
+
+    Returns
+    -------
+    float
+        Sum of the squared distances of x to the envelope. If the summation was
+        abandoned this is a value greater than abandon_threshold.
+    """
+    n_channels = min(x.shape[0], upper.shape[0])
+    bound = 0.0
+    for i in range(x.shape[1]):
+        for k in range(n_channels):
+            if x[k, i] > upper[k, i]:
+                difference = x[k, i] - upper[k, i]
+                bound += difference * difference
+            elif x[k, i] < lower[k, i]:
+                difference = x[k, i] - lower[k, i]
+                bound += difference * difference
+        if bound > abandon_threshold:
+            return bound
+    return bound
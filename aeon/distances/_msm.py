@@ -5,7 +5,7 @@ import warnings
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from numba.core.errors import NumbaWarning
 
 from aeon.distances._alignment_paths import (
@@ -13,6 +13,7 @@ from aeon.distances._alignment_paths import (
     compute_min_return_path,
 )
 from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._numba_utils import _pairwise_tiles
 from aeon.distances.base import (
     DistanceAlignmentPathCallable,
     DistanceCallable,
@@ -184,8 +185,7 @@ class _MsmDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            cost_matrix = _cost_matrix(_x, _y, _bounding_matrix, c)
-            return cost_matrix[-1, -1]
+            return _msm_distance(_x, _y, _bounding_matrix, c)
 
         return numba_msm_distance
 
@@ -224,9 +224,24 @@ def _cost_matrix(
     np.ndarray (2d of size mxn where m is len(x) and n is len(y))
         Erp cost matrix between x and y.
     """
+    cost_matrix = np.zeros((x.shape[1], y.shape[1]))
+    _msm_fill_cost_matrix(x, y, bounding_matrix, c, cost_matrix)
+    return cost_matrix
+
+
+@njit(cache=True)
+def _msm_fill_cost_matrix(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    c: float,
+    cost_matrix: np.ndarray,
+) -> float:
+    # Fill cost_matrix, of shape (x_size, y_size), and return its last cell. Only
+    # the cells inside bounding_matrix and the first row and column are written, so
+    # the same buffer can be reused for series of the same lengths.
     x_size = x.shape[1]
     y_size = y.shape[1]
-    cost_matrix = np.zeros((x_size, y_size))
     # init the first cell
     if x[0][0] > y[0][0]:
         cost_matrix[0, 0] = x[0][0] - y[0][0]
@@ -255,4 +270,50 @@ def _cost_matrix(
                 d3 = cost_matrix[i, j - 1] + _cost(y[0, j], x[0, i], y[0, j - 1], c)
                 cost_matrix[i, j] = min(d1, d2, d3)
 
-    return cost_matrix
+    return cost_matrix[x_size - 1, y_size - 1]
+
+
+@njit(cache=True)
+def _msm_distance(
+    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+) -> float:
+    return _cost_matrix(x, y, bounding_matrix, c)[-1, -1]
+
+
+@njit(cache=True, parallel=True)
+def _msm_pairwise_distance(X: np.ndarray, window: float, c: float) -> np.ndarray:
+    n_instances = X.shape[0]
+    distances = np.zeros((n_instances, n_instances))
+    bounding_matrix = create_bounding_matrix(X.shape[2], X.shape[2], window)
+
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((X.shape[2], X.shape[2]))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _msm_fill_cost_matrix(
+                    X[i], X[j], bounding_matrix, c, cost_matrix
+                )
+                distances[j, i] = distances[i, j]
+
+    return distances
+
+
+@njit(cache=True, parallel=True)
+def _msm_from_multiple_to_multiple_distance(
+    x: np.ndarray, y: np.ndarray, window: float, c: float
+) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    distances = np.zeros((n_instances, m_instances))
+    bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
+
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((x.shape[2], y.shape[2]))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _msm_fill_cost_matrix(
+                    x[i], y[j], bounding_matrix, c, cost_matrix
+                )
+    return distances
@@ -2,7 +2,7 @@
 __author__ = ["chrisholder", "TonyBagnall"]
 
 import numpy as np
-from numba import njit
+from numba import get_num_threads, njit
 
 from aeon.distances.base import DistanceCallable
 
@@ -47,6 +47,55 @@ def _make_3d_series(x: np.ndarray) -> np.ndarray:
     return _x
 
 
+@njit(cache=True)
+def _pairwise_tiles(n_rows: int, n_cols: int, symmetric: bool) -> np.ndarray:
+    """Split a pairwise matrix into square tiles for parallel computation.
+
+    Each tile is computed by one thread, which allocates its scratch buffers once for
+    all distances in the tile. Tiles are at most 32 x 32 distances, and smaller if
+    needed to give every thread several tiles. For a symmetric matrix only the tiles
+    on or above the diagonal are returned.
+
+    Parameters
+    ----------
+    n_rows: int
+        Number of rows in the pairwise matrix.
+    n_cols: int
+        Number of columns in the pairwise matrix.
+    symmetric: bool
+        Whether only the upper triangle of the (square) matrix is computed.
+
+    Returns
+    -------
+    np.ndarray (2d of shape (n_tiles, 4))
+        The first row, last row + 1, first column and last column + 1 of each tile.
+    """
+    n_threads = get_num_threads()
+    size = 32
+    while size > 1:
+        n_row_tiles = (n_rows + size - 1) // size
+        n_col_tiles = (n_cols + size - 1) // size
+        n_tiles = n_row_tiles * n_col_tiles
+        if symmetric:
+            n_tiles = n_row_tiles * (n_row_tiles + 1) // 2
+        if n_tiles >= 4 * n_threads:
+            break
+        size //= 2
+
+    n_row_tiles = (n_rows + size - 1) // size
+    n_col_tiles = (n_cols + size - 1) // size
+    tiles = np.empty((n_row_tiles * n_col_tiles, 4), dtype=np.int64)
+    n_tiles = 0
+    for i in range(n_row_tiles):
+        for j in range(i if symmetric else 0, n_col_tiles):
+            tiles[n_tiles, 0] = i * size
+            tiles[n_tiles, 1] = min((i + 1) * size, n_rows)
+            tiles[n_tiles, 2] = j * size
+            tiles[n_tiles, 3] = min((j + 1) * size, n_cols)
+            n_tiles += 1
+    return tiles[:n_tiles]
+
+
 def _compute_pairwise_distance(
     x: np.ndarray, y: np.ndarray, symmetric: bool, distance_callable: DistanceCallable
 ) -> np.ndarray:
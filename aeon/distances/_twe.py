@@ -5,7 +5,7 @@ import warnings
 from typing import Any, List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from numba.core.errors import NumbaWarning
 
 from aeon.distances._alignment_paths import (
@@ -13,6 +13,7 @@ from aeon.distances._alignment_paths import (
     compute_min_return_path,
 )
 from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._numba_utils import _pairwise_tiles
 from aeon.distances.base import DistanceCallable, NumbaDistance
 
 # Warning occurs when using large time series (i.e. 1000x1000)
@@ -173,8 +174,7 @@ class _TweDistance(NumbaDistance):
             _x: np.ndarray,
             _y: np.ndarray,
         ) -> float:
-            cost_matrix = _twe_cost_matrix(_x, _y, _bounding_matrix, lmbda, nu, p)
-            return cost_matrix[-1, -1]
+            return _twe_distance(_x, _y, _bounding_matrix, lmbda, nu, p)
 
         return numba_twe_distance
 
@@ -238,11 +238,30 @@ def _twe_cost_matrix(
     """
     x = pad_ts(x)
     y = pad_ts(y)
+    cost_matrix = np.zeros((x.shape[1], y.shape[1]))
+    _twe_fill_cost_matrix(x, y, bounding_matrix, lmbda, nu, p, cost_matrix)
+    return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _twe_fill_cost_matrix(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    lmbda: float,
+    nu: float,
+    p: int,
+    cost_matrix: np.ndarray,
+) -> float:
+    # Fill cost_matrix, of shape (x_size, y_size) for the padded series x and y, and
+    # return its last cell. Only the cells inside bounding_matrix and the first row
+    # and column are written, so the same buffer can be reused for series of the
+    # same lengths.
     x_size = x.shape[1]
     y_size = y.shape[1]
     dimensions = x.shape[0]
 
-    cost_matrix = np.zeros((x_size, y_size))
+    cost_matrix[0, 0] = 0.0
     cost_matrix[0, 1:] = np.inf
     cost_matrix[1:, 0] = np.inf
 
@@ -291,4 +310,67 @@ def _twe_cost_matrix(
 
                 # Choose the operation with the minimal cost and update DP Matrix
                 cost_matrix[i, j] = min(del_x, del_y, match)
-    return cost_matrix[1:, 1:]
+    return cost_matrix[x_size - 1, y_size - 1]
+
+
+@njit(cache=True)
+def _twe_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    lmbda: float,
+    nu: float,
+    p: int,
+) -> float:
+    return _twe_cost_matrix(x, y, bounding_matrix, lmbda, nu, p)[-1, -1]
+
+
+@njit(cache=True)
+def _pad_collection(X: np.ndarray) -> np.ndarray:
+    padded_X = np.zeros((X.shape[0], X.shape[1], X.shape[2] + 1))
+    padded_X[:, :, 1:] = X
+    return padded_X
+
+
+@njit(cache=True, parallel=True)
+def _twe_pairwise_distance(
+    X: np.ndarray, window: float, lmbda: float, nu: float, p: int
+) -> np.ndarray:
+    n_instances = X.shape[0]
+    distances = np.zeros((n_instances, n_instances))
+    bounding_matrix = create_bounding_matrix(X.shape[2] + 1, X.shape[2] + 1, window)
+    padded_X = _pad_collection(X)
+
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((X.shape[2] + 1, X.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _twe_fill_cost_matrix(
+                    padded_X[i], padded_X[j], bounding_matrix, lmbda, nu, p, cost_matrix
+                )
+                distances[j, i] = distances[i, j]
+
+    return distances
+
+
+@njit(cache=True, parallel=True)
+def _twe_from_multiple_to_multiple_distance(
+    x: np.ndarray, y: np.ndarray, window: float, lmbda: float, nu: float, p: int
+) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    distances = np.zeros((n_instances, m_instances))
+    bounding_matrix = create_bounding_matrix(x.shape[2] + 1, y.shape[2] + 1, window)
+    padded_x = _pad_collection(x)
+    padded_y = _pad_collection(y)
+
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        cost_matrix = np.zeros((x.shape[2] + 1, y.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _twe_fill_cost_matrix(
+                    padded_x[i], padded_y[j], bounding_matrix, lmbda, nu, p, cost_matrix
+                )
+    return distances
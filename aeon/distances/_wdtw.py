@@ -27,10 +27,15 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _bounding_band,
+    _sakoe_chiba_radius,
+    create_bounding_matrix,
+)
+from aeon.distances._numba_utils import _pairwise_tiles
 from aeon.distances._squared import _univariate_squared_distance
 
 
@@ -95,16 +100,13 @@ def wdtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(_x.shape[1], _y.shape[1], window)
-        return _wdtw_distance(_x, _y, bounding_matrix, g)
+        return _wdtw_distance(_x, _y, window, g)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(x.shape[1], y.shape[1], window)
-        return _wdtw_distance(x, y, bounding_matrix, g)
+        return _wdtw_distance(x, y, window, g)
     if x.ndim == 3 and y.ndim == 3:
         distance = 0
-        bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
         for curr_x, curr_y in zip(x, y):
-            distance += _wdtw_distance(curr_x, curr_y, bounding_matrix, g)
+            distance += _wdtw_distance(curr_x, curr_y, window, g)
         return distance
     raise ValueError("x and y must be 1D, 2D, or 3D arrays")
 
@@ -199,9 +201,69 @@ def wdtw_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _wdtw_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, g: float
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float,
+    g: float,
+    abandon_threshold: float = np.inf,
 ) -> float:
-    return _wdtw_cost_matrix(x, y, bounding_matrix, g)[x.shape[1] - 1, y.shape[1] - 1]
+    weight_vector = _wdtw_weights(max(x.shape[1], y.shape[1]), g)
+    rows = np.empty((2, y.shape[1] + 1))
+    return _wdtw_rows_distance(x, y, window, abandon_threshold, weight_vector, rows)
+
+
+@njit(cache=True, fastmath=True)
+def _wdtw_weights(max_size: int, g: float) -> np.ndarray:
+    weight_vector = np.empty(max_size)
+    for i in range(max_size):
+        weight_vector[i] = 1 / (1 + np.exp(-g * (i - max_size / 2)))
+    return weight_vector
+
+
+@njit(cache=True, fastmath=True)
+def _wdtw_rows_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float,
+    abandon_threshold: float,
+    weight_vector: np.ndarray,
+    rows: np.ndarray,
+) -> float:
+    # Only the last two rows of the cost matrix are kept, in the scratch buffer
+    # rows, and only the cells inside the band are visited. Returns np.inf as soon
+    # as a whole row exceeds abandon_threshold, see _dtw_rows_distance.
+    n_channels = min(x.shape[0], y.shape[0])
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    radius = _sakoe_chiba_radius(x_size, y_size, window)
+    prev_row = rows[0, : y_size + 1]
+    curr_row = rows[1, : y_size + 1]
+    prev_row[:] = np.inf
+    curr_row[:] = np.inf
+    prev_row[0] = 0.0
+
+    for i in range(x_size):
+        lower, upper = _bounding_band(i, x_size, y_size, radius)
+        if lower >= upper:
+            return np.inf
+        curr_row[lower : upper + 1] = np.inf
+        row_min = np.inf
+        for j in range(lower, upper):
+            squared_dist = 0.0
+            for k in range(n_channels):
+                difference = x[k, i] - y[k, j]
+                squared_dist += difference * difference
+            curr_row[j + 1] = squared_dist * weight_vector[abs(i - j)] + min(
+                prev_row[j + 1],
+                curr_row[j],
+                prev_row[j],
+            )
+            row_min = min(row_min, curr_row[j + 1])
+        if row_min > abandon_threshold:
+            return np.inf
+        prev_row, curr_row = curr_row, prev_row
+
+    return prev_row[y_size]
 
 
 @njit(cache=True, fastmath=True)
@@ -331,32 +393,42 @@ def wdtw_pairwise_distance(
             raise ValueError("x and y must be 2D or 3D arrays")
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _wdtw_pairwise_distance(X: np.ndarray, window: float, g: float) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(X.shape[2], X.shape[2], window)
-
-    for i in range(n_instances):
-        for j in range(i + 1, n_instances):
-            distances[i, j] = _wdtw_distance(X[i], X[j], bounding_matrix, g)
-            distances[j, i] = distances[i, j]
+    weight_vector = _wdtw_weights(X.shape[2], g)
+
+    tiles = _pairwise_tiles(n_instances, n_instances, True)
+    for t in prange(tiles.shape[0]):
+        rows = np.empty((2, X.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(max(i + 1, tiles[t, 2]), tiles[t, 3]):
+                distances[i, j] = _wdtw_rows_distance(
+                    X[i], X[j], window, np.inf, weight_vector, rows
+                )
+                distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _wdtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, g: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(x.shape[2], y.shape[2], window)
-
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _wdtw_distance(x[i], y[j], bounding_matrix, g)
+    weight_vector = _wdtw_weights(max(x.shape[2], y.shape[2]), g)
+
+    tiles = _pairwise_tiles(n_instances, m_instances, False)
+    for t in prange(tiles.shape[0]):
+        rows = np.empty((2, y.shape[2] + 1))
+        for i in range(tiles[t, 0], tiles[t, 1]):
+            for j in range(tiles[t, 2], tiles[t, 3]):
+                distances[i, j] = _wdtw_rows_distance(
+                    x[i], y[j], window, np.inf, weight_vector, rows
+                )
     return distances
 
 
@@ -2,8 +2,10 @@
 __author__ = ["chrisholder"]
 
 import numpy as np
+import pytest
 
 from aeon.distances import create_bounding_matrix
+from aeon.distances._bounding_matrix import _bounding_band, _sakoe_chiba_radius
 
 
 def test_full_bounding():
@@ -24,3 +26,15 @@ def test_window_bounding():
 
     assert num_true == 44
     assert num_false == 56
+
+
+@pytest.mark.parametrize("x_size, y_size", [(10, 10), (7, 12), (12, 7), (1, 5)])
+@pytest.mark.parametrize("window", [None, 0.0, 0.1, 0.2, 0.5, 1.0])
+def test_bounding_band(x_size, y_size, window):
+    matrix = create_bounding_matrix(x_size, y_size, window)
+    radius = _sakoe_chiba_radius(x_size, y_size, window)
+    for i in range(x_size):
+        lower, upper = _bounding_band(i, x_size, y_size, radius)
+        band = np.zeros(y_size, dtype=bool)
+        band[lower:upper] = True
+        assert np.array_equal(matrix[i], band)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Tests for the dtw lower bounds."""
+import numpy as np
+import pytest
+
+from aeon.distances._bounding_matrix import _sakoe_chiba_radius
+from aeon.distances._dtw import _dtw_distance
+from aeon.distances._lower_bounding import _keogh_envelope, _lb_keogh, _lb_kim
+
+
+@pytest.mark.parametrize("n_channels", [1, 3])
+@pytest.mark.parametrize("window", [None, 0.0, 0.1, 0.5])
+def test_lower_bounds(n_channels, window):
+    rng = np.random.RandomState(0)
+    radius = _sakoe_chiba_radius(20, 20, window)
+    for _ in range(20):
+        x = rng.randn(n_channels, 20)
+        y = rng.randn(n_channels, 20)
+        dist = _dtw_distance(x, y, window)
+        upper, lower = _keogh_envelope(y, radius)
+        assert _lb_kim(x, y) <= dist + 1e-10
+        assert _lb_keogh(x, upper, lower) <= dist + 1e-10
+
+
+def test_keogh_envelope():
+    x = np.array([[1.0, 3.0, 2.0, 5.0, 4.0]])
+    upper, lower = _keogh_envelope(x, 1)
+    np.testing.assert_array_equal(upper, [[3.0, 3.0, 5.0, 5.0, 5.0]])
+    np.testing.assert_array_equal(lower, [[1.0, 1.0, 2.0, 2.0, 4.0]])
+    upper, lower = _keogh_envelope(x, -1)
+    np.testing.assert_array_equal(upper, np.full((1, 5), 5.0))
+    np.testing.assert_array_equal(lower, np.full((1, 5), 1.0))
+
+
+def test_early_abandon():
+    rng = np.random.RandomState(1)
+    x = rng.randn(2, 30)
+    y = rng.randn(2, 30)
+    dist = _dtw_distance(x, y, 0.2)
+    assert _dtw_distance(x, y, 0.2, dist) == dist
+    assert _dtw_distance(x, y, 0.2, dist / 2) == np.inf
+    upper, lower = _keogh_envelope(y, _sakoe_chiba_radius(30, 30, 0.2))
+    bound = _lb_keogh(x, upper, lower)
+    assert _lb_keogh(x, upper, lower, bound / 2) > bound / 2
@@ -149,3 +149,19 @@ def test_new_distances(dist):
         dist["distance"],
         _expected_distance_results[dist["name"]][6],
     )
+
+
+@pytest.mark.parametrize("dist", [d for d in DISTANCES if "cost_matrix" in d])
+@pytest.mark.parametrize("window", [None, 0.0, 0.1, 0.25, 1.0])
+def test_distance_matches_cost_matrix(dist, window):
+    """Test the band limited distance equals the last cell of the cost matrix."""
+    rng = np.random.RandomState(0)
+    for x_shape, y_shape in [
+        ((1, 20), (1, 20)),
+        ((3, 15), (3, 20)),
+        ((3, 20), (3, 15)),
+    ]:
+        x = rng.normal(size=x_shape)
+        y = rng.normal(size=y_shape)
+        cost_matrix = dist["cost_matrix"](x, y, window=window)
+        assert_almost_equal(dist["distance"](x, y, window=window), cost_matrix[-1, -1])
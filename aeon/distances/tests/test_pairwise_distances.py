@@ -8,8 +8,8 @@ from typing import Callable
 import numpy as np
 import pytest
 
-from aeon.distances._distance import _METRIC_INFOS, pairwise_distance
-from aeon.distances._numba_utils import _make_3d_series
+from aeon.distances._distance import _METRIC_INFOS, distance, pairwise_distance
+from aeon.distances._numba_utils import _make_3d_series, _pairwise_tiles
 from aeon.distances.base import MetricInfo, NumbaDistance
 from aeon.distances.tests._shared_tests import (
     _test_incorrect_parameters,
@@ -282,3 +282,62 @@ def test_metric_parameters():
 def test_incorrect_parameters():
     """Ensure incorrect parameters raise errors."""
     _test_incorrect_parameters(pairwise_distance)
+
+
+@pytest.mark.parametrize(
+    "metric", ["dtw", "ddtw", "wdtw", "erp", "edr", "lcss", "msm", "twe"]
+)
+def test_pairwise_distance_n_jobs(metric: str) -> None:
+    """Test the compiled pairwise distances are independent of n_jobs."""
+    x = create_test_distance_numpy(7, 1, 10)
+    y = create_test_distance_numpy(4, 1, 10, random_state=2)
+
+    to_self = pairwise_distance(x, metric=metric, window=0.2)
+    to_multiple = pairwise_distance(x, y, metric=metric, window=0.2)
+    assert np.array_equal(
+        to_self, pairwise_distance(x, metric=metric, window=0.2, n_jobs=2)
+    )
+    assert np.array_equal(
+        to_multiple, pairwise_distance(x, y, metric=metric, window=0.2, n_jobs=-1)
+    )
+
+    for i in range(len(x)):
+        for j in range(len(y)):
+            assert to_multiple[i, j] == pytest.approx(
+                distance(x[i], y[j], metric=metric, window=0.2)
+            )
+        for j in range(i + 1, len(x)):
+            assert to_self[i, j] == pytest.approx(
+                distance(x[i], x[j], metric=metric, window=0.2)
+            )
+            assert to_self[j, i] == to_self[i, j]
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (7, 4), (40, 40), (100, 3), (130, 130)])
+def test_pairwise_tiles(shape) -> None:
+    """Test the tiles of a pairwise matrix cover each distance exactly once."""
+    n_rows, n_cols = shape
+    for symmetric in [False, True] if n_rows == n_cols else [False]:
+        counts = np.zeros(shape, dtype=int)
+        for row_start, row_end, col_start, col_end in _pairwise_tiles(
+            n_rows, n_cols, symmetric
+        ):
+            assert row_end - row_start <= 32 and col_end - col_start <= 32
+            for i in range(row_start, row_end):
+                start = max(i + 1, col_start) if symmetric else col_start
+                counts[i, start:col_end] += 1
+        expected = np.triu(np.ones(shape), 1) if symmetric else np.ones(shape)
+        assert np.array_equal(counts, expected)
+
+
+@pytest.mark.parametrize(
+    "metric, params",
+    [("erp", {"g": 1}), ("edr", {"epsilon": 1}), ("lcss", {"epsilon": 1})],
+)
+def test_pairwise_distance_invalid_params(metric: str, params: dict) -> None:
+    """Test the compiled pairwise distances validate parameters like the factory."""
+    x = create_test_distance_numpy(5, 1, 10)
+    with pytest.raises(ValueError, match="must be a float"):
+        pairwise_distance(x, metric=metric, **params)
+    with pytest.raises(ValueError, match="must be a float"):
+        pairwise_distance(x, x[:2] + 1, metric=metric, **params)
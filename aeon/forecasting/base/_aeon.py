@@ -15,12 +15,19 @@ from aeon.utils.datetime import _shift
 
 
 class _BaseWindowForecaster(BaseForecaster):
-    """Base class for forecasters that use sliding windows."""
+    """Base class for forecasters that use sliding windows.
 
-    def __init__(self, window_length=None):
+    Window forecasters only use the latest window of the data seen to predict. A
+    subclass that exposes ``max_memory_length`` as a parameter passes it on here, to
+    bound the data remembered by fit and update, see the max_memory_length tag.
+    """
+
+    def __init__(self, window_length=None, max_memory_length=None):
         super(_BaseWindowForecaster, self).__init__()
         self.window_length = window_length
         self.window_length_ = None
+        if max_memory_length is not None:
+            self.set_tags(**{"max_memory_length": max_memory_length})
 
     def _predict(self, fh, X=None):
         """Predict core logic."""
@@ -56,6 +56,7 @@ from aeon.datatypes import (
     update_data,
 )
 from aeon.forecasting.base._fh import ForecastingHorizon
+from aeon.forecasting.base._memory import update_bounded_data
 from aeon.utils.datetime import _shift
 from aeon.utils.validation._dependencies import (
     _check_dl_dependencies,
@@ -100,6 +101,13 @@ class BaseForecaster(BaseEstimator):
         "fit_is_empty": False,  # is fit empty and can be skipped?
         "python_version": None,  # PEP 440 python version specifier to limit versions
         "python_dependencies": None,  # str or list of str, package soft dependencies
+        "max_memory_length": None,  # max number of time points remembered as _y/_X
+    }
+
+    # default config values, set with set_config, see aeon.registry._config
+    _config = {
+        "backend:parallel": None,  # backend for vectorization over series/columns
+        "backend:parallel:params": None,  # dict of params passed to parallel backend
     }
 
     def __init__(self):
@@ -107,6 +115,8 @@ class BaseForecaster(BaseEstimator):
 
         self._y = None
         self._X = None
+        self._y_memory = None
+        self._X_memory = None
 
         # forecasting horizon
         self._fh = None
@@ -801,6 +811,9 @@ class BaseForecaster(BaseEstimator):
 
         Writes to self:
             Update self._y and self._X with `y` and `X`, by appending rows.
+                If the max_memory_length tag is set, only the last
+                max_memory_length time points are kept. Forecasters set the tag
+                in __init__, e.g., from a max_memory_length parameter.
             Updates self.cutoff and self._cutoff to last index seen in `y`.
             If update_params=True,
                 updates fitted model attributes ending in "_".
@@ -988,6 +1001,9 @@ class BaseForecaster(BaseEstimator):
 
         Writes to self:
             Update self._y and self._X with `y` and `X`, by appending rows.
+                If the max_memory_length tag is set, only the last
+                max_memory_length time points are kept. Forecasters set the tag
+                in __init__, e.g., from a max_memory_length parameter.
             Updates self.cutoff and self._cutoff to last index seen in `y`.
             If update_params=True,
                 updates fitted model attributes ending in "_".
@@ -1507,6 +1523,11 @@ class BaseForecaster(BaseEstimator):
             this is only done if X is not None
         cutoff : is set to latest index seen in y
 
+        If the max_memory_length tag is not None, only the last max_memory_length
+        time points of each series are kept in _y and _X. In this case single series
+        are views of a preallocated buffer (see _memory._SeriesMemory), so the cost of
+        an update does not grow with the number of time points seen.
+
         _y and _X are guaranteed to be one of mtypes:
             pd.DataFrame, pd.Series, np.ndarray, pd-multiindex, numpy3D,
             pd_multiindex_hier
@@ -1518,12 +1539,21 @@ class BaseForecaster(BaseEstimator):
         X : pd.DataFrame or 2D np.ndarray, optional (default=None)
             Exogeneous time series
         """
+        max_memory_length = self.get_tag("max_memory_length", None, raise_error=False)
+
         if y is not None:
             # unwrap y if VectorizedDF
             if isinstance(y, VectorizedDF):
                 y = y.X_multiindex
             # if _y does not exist yet, initialize it with y
             if not hasattr(self, "_y") or self._y is None or not self.is_fitted:
+                self._y = None
+                self._y_memory = None
+            if max_memory_length is not None:
+                self._y, self._y_memory = update_bounded_data(
+                    self._y, y, max_memory_length, getattr(self, "_y_memory", None)
+                )
+            elif self._y is None:
                 self._y = y
             else:
                 self._y = update_data(self._y, y)
@@ -1537,6 +1567,13 @@ class BaseForecaster(BaseEstimator):
                 X = X.X_multiindex
             # if _X does not exist yet, initialize it with X
             if not hasattr(self, "_X") or self._X is None or not self.is_fitted:
+                self._X = None
+                self._X_memory = None
+            if max_memory_length is not None:
+                self._X, self._X_memory = update_bounded_data(
+                    self._X, X, max_memory_length, getattr(self, "_X_memory", None)
+                )
+            elif self._X is None:
                 self._X = X
             else:
                 self._X = update_data(self._X, X)
@@ -1743,6 +1780,9 @@ class BaseForecaster(BaseEstimator):
         kwargs["args_rowvec"] = {"X": X}
         kwargs["rowname_default"] = "forecasters"
         kwargs["colname_default"] = "forecasters"
+        config = self.get_config()
+        kwargs["backend"] = config["backend:parallel"]
+        kwargs["backend_params"] = config["backend:parallel:params"]
 
         # fit-like methods: write y to self._yvec; then run method; clone first if fit
         if methodname in FIT_METHODS:
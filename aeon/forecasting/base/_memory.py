@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# copyright: aeon developers, BSD-3-Clause License (see LICENSE file)
+"""Bounded memory of the most recent time points of a series seen by a forecaster.
+
+Used by BaseForecaster if the max_memory_length tag is set, in place of the
+concatenation of every update batch onto the remembered data.
+"""
+
+__all__ = ["_SeriesMemory", "update_bounded_data"]
+
+import numpy as np
+import pandas as pd
+
+from aeon.datatypes import update_data
+
+
+class _SeriesMemory:
+    """Preallocated buffer of the most recent rows of a single time series.
+
+    Rows are appended to a buffer twice the size of ``max_length``. Once the buffer is
+    full, the retained rows are moved to a new buffer, so appending is amortised
+    constant time per row. The remembered series is a view of the buffer of the same
+    type as the input, rows which are part of a view are never overwritten.
+
+    Supports pd.Series and pd.DataFrame with a single dtype and an integer,
+    tz-naive datetime or period index, and 1D or 2D np.ndarray. Use ``supports`` to
+    check whether data can be stored.
+
+    Parameters
+    ----------
+    max_length : int
+        The maximum number of time points (rows) retained.
+    """
+
+    def __init__(self, max_length):
+        self.max_length = max_length
+
+        self._values = None
+        self._index = None
+        self._start = 0
+        self._end = 0
+        self._view = None
+
+        self._container = None
+        self._index_kind = None
+        self._index_name = None
+        self._freq = None
+        self._name = None
+        self._columns = None
+
+    @staticmethod
+    def supports(X):
+        """Check whether X can be stored in a _SeriesMemory.
+
+        Parameters
+        ----------
+        X : object
+            The data to check.
+
+        Returns
+        -------
+        supported : bool
+            True if X is of a supported type, False otherwise.
+        """
+        if isinstance(X, np.ndarray):
+            return X.ndim in [1, 2]
+        if isinstance(X, pd.DataFrame):
+            if len(set(X.dtypes)) > 1:
+                return False
+        elif not isinstance(X, pd.Series):
+            return False
+        return _index_kind(X.index) is not None
+
+    def update(self, X):
+        """Append the rows of X to the memory and return the remembered series.
+
+        If X does not directly follow the remembered rows (e.g. it overwrites
+        previously seen time points), or its columns or index type differ, X is merged
+        with the remembered rows using update_data and the memory is reloaded.
+
+        Parameters
+        ----------
+        X : pd.Series, pd.DataFrame or np.ndarray
+            The new rows, must be supported by the memory.
+
+        Returns
+        -------
+        X_memory : same type as X
+            The last max_length rows seen, a view of the buffer.
+        """
+        if self._values is None:
+            self._load(X)
+        else:
+            values = X if isinstance(X, np.ndarray) else X.to_numpy()
+            index = None if isinstance(X, np.ndarray) else _index_values(X.index)
+            if self._appends(X, values, index):
+                self._append(X, values, index)
+            else:
+                self._load(update_data(self.view(), X))
+
+        self._view = self.view()
+        return self._view
+
+    def view(self):
+        """Return the remembered series as a view of the buffer.
+
+        Returns
+        -------
+        X_memory : same type as the stored data, or None if nothing is stored
+            The last max_length rows seen.
+        """
+        if self._values is None:
+            return None
+
+        values = self._values[self._start : self._end]
+        if self._container == "ndarray":
+            return values
+
+        index = self._index_view()
+        if self._container == "Series":
+            return pd.Series(values, index=index, name=self._name, copy=False)
+        return pd.DataFrame(values, index=index, columns=self._columns, copy=False)
+
+    def _load(self, X):
+        if isinstance(X, np.ndarray):
+            self._container = "ndarray"
+            values = X
+        else:
+            self._container = "Series" if isinstance(X, pd.Series) else "DataFrame"
+            self._index_kind = _index_kind(X.index)
+            self._index_name = X.index.name
+            self._freq = getattr(X.index, "freq", None)
+            self._name = getattr(X, "name", None)
+            self._columns = getattr(X, "columns", None)
+            values = X.to_numpy()
+
+        n_rows = min(len(values), self.max_length)
+        capacity = 2 * self.max_length
+        self._values = np.empty((capacity,) + values.shape[1:], dtype=values.dtype)
+        self._values[:n_rows] = values[len(values) - n_rows :]
+        if self._container != "ndarray":
+            index = _index_values(X.index)
+            self._index = np.empty(capacity, dtype=index.dtype)
+            self._index[:n_rows] = index[len(index) - n_rows :]
+        self._start = 0
+        self._end = n_rows
+
+    def _appends(self, X, values, index):
+        """Check whether X can be appended to the buffer without merging."""
+        if values.shape[1:] != self._values.shape[1:]:
+            return False
+        if not np.can_cast(values.dtype, self._values.dtype, casting="same_kind"):
+            return False
+        if self._container == "ndarray":
+            return isinstance(X, np.ndarray)
+
+        if self._container == "Series":
+            if not isinstance(X, pd.Series) or X.name != self._name:
+                return False
+        elif not isinstance(X, pd.DataFrame) or not X.columns.equals(self._columns):
+            return False
+        if _index_kind(X.index) != self._index_kind:
+            return False
+        if self._index_kind == "period" and X.index.freq != self._freq:
+            return False
+
+        if len(index) == 0:
+            return True
+        if not (index[1:] > index[:-1]).all():
+            return False
+        return self._end == self._start or index[0] > self._index[self._end - 1]
+
+    def _append(self, X, values, index):
+        n_new = len(values)
+        if n_new >= self.max_length:
+            self._load(X)
+            return
+
+        if self._end + n_new > len(self._values):
+            # move the retained rows to a new buffer, previous views stay valid
+            n_keep = min(self._end - self._start, self.max_length - n_new)
+            start = self._end - n_keep
+            buffer = np.empty_like(self._values)
+            buffer[:n_keep] = self._values[start : self._end]
+            self._values = buffer
+            if index is not None:
+                index_buffer = np.empty_like(self._index)
+                index_buffer[:n_keep] = self._index[start : self._end]
+                self._index = index_buffer
+            self._start = 0
+            self._end = n_keep
+
+        self._values[self._end : self._end + n_new] = values
+        if index is not None:
+            self._index[self._end : self._end + n_new] = index
+        self._end += n_new
+        self._start = max(self._start, self._end - self.max_length)
+
+    def _index_view(self):
+        index = self._index[self._start : self._end]
+        if self._index_kind == "period":
+            return pd.PeriodIndex(
+                pd.arrays.PeriodArray(index, dtype=pd.PeriodDtype(self._freq)),
+                name=self._index_name,
+            )
+        if self._index_kind == "datetime":
+            try:
+                return pd.DatetimeIndex(index, freq=self._freq, name=self._index_name)
+            except ValueError:
+                # the appended rows do not follow the frequency of the first rows
+                self._freq = None
+                return pd.DatetimeIndex(index, name=self._index_name)
+        return pd.Index(index, name=self._index_name, copy=False)
+
+
+def _index_kind(index):
+    if isinstance(index, pd.PeriodIndex):
+        return "period"
+    if isinstance(index, pd.DatetimeIndex):
+        return "datetime" if index.tz is None else None
+    if pd.api.types.is_integer_dtype(index) and not isinstance(index, pd.MultiIndex):
+        return "integer"
+    return None
+
+
+def _index_values(index):
+    if isinstance(index, pd.PeriodIndex):
+        return index.asi8
+    return index.to_numpy()
+
+
+def update_bounded_data(X, X_new, max_length, memory=None):
+    """Update time series container with another one, keeping the most recent rows.
+
+    Bounded version of update_data. Series are stored in a _SeriesMemory if they
+    are supported, other containers are updated using update_data and truncated to the
+    last max_length time points of each series.
+
+    Parameters
+    ----------
+    X : None, or aeon data container
+        The current data, as returned by a previous call.
+    X_new : None, or aeon data container
+        The new data, should be of the same mtype as X.
+    max_length : int
+        The maximum number of time points retained for each series.
+    memory : _SeriesMemory or None, default=None
+        The memory X is a view of, as returned by a previous call. Ignored if X is not
+        the last view returned by the memory, e.g. if X has been replaced since.
+
+    Returns
+    -------
+    X : aeon data container
+        X updated with X_new and truncated to the last max_length time points.
+    memory : _SeriesMemory or None
+        The memory X is a view of, None if X is not stored in a memory.
+    """
+    if X_new is None:
+        return X, memory
+
+    if memory is not None and (
+        memory._view is not X or memory.max_length != max_length
+    ):
+        memory = None
+
+    if memory is not None:
+        if _SeriesMemory.supports(X_new):
+            return memory.update(X_new), memory
+    elif X is None and _SeriesMemory.supports(X_new):
+        memory = _SeriesMemory(max_length)
+        return memory.update(X_new), memory
+
+    X = update_data(X, X_new)
+    if _SeriesMemory.supports(X):
+        memory = _SeriesMemory(max_length)
+        return memory.update(X), memory
+
+    if isinstance(X, np.ndarray):
+        # numpy3D, time is the last axis
+        return X[..., -max_length:], None
+    if isinstance(X.index, pd.MultiIndex):
+        instances = list(range(X.index.nlevels - 1))
+        return X.groupby(level=instances, sort=False).tail(max_length), None
+    return X.iloc[-max_length:], None
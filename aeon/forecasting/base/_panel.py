@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# copyright: aeon developers, BSD-3-Clause License (see LICENSE file)
+"""Utilities for forecasters fitting all series of a panel at once.
+
+Simple forecasters which support the pd-multiindex and pd_multiindex_hier mtypes
+convert panel data to a 2D array of shape (n_instances, n_timepoints) and fit and
+predict all series with array operations, in place of one clone per series. Panels
+which cannot be stored in such an array are handled by per-series clones, as in the
+vectorization of BaseForecaster.
+"""
+
+__all__ = [
+    "_panel_values",
+    "_panel_cutoff",
+    "_panel_prediction",
+    "_vectorize_panel",
+    "_restrict_to_series_mtypes",
+]
+
+from copy import copy
+
+import numpy as np
+import pandas as pd
+
+from aeon.datatypes import VectorizedDF, mtype_to_scitype
+
+
+def _panel_values(y, regular=False):
+    """Convert a univariate panel to a 2D array of right-aligned series.
+
+    All series must end at the same time point and have no missing time points
+    between their first time point and the end of the panel, so that the time index of
+    each series is a suffix of the time index of the panel. Series are padded with NaN
+    on the left to the length of the longest series.
+
+    Parameters
+    ----------
+    y : pd.DataFrame with MultiIndex
+        A univariate panel or hierarchical time series, of pd-multiindex or
+        pd_multiindex_hier mtype.
+    regular : bool, default=False
+        Whether the time index of the panel must also be regular, i.e. consecutive
+        integers or periods, or equally spaced time stamps. A time stamp index must
+        always be regular, its frequency is required to construct predictions.
+
+    Returns
+    -------
+    values : 2D np.ndarray of shape (n_instances, n_timepoints), or None
+        The values of each series, sorted by instance. None if the series are not
+        aligned as required.
+    n_obs : 1D np.ndarray of int of shape (n_instances,)
+        The number of time points of each series.
+    instances : pd.Index
+        The instance index, the last level of the row index removed.
+    times : pd.Index
+        The sorted time index of the panel.
+    """
+    inst_codes, instances = pd.factorize(y.index.droplevel(-1), sort=True)
+    time_codes, times = pd.factorize(y.index.get_level_values(-1), sort=True)
+    n_instances, n_timepoints = len(instances), len(times)
+
+    n_obs = np.bincount(inst_codes, minlength=n_instances)
+    # the time point of each row must be in the suffix of its series, and the series
+    # may not contain duplicate time points
+    first = n_timepoints - n_obs
+    if (time_codes < first[inst_codes]).any():
+        return None, n_obs, instances, times
+    if len(np.unique(inst_codes * n_timepoints + time_codes)) != len(y):
+        return None, n_obs, instances, times
+    if (regular or isinstance(times, pd.DatetimeIndex)) and not _is_regular(times):
+        return None, n_obs, instances, times
+
+    values = np.full((n_instances, n_timepoints), np.nan)
+    values[inst_codes, time_codes] = y.to_numpy(dtype=np.float64).ravel()
+    return values, n_obs, instances, times
+
+
+def _is_regular(times):
+    if isinstance(times, pd.DatetimeIndex):
+        return len(times) > 2 and times.inferred_freq is not None
+    if len(times) < 2:
+        return True
+    if isinstance(times, pd.PeriodIndex) or pd.api.types.is_integer_dtype(times):
+        return (times[:-1] + 1).equals(times[1:])
+    return False
+
+
+def _panel_cutoff(cutoff, times):
+    """Set the frequency of the cutoff of a panel to the frequency of its time index.
+
+    Parameters
+    ----------
+    cutoff : pd.Index
+        The cutoff of the forecaster, the last time point of the panel.
+    times : pd.Index
+        The time index of the panel, as returned by _panel_values.
+
+    Returns
+    -------
+    cutoff : pd.Index
+        The cutoff, with frequency if it is a time stamp.
+    """
+    if isinstance(cutoff, pd.DatetimeIndex) and cutoff.freq is None:
+        cutoff = pd.DatetimeIndex(cutoff, freq=times.inferred_freq)
+    return cutoff
+
+
+def _panel_prediction(y_pred, instances, fh_idx, y):
+    """Construct the panel of predictions of all series at the same time points.
+
+    Parameters
+    ----------
+    y_pred : 2D np.ndarray of shape (n_instances, len(fh_idx))
+        The predictions for each series.
+    instances : pd.Index
+        The instance index, as returned by _panel_values.
+    fh_idx : pd.Index
+        The time points predicted for each series.
+    y : pd.DataFrame with MultiIndex
+        The panel the predictions are made for, used for the column and index names.
+
+    Returns
+    -------
+    y_pred : pd.DataFrame with MultiIndex
+        The predictions, rows sorted by instance and time point.
+    """
+    n_instances, n_steps = y_pred.shape
+    instance_idx = instances.repeat(n_steps)
+    if isinstance(instance_idx, pd.MultiIndex):
+        levels = [instance_idx.get_level_values(i) for i in range(instances.nlevels)]
+    else:
+        levels = [instance_idx]
+    levels.append(fh_idx[np.tile(np.arange(n_steps), n_instances)])
+
+    index = pd.MultiIndex.from_arrays(levels, names=y.index.names)
+    return pd.DataFrame(y_pred.reshape(-1, 1), index=index, columns=y.columns)
+
+
+def _vectorize_panel(forecaster, methodname, **kwargs):
+    """Call a method of clones of forecaster fitted to each series of its panel.
+
+    The clones are fitted to the series of the panel the forecaster remembers. They are
+    kept by the forecaster if methodname is "fit", other methods reuse them if the
+    remembered data has not changed since, and otherwise fit clones of a copy of the
+    forecaster, so that they do not change its state.
+
+    Parameters
+    ----------
+    forecaster : BaseForecaster
+        A fitted forecaster, the data it remembers must be a panel.
+    methodname : str
+        The method to call, "fit" to only fit the clones.
+    kwargs : dict
+        Arguments passed to the method, exogenous data is ignored.
+
+    Returns
+    -------
+    result : pd.DataFrame with MultiIndex, or forecaster if methodname is "fit"
+        The output of the method, concatenated over all series.
+    """
+    y = forecaster._y
+    yvec = getattr(forecaster, "_yvec", None)
+    if methodname != "fit" and (yvec is None or yvec.X is not y):
+        # only fit changes the state, other methods fit the clones of a copy
+        forecaster = copy(forecaster)
+        yvec = None
+    if yvec is None or yvec.X is not y:
+        scitype = "Hierarchical" if y.index.nlevels > 2 else "Panel"
+        yvec = VectorizedDF(X=y, iterate_as="Series", is_scitype=scitype)
+        forecaster._vectorize("fit", y=yvec, X=None, fh=forecaster._fh)
+    if methodname == "fit":
+        return forecaster
+
+    kwargs.pop("X", None)
+    return forecaster._vectorize(methodname, X=None, **kwargs)
+
+
+def _restrict_to_series_mtypes(forecaster):
+    """Restrict the inner mtypes of a forecaster to its Series mtypes.
+
+    Used by forecasters which compute residuals of their wrapped forecaster per series,
+    so that panels are vectorized by BaseForecaster. The y_inner_mtype and
+    X_inner_mtype tags are left unchanged if they contain no Series mtype.
+
+    Parameters
+    ----------
+    forecaster : BaseForecaster
+        The forecaster whose tags are set, in __init__ after cloning the tags of the
+        wrapped forecaster.
+    """
+    for tag in ["y_inner_mtype", "X_inner_mtype"]:
+        mtypes = forecaster.get_tag(tag)
+        mtypes = [mtypes] if isinstance(mtypes, str) else mtypes
+        series_mtypes = [x for x in mtypes if mtype_to_scitype(x) == "Series"]
+        if len(series_mtypes) > 0:
+            forecaster.set_tags(**{tag: series_mtypes})
@@ -315,3 +315,65 @@ def test_predict_residuals():
     y_pred_2 = forecaster.predict()
     assert_series_equal(y_pred_1, y_pred_2)
     assert y_resid.index.equals(y_train.index)
+
+
+@pytest.mark.parametrize("n_columns", [1, 2])
+@pytest.mark.parametrize("index_type", ["int", "datetime", "period"])
+def test_max_memory_length(n_columns, index_type):
+    """Test that max_memory_length bounds the data remembered by fit and update."""
+    from aeon.forecasting.naive import NaiveForecaster
+
+    y = _make_series(n_timepoints=300, n_columns=n_columns, index_type=index_type)
+    if index_type == "int":
+        y.index = pd.RangeIndex(300)
+
+    forecaster = NaiveForecaster(max_memory_length=40)
+    forecaster.fit(y.iloc[:100], fh=[1, 2])
+    assert forecaster._y.equals(y.iloc[60:100])
+
+    y_memory = []
+    for i in range(100, 250, 10):
+        forecaster.update(y.iloc[i : i + 10], update_params=False)
+        y_memory.append(forecaster._y)
+    assert len(forecaster._y) == 40
+    assert forecaster._y.equals(y.iloc[210:250])
+    assert y_memory[0].equals(y.iloc[70:110])
+
+    y_pred = forecaster.predict()
+    assert y_pred.equals(NaiveForecaster().fit(y.iloc[:250], fh=[1, 2]).predict())
+
+    # updates overlapping the remembered data overwrite it
+    y_new = y.iloc[245:255] * 2
+    forecaster.update(y_new, update_params=False)
+    assert forecaster._y.equals(pd.concat([y.iloc[215:245], y_new]))
+
+
+def test_max_memory_length_survives_fit():
+    """Test that the max_memory_length parameter is kept as a tag by fit and reset."""
+    from aeon.forecasting.naive import NaiveForecaster
+
+    y = _make_series(n_timepoints=50, n_columns=1)
+    forecaster = NaiveForecaster(strategy="mean", window_length=5, max_memory_length=8)
+    forecaster.fit(y)
+    forecaster.fit(y)
+    assert forecaster.get_tag("max_memory_length") == 8
+    assert len(forecaster._y) == 8
+    assert forecaster.clone().get_tag("max_memory_length") == 8
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"strategy": "mean", "max_memory_length": 10},
+        {"strategy": "drift", "max_memory_length": 10},
+        {"strategy": "mean", "window_length": 12, "max_memory_length": 10},
+        {"strategy": "last", "sp": 12, "max_memory_length": 10},
+    ],
+)
+def test_max_memory_length_too_short(params):
+    """Test that max_memory_length must cover the data used by the strategy."""
+    from aeon.forecasting.naive import NaiveForecaster
+
+    y = _make_series(n_timepoints=50, n_columns=1)
+    with pytest.raises(ValueError, match="max_memory_length"):
+        NaiveForecaster(**params).fit(y)
@@ -30,6 +30,7 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.base import clone
 from sklearn.multioutput import MultiOutputRegressor
 
@@ -119,30 +120,34 @@ def _sliding_window_transform(
         Transformed lagged values of target variable and exogenous variables,
         excluding contemporaneous values.
     """
-    # There are different ways to implement this transform. Pre-allocating an
-    # array and filling it by iterating over the window length seems to be the most
-    # efficient one.
-
     ts_index = get_time_index(y)
     n_timepoints = ts_index.shape[0]
     window_length = check_window_length(window_length, n_timepoints)
 
     if pooling == "global":
-        if len(transformers) == 1:
-            tf_fit = transformers[0].fit(y)
+        lag_transform = _global_lag_transform(
+            y, X, transformers, n_obs=n_timepoints - window_length
+        )
+        if lag_transform is not None:
+            yt, Xt = lag_transform
         else:
-            feat = [("trafo_" + str(index), i) for index, i in enumerate(transformers)]
-            tf_fit = FeatureUnion(feat).fit(y)
-        X_from_y = tf_fit.transform(y)
+            if len(transformers) == 1:
+                tf_fit = transformers[0].fit(y)
+            else:
+                feat = [
+                    ("trafo_" + str(index), i) for index, i in enumerate(transformers)
+                ]
+                tf_fit = FeatureUnion(feat).fit(y)
+            X_from_y = tf_fit.transform(y)
 
-        X_from_y_cut = _cut_df(X_from_y, n_obs=n_timepoints - window_length)
-        yt = _cut_df(y, n_obs=n_timepoints - window_length)
+            X_from_y_cut = _cut_df(X_from_y, n_obs=n_timepoints - window_length)
+            yt = _cut_df(y, n_obs=n_timepoints - window_length)
 
-        if X is not None:
-            X_cut = _cut_df(X, n_obs=n_timepoints - window_length)
-            Xt = pd.concat([X_from_y_cut, X_cut], axis=1)
-        else:
-            Xt = X_from_y_cut
+            if X is not None:
+                X_cut = _cut_df(X, n_obs=n_timepoints - window_length)
+                Xt = pd.concat([X_from_y_cut, X_cut], axis=1)
+            else:
+                Xt = X_from_y_cut
     else:
         z = _concat_y_X(y, X)
         n_timepoints, n_variables = z.shape
@@ -157,32 +162,24 @@ def _sliding_window_transform(
 
         # Get the effective window length accounting for the forecasting horizon.
         effective_window_length = window_length + fh_max
-        Zt = np.zeros(
-            (
-                n_timepoints + effective_window_length,
-                n_variables,
-                effective_window_length + 1,
-            )
-        )
+        z = np.asarray(z, dtype=np.float64)
 
-        # Transform data.
-        for k in range(effective_window_length + 1):
-            i = effective_window_length - k
-            j = n_timepoints + effective_window_length - k
-            Zt[i:j, :, k] = z
+        # If windows are not identical, the windows starting in the last fh_max time
+        # points are kept, their target values past the end of y are zero.
+        if windows_identical is not True:
+            z = np.concatenate([z, np.zeros((fh_max, n_variables))])
+
+        # Read-only view of all full windows, of shape
+        # (n_windows, n_variables, effective_window_length + 1). No data is copied
+        # until the tabular features are reshaped below.
+        Zt = sliding_window_view(z, effective_window_length + 1, axis=0)
 
-        # Truncate data, selecting only full windows, discarding incomplete ones.
-        if windows_identical is True:
-            Zt = Zt[effective_window_length:-effective_window_length]
-        else:
-            Zt = Zt[effective_window_length:-window_length]
         # Return transformed feature and target variables separately. This
         # excludes contemporaneous values of the exogenous variables. Including them
         # would lead to unequal-length data, with more time points for
         # exogenous series than the target series, which is currently not supported.
         yt = Zt[:, 0, window_length + fh]
         Xt = Zt[:, :, :window_length]
-    # Pre-allocate array for sliding windows.
     # If the scitype is tabular regression, we have to convert X into a 2d array.
     if scitype == "tabular-regressor":
         if transformers is not None:
@@ -193,6 +190,82 @@ def _sliding_window_transform(
         return yt, Xt
 
 
+def _global_lag_transform(y, X, transformers, n_obs):
+    """Lag features of all instances for global pooling, without pandas transforms.
+
+    Used in place of applying the transformers if these are a single WindowSummarizer
+    computing lags of a univariate y, such as the default transformer for global
+    pooling. The features and target of the last n_obs time points of each instance
+    are gathered from the values of y.
+
+    Parameters
+    ----------
+    y : pd.Series or pd.DataFrame
+        Endogenous time series, with a MultiIndex if there are multiple instances.
+        The rows of each instance must be contiguous.
+    X : pd.DataFrame or None
+        Exogenous time series, with the same index as y.
+    transformers : list of transformers
+        The transformers used to derive the features from y.
+    n_obs : int
+        The number of time points kept for each instance.
+
+    Returns
+    -------
+    yt, Xt : pd.Series or pd.DataFrame, and pd.DataFrame, or None
+        The target and features, equal to the (cut) output of the transformers
+        concatenated with X. None if the transformers are not only lags, or y and X
+        are not supported.
+    """
+    if transformers is None or len(transformers) != 1 or n_obs <= 0:
+        return None
+    transformer = transformers[0]
+    if not isinstance(transformer, WindowSummarizer) or transformer.truncate:
+        return None
+    if isinstance(y, pd.DataFrame) and y.shape[1] != 1:
+        return None
+    if X is not None and not X.index.equals(y.index):
+        return None
+
+    transformer.fit(y)
+    func_dict = transformer._func_dict
+    if (func_dict["summarizer"] != "lag").any():
+        return None
+    lags = np.array([window[0] for window in func_dict["window"]], dtype=np.int_)
+    if len(lags) == 0 or lags.min() < 1:
+        return None
+    columns = [f"{transformer._target_cols[0]}_lag_{lag}" for lag in lags]
+
+    # positions of the first and last row of the instance of each row
+    values = y.to_numpy(dtype=np.float64).reshape(-1)
+    n_rows = len(values)
+    if isinstance(y.index, pd.MultiIndex):
+        codes, uniques = pd.factorize(y.index.droplevel(-1))
+        changes = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        if len(changes) != len(uniques) - 1:
+            return None
+        starts = np.concatenate([[0], changes])
+    else:
+        starts = np.array([0])
+    ends = np.concatenate([starts[1:], [n_rows]])
+    row_starts = np.repeat(starts, ends - starts)
+    row_ends = np.repeat(ends, ends - starts)
+
+    # keep the last n_obs rows of each instance, lags before its start are missing
+    rows = np.flatnonzero(row_ends - np.arange(n_rows) <= n_obs)
+    lagged = rows[:, np.newaxis] - lags
+    features = values[np.maximum(lagged, 0)]
+    features[lagged < row_starts[rows, np.newaxis]] = np.nan
+
+    index = y.index[rows]
+    if X is not None:
+        features = np.column_stack([features, X.to_numpy()[rows]])
+        columns = columns + list(X.columns)
+    Xt = pd.DataFrame(features, index=index, columns=columns)
+    yt = y.iloc[rows]
+    return yt, Xt
+
+
 class _Reducer(_BaseWindowForecaster):
     """Base class for reducing forecasting to regression."""
 
@@ -2197,6 +2270,7 @@ class RecursiveReductionForecaster(BaseForecaster, _ReducerMixin):
             estimator = clone(self.estimator)
             estimator.fit(Xtt, yt)
             self.estimator_ = estimator
+            self._feature_names = Xtt.columns
 
         return self
 
@@ -2244,7 +2318,73 @@ class RecursiveReductionForecaster(BaseForecaster, _ReducerMixin):
         return y_pred
 
     def _predict_out_of_sample(self, X_pool, fh):
-        """Recursive reducer: predict out of sample (ahead of cutoff)."""
+        """Recursive reducer: predict out of sample (ahead of cutoff).
+
+        If the last window_length time points before the cutoff are observed for all
+        instances, the lagged features are read from a buffer of the last window and
+        the predictions, one prediction step for all instances at a time. Otherwise,
+        the features are obtained by applying the lag transformer and imputation to
+        the data and predictions in each step.
+        """
+        fh_idx = self._get_expected_pred_idx(fh=fh)
+        y_cols = self._y.columns
+        estimator = self.estimator_
+        window_length = self.window_length
+
+        fh_rel = fh.to_relative(self.cutoff)
+        y_lags_no_gaps = list(range(1, list(fh_rel)[-1] + 1))
+        y_abs_no_gaps = ForecastingHorizon(
+            y_lags_no_gaps, is_relative=True, freq=self._cutoff
+        )
+        y_abs_no_gaps = y_abs_no_gaps.to_absolute(self._cutoff).to_pandas()
+
+        if isinstance(estimator, pd.Series):
+            return self._predict_out_of_sample_lagged(X_pool, fh)
+
+        # the last window, which has to be fully observed for all instances
+        window_idx = ForecastingHorizon(
+            list(range(1 - window_length, 1)), is_relative=True, freq=self._cutoff
+        )
+        window_idx = window_idx.to_absolute(self._cutoff).to_pandas()
+        window_idx = self._get_expected_pred_idx(fh=window_idx)
+        if not self._y.index.is_unique:
+            return self._predict_out_of_sample_lagged(X_pool, fh)
+        window = self._y.reindex(window_idx).to_numpy(dtype=np.float64)
+        if np.isnan(window).any():
+            return self._predict_out_of_sample_lagged(X_pool, fh)
+
+        n_steps = len(y_abs_no_gaps)
+        n_columns = len(y_cols)
+        n_instances = len(window_idx) // window_length
+
+        if X_pool is not None:
+            X_idx = self._get_expected_pred_idx(fh=y_abs_no_gaps)
+            X_steps = X_pool.loc[X_idx].to_numpy()
+            X_steps = X_steps.reshape(n_steps, n_instances, -1)
+
+        # buffer of the last window followed by the predictions, oldest first
+        y_buffer = np.empty((window_length + n_steps, n_instances, n_columns))
+        y_buffer[:window_length] = window.reshape(window_length, n_instances, -1)
+
+        for i in range(n_steps):
+            # lag 0 is the latest time point, columns are ordered by lag then variable
+            lags = y_buffer[i : i + window_length][::-1]
+            Xt = lags.transpose(1, 0, 2).reshape(n_instances, -1)
+            if X_pool is not None:
+                Xt = np.concatenate([X_steps[i], Xt], axis=1)
+            Xt = pd.DataFrame(Xt, columns=self._feature_names)
+            y_pred_i = np.asarray(estimator.predict(Xt), dtype=np.float64)
+            y_buffer[window_length + i] = y_pred_i.reshape(n_instances, n_columns)
+
+        y_pred = y_buffer[window_length:].reshape(-1, n_columns)
+        y_pred_idx = self._get_expected_pred_idx(fh=y_abs_no_gaps)
+        y_pred = pd.DataFrame(y_pred, columns=y_cols, index=y_pred_idx)
+        y_pred = y_pred.loc[fh_idx]
+
+        return y_pred
+
+    def _predict_out_of_sample_lagged(self, X_pool, fh):
+        """Recursive reducer: predict out of sample by lagging the predictions."""
         # very similar to _predict_concurrent of DirectReductionForecaster - refactor?
         from aeon.transformations.series.impute import Imputer
         from aeon.transformations.series.lag import Lag
@@ -27,7 +27,10 @@ from aeon.forecasting.compose import (
     RecursiveTimeSeriesRegressionForecaster,
     make_reduction,
 )
-from aeon.forecasting.compose._reduce import _sliding_window_transform
+from aeon.forecasting.compose._reduce import (
+    RecursiveReductionForecaster,
+    _sliding_window_transform,
+)
 from aeon.forecasting.model_selection import (
     SlidingWindowSplitter,
     temporal_train_test_split,
@@ -39,6 +42,7 @@ from aeon.regression.base import BaseRegressor
 from aeon.regression.interval_based import TimeSeriesForestRegressor
 from aeon.transformations.panel.reduce import Tabularizer
 from aeon.utils._testing.forecasting import make_forecasting_problem
+from aeon.utils._testing.hierarchical import _make_hierarchical
 from aeon.utils.validation.forecasting import check_fh
 
 N_TIMEPOINTS = [13, 17]
@@ -589,3 +593,41 @@ def test_direct_vs_recursive():
     assert pred_dir_max.head(1).equals(pred_rec_max.head(1))
     assert pred_dir_max.head(1).equals(pred_rec_spec.head(1))
     assert not pred_dir_max.head(1).equals(pred_dir_spec.head(1))
+
+
+@pytest.mark.parametrize("exogenous", [True, False])
+def test_recursive_reduction_window_predictions(exogenous):
+    """Test RecursiveReductionForecaster window buffer against lagged predictions."""
+    y = load_airline().to_frame()
+    X = pd.DataFrame({"x": np.arange(len(y))}, index=y.index) if exogenous else None
+    y_train, _ = temporal_train_test_split(y, test_size=24)
+    X_train, X_test = None, None
+    if exogenous:
+        X_train, X_test = temporal_train_test_split(X, test_size=24)
+
+    forecaster = RecursiveReductionForecaster(LinearRegression(), window_length=12)
+    forecaster.fit(y_train, X=X_train, fh=[1, 2, 5, 12, 24])
+    y_pred = forecaster.predict(X=X_test)
+
+    y_pred_lagged = forecaster._predict_out_of_sample_lagged(X, forecaster.fh)
+    pd.testing.assert_frame_equal(y_pred, y_pred_lagged)
+
+
+def test_recursive_reduction_global_pooling():
+    """Test RecursiveReductionForecaster predicts all instances with global pooling."""
+    y = _make_hierarchical(hierarchy_levels=(3,), min_timepoints=20, max_timepoints=20)
+
+    forecaster = RecursiveReductionForecaster(
+        LinearRegression(), window_length=3, pooling="global"
+    )
+    forecaster.fit(y, fh=[1, 2, 3])
+    y_pred = forecaster.predict()
+    y_pred_idx = forecaster._get_expected_pred_idx(forecaster.fh)
+    assert y_pred.index.equals(y_pred_idx.sort_values())
+
+    for instance in y.index.droplevel(-1).unique():
+        window = list(y.loc[instance].iloc[-3:, 0])
+        for _ in range(3):
+            Xt = pd.DataFrame([window[:-4:-1]], columns=forecaster._feature_names)
+            window.append(np.ravel(forecaster.estimator_.predict(Xt))[0])
+        np.testing.assert_allclose(y_pred.loc[instance].iloc[:, 0], window[3:])
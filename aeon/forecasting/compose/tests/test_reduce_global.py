@@ -304,3 +304,32 @@ def test_nofreq_pass():
     np.testing.assert_almost_equal(
         y_pred_global["c0"].values, y_pred_nofreq["c0"].values
     )
+
+
+@pytest.mark.parametrize("exogenous", [True, False])
+def test_global_lag_transform(exogenous):
+    """Test global lag features are equal to those of WindowSummarizer."""
+    from aeon.forecasting.compose._reduce import _cut_df, _global_lag_transform
+
+    y = _make_hierarchical(
+        hierarchy_levels=(2, 3), min_timepoints=20, max_timepoints=20, random_state=0
+    )
+    y.iloc[4, 0] = np.nan
+    X = None
+    if exogenous:
+        X = _make_hierarchical(
+            hierarchy_levels=(2, 3),
+            min_timepoints=20,
+            max_timepoints=20,
+            n_columns=2,
+            random_state=1,
+        )
+
+    transformer = WindowSummarizer(lag_feature={"lag": [3, 1, 5]}, n_jobs=1)
+    yt, Xt = _global_lag_transform(y, X, [transformer], n_obs=15)
+
+    Xt_expected = _cut_df(transformer.fit_transform(y), n_obs=15)
+    if exogenous:
+        Xt_expected = pd.concat([Xt_expected, _cut_df(X, n_obs=15)], axis=1)
+    pd.testing.assert_frame_equal(yt, _cut_df(y, n_obs=15))
+    pd.testing.assert_frame_equal(Xt, Xt_expected)
@@ -19,6 +19,7 @@ from sklearn.base import clone
 from aeon.datatypes import convert, convert_to
 from aeon.datatypes._utilities import get_slice
 from aeon.forecasting.base import BaseForecaster
+from aeon.forecasting.base._panel import _restrict_to_series_mtypes
 
 
 class ConformalIntervals(BaseForecaster):
@@ -141,6 +142,9 @@ class ConformalIntervals(BaseForecaster):
         ]
         self.clone_tags(self.forecaster, tags_to_clone)
 
+        # residuals are computed per series, panels are vectorized
+        _restrict_to_series_mtypes(self)
+
     def _fit(self, y, X=None, fh=None):
         self.fh_early_ = fh is not None
         self.forecaster_ = clone(self.forecaster)
@@ -6,8 +6,15 @@
 
 import numpy as np
 import pandas as pd
+from numba import njit
 
 from aeon.forecasting.base import BaseForecaster
+from aeon.forecasting.base._panel import (
+    _panel_cutoff,
+    _panel_prediction,
+    _panel_values,
+    _vectorize_panel,
+)
 
 
 class Croston(BaseForecaster):
@@ -43,6 +50,9 @@ class Croston(BaseForecaster):
         - The :math:`v`'s are :math:`2,7,-5`
         - The :math:`z`'s are :math:`3,1,4`
 
+    Panel and hierarchical data are fitted at once if all series end at the same time
+    point, otherwise one clone is fitted per series.
+
     Parameters
     ----------
     smoothing : float, default = 0.1
@@ -71,6 +81,8 @@ class Croston(BaseForecaster):
     """
 
     _tags = {
+        "y_inner_mtype": ["pd.Series", "pd-multiindex", "pd_multiindex_hier"],
+        "X_inner_mtype": ["pd.DataFrame", "pd-multiindex", "pd_multiindex_hier"],
         "requires-fh-in-fit": False,  # is forecasting horizon already required in fit?
     }
 
@@ -85,8 +97,9 @@ class Croston(BaseForecaster):
 
         Parameters
         ----------
-        y : pd.Series
-            Target time series to which to fit the forecaster.
+        y : pd.Series, or pd.DataFrame with MultiIndex
+            Target time series, or panel of time series, to which to fit the
+            forecaster.
         fh : int, list or np.array, optional (default=None)
             The forecasters horizon with the steps ahead to to predict.
         X : pd.DataFrame, optional (default=None)
@@ -96,33 +109,18 @@ class Croston(BaseForecaster):
         -------
         self : returns an instance of self.
         """
-        n_timepoints = len(y)  # Historical period: i.e the input array's length
-        smoothing = self.smoothing
+        if isinstance(y.index, pd.MultiIndex):
+            values, n_obs, self._instances, self._times = _panel_values(y)
+            if values is None:
+                self._f = None
+                _vectorize_panel(self, "fit")
+            else:
+                self._f = _croston(values, values.shape[1] - n_obs, self.smoothing)
+            return self
 
-        y = y.to_numpy()  # Transform the input into a numpy array
         # Fit the parameters: level(q), periodicity(a) and forecast(f)
-        q, a, f = np.full((3, n_timepoints + 1), np.nan)
-        p = 1  # periods since last demand observation
-
-        # Initialization:
-        first_occurrence = np.argmax(y[:n_timepoints] > 0)
-        q[0] = y[first_occurrence]
-        a[0] = 1 + first_occurrence
-        f[0] = q[0] / a[0]
-
-        # Create t+1 forecasts:
-        for t in range(0, n_timepoints):
-            if y[t] > 0:
-                q[t + 1] = smoothing * y[t] + (1 - smoothing) * q[t]
-                a[t + 1] = smoothing * p + (1 - smoothing) * a[t]
-                f[t + 1] = q[t + 1] / a[t + 1]
-                p = 1
-            else:
-                q[t + 1] = q[t]
-                a[t + 1] = a[t]
-                f[t + 1] = f[t]
-                p += 1
-        self._f = f
+        values = y.to_numpy(dtype=np.float64).reshape(1, -1)
+        self._f = _croston(values, np.zeros(1, dtype=np.int_), self.smoothing)[0]
 
         return self
 
@@ -142,15 +140,22 @@ class Croston(BaseForecaster):
 
         Returns
         -------
-        forecast : pd.series
-            Predicted forecasts.
+        forecast : pd.Series or pd.DataFrame
+            Predicted forecasts, a pd.DataFrame with MultiIndex for panel data.
         """
         len_fh = len(self.fh)
         f = self._f
+        if isinstance(self._y.index, pd.MultiIndex) and f is None:
+            return _vectorize_panel(self, "predict", fh=fh, X=X)
 
         # Predicting future forecasts:to_numpy()
-        y_pred = np.full(len_fh, f[-1])
+        if isinstance(self._y.index, pd.MultiIndex):
+            cutoff = _panel_cutoff(self.cutoff, self._times)
+            index = self.fh.to_absolute(cutoff).to_pandas()
+            y_pred = np.repeat(f[:, -1:], len_fh, axis=1)
+            return _panel_prediction(y_pred, self._instances, index, self._y)
 
+        y_pred = np.full(len_fh, f[-1])
         index = self.fh.to_absolute(self.cutoff).to_pandas()
         return pd.Series(y_pred, index=index)
 
@@ -172,3 +177,43 @@ class Croston(BaseForecaster):
         params2 = {"smoothing": 0.42}
 
         return [params1, params2]
+
+
+@njit(cache=True)
+def _croston(y, starts, smoothing):
+    """Compute the t+1 forecasts of Croston's method for each row of y.
+
+    Row i is fitted from index starts[i] onwards, the forecasts before its start are
+    NaN. Returns an array of shape (n_instances, n_timepoints + 1).
+    """
+    n_instances, n_timepoints = y.shape
+    f = np.full((n_instances, n_timepoints + 1), np.nan)
+
+    for i in range(n_instances):
+        start = starts[i]
+        if start >= n_timepoints:
+            continue
+
+        # Initialization:
+        first_occurrence = start
+        while first_occurrence < n_timepoints - 1 and y[i, first_occurrence] <= 0:
+            first_occurrence += 1
+        if y[i, first_occurrence] <= 0:
+            first_occurrence = start
+        q = y[i, first_occurrence]
+        a = 1 + first_occurrence - start
+        f[i, start] = q / a
+        p = 1  # periods since last demand observation
+
+        # Create t+1 forecasts:
+        for t in range(start, n_timepoints):
+            if y[i, t] > 0:
+                q = smoothing * y[i, t] + (1 - smoothing) * q
+                a = smoothing * p + (1 - smoothing) * a
+                f[i, t + 1] = q / a
+                p = 1
+            else:
+                f[i, t + 1] = f[i, t]
+                p += 1
+
+    return f
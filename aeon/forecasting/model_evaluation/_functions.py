@@ -16,6 +16,7 @@ import pandas as pd
 from aeon.datatypes import check_is_scitype, convert_to
 from aeon.exceptions import FitFailedWarning
 from aeon.forecasting.base import ForecastingHorizon
+from aeon.utils.validation import is_int
 from aeon.utils.validation._dependencies import _check_soft_dependencies
 from aeon.utils.validation.forecasting import check_cv, check_scoring
 
@@ -202,11 +203,20 @@ def _evaluate_window(
         }
     ).astype({"cutoff": cutoff_dtype})
 
-    # Return forecaster if "update"
-    if strategy == "update":
-        return result, forecaster
-    else:
-        return result
+    return result, forecaster
+
+
+def _evaluate_segment(y, X, windows, **kwargs):
+    """Evaluate the forecaster on a sequence of consecutive train/test windows.
+
+    The forecaster is fitted to the first training window, and refitted to or updated
+    with the following training windows depending on the strategy.
+    """
+    results = []
+    for i, (train, test) in enumerate(windows):
+        result, kwargs["forecaster"] = _evaluate_window(y, X, train, test, i, **kwargs)
+        results.append(result)
+    return pd.concat(results)
 
 
 def evaluate(
@@ -220,6 +230,7 @@ def evaluate(
     error_score: Union[str, int, float] = np.nan,
     backend: Optional[str] = None,
     compute: bool = True,
+    n_segments: Optional[int] = None,
     **kwargs,
 ):
     """Evaluate forecaster using timeseries cross-validation.
@@ -252,7 +263,8 @@ def evaluate(
         to "raise", the exception is raised. If a numeric value is given,
         FitFailedWarning is raised.
     backend : {"dask", "loky", "multiprocessing", "threading"}, by default None.
-        Runs parallel evaluate if specified and `strategy` is set as "refit".
+        Runs parallel evaluate if specified and `strategy` is set as "refit", or if
+        `n_segments` is also specified.
         - "loky", "multiprocessing" and "threading": uses `joblib` Parallel loops
         - "dask": uses `dask`, requires `dask` package in environment
         Recommendation: Use "dask" or "loky" for parallel evaluate.
@@ -262,6 +274,14 @@ def evaluate(
     compute : bool, default=True
         If backend="dask", whether returned DataFrame is computed.
         If set to True, returns `pd.DataFrame`, otherwise `dask.dataframe.DataFrame`.
+    n_segments : int or None, default=None
+        Only relevant if `backend` is specified and `strategy` is "update" or
+        "no-update_params". If specified, the train/test windows are split into
+        `n_segments` contiguous segments which are evaluated in parallel. The
+        forecaster is fitted to the first training window of each segment, and
+        updated with the remaining windows of the segment. Results can differ from
+        sequential evaluation, as the forecaster is refitted at the start of each
+        segment. If None, all windows are evaluated sequentially.
     **kwargs : Keyword arguments
         Only relevant if backend is specified. Additional kwargs are passed
         into `joblib.Parallel` if backend is "loky", "multiprocessing" or "threading".
@@ -335,6 +355,10 @@ def evaluate(
         )
 
     _check_strategy(strategy)
+    if n_segments is not None and (not is_int(n_segments) or n_segments < 1):
+        raise ValueError(
+            f"`n_segments` must be a positive integer or None, but found: {n_segments}"
+        )
     cv = check_cv(cv, enforce_start_with_window=True)
     if isinstance(scoring, List):
         scoring = [check_scoring(s) for s in scoring]
@@ -388,30 +412,25 @@ def evaluate(
         "cutoff_dtype": cutoff_dtype,
     }
 
-    if backend is None or strategy in ["update", "no-update_params"]:
+    # the windows are split into segments of consecutive windows which are evaluated
+    # independently, the forecaster is only carried over between the windows of a
+    # segment
+    splits = list(cv.split(y))
+    if strategy == "refit":
+        segments = [[split] for split in splits]
+    elif backend is None or n_segments is None:
+        segments = [splits]
+    else:
+        bounds = np.linspace(0, len(splits), min(n_segments, len(splits)) + 1)
+        bounds = np.round(bounds).astype(int)
+        segments = [splits[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    if backend is None:
         # Run temporal cross-validation sequentially
-        results = []
-        for i, (train, test) in enumerate(cv.split(y)):
-            if strategy == "update":
-                result, forecaster = _evaluate_window(
-                    y,
-                    X,
-                    train,
-                    test,
-                    i,
-                    **_evaluate_window_kwargs,
-                )
-                _evaluate_window_kwargs["forecaster"] = forecaster
-            else:
-                result = _evaluate_window(
-                    y,
-                    X,
-                    train,
-                    test,
-                    i,
-                    **_evaluate_window_kwargs,
-                )
-            results.append(result)
+        results = [
+            _evaluate_segment(y, X, segment, **_evaluate_window_kwargs)
+            for segment in segments
+        ]
         results = pd.concat(results)
 
     elif backend == "dask":
@@ -420,18 +439,10 @@ def evaluate(
         import dask.dataframe as dd
         from dask import delayed as dask_delayed
 
-        results = []
-        for i, (train, test) in enumerate(cv.split(y)):
-            results.append(
-                dask_delayed(_evaluate_window)(
-                    y,
-                    X,
-                    train,
-                    test,
-                    i,
-                    **_evaluate_window_kwargs,
-                )
-            )
+        results = [
+            dask_delayed(_evaluate_segment)(y, X, segment, **_evaluate_window_kwargs)
+            for segment in segments
+        ]
         results = dd.from_delayed(
             results,
             meta={
@@ -453,15 +464,8 @@ def evaluate(
         from joblib import Parallel, delayed
 
         results = Parallel(backend=backend, **kwargs)(
-            delayed(_evaluate_window)(
-                y,
-                X,
-                train,
-                test,
-                i,
-                **_evaluate_window_kwargs,
-            )
-            for i, (train, test) in enumerate(cv.split(y))
+            delayed(_evaluate_segment)(y, X, segment, **_evaluate_window_kwargs)
+            for segment in segments
         )
         results = pd.concat(results)
 
@@ -272,3 +272,44 @@ def test_evaluate_hierarchical(backend):
 
     scoring_name = f"test_{scoring.name}"
     assert np.all(out_exog[scoring_name] != out_no_exog[scoring_name])
+
+
+@pytest.mark.parametrize("strategy", ["update", "no-update_params"])
+@pytest.mark.parametrize("backend", [None, "loky", "threading"])
+def test_evaluate_segments(strategy, backend):
+    """Check evaluation of segments of windows against sequential evaluation."""
+    y = make_forecasting_problem(n_timepoints=40, index_type="int")
+    forecaster = NaiveForecaster(strategy="mean")
+    cv = ExpandingWindowSplitter(fh=[1, 2, 3], initial_window=10, step_length=3)
+    scoring = MeanAbsolutePercentageError(symmetric=True)
+
+    out = evaluate(
+        forecaster, cv, y, strategy=strategy, scoring=scoring, error_score="raise"
+    )
+    out_segments = evaluate(
+        forecaster,
+        cv,
+        y,
+        strategy=strategy,
+        scoring=scoring,
+        error_score="raise",
+        backend=backend,
+        n_segments=3,
+    )
+    _check_evaluate_output(out_segments, cv, y, scoring)
+
+    actual = out_segments[f"test_{scoring.name}"]
+    expected = out[f"test_{scoring.name}"]
+    if strategy == "update" or backend is None:
+        # NaiveForecaster is refitted in update
+        np.testing.assert_array_almost_equal(actual, expected)
+    else:
+        # the forecaster is only fitted to the first window of each segment
+        segment_starts = [0, 3, 7]
+        for i, (train, test) in enumerate(cv.split(y)):
+            if i in segment_starts:
+                f = forecaster.clone().fit(y.iloc[train], fh=cv.fh)
+            f.update(y.iloc[train], update_params=False)
+            np.testing.assert_almost_equal(
+                actual[i], scoring(y.iloc[test], f.predict(), y_train=y.iloc[train])
+            )
@@ -27,6 +27,13 @@ from aeon.datatypes._utilities import get_slice
 from aeon.forecasting.base import ForecastingHorizon
 from aeon.forecasting.base._aeon import _BaseWindowForecaster
 from aeon.forecasting.base._base import DEFAULT_ALPHA, BaseForecaster
+from aeon.forecasting.base._panel import (
+    _panel_cutoff,
+    _panel_prediction,
+    _panel_values,
+    _restrict_to_series_mtypes,
+    _vectorize_panel,
+)
 from aeon.utils.validation import check_window_length
 from aeon.utils.validation.forecasting import check_sp
 
@@ -50,6 +57,11 @@ class NaiveForecaster(_BaseWindowForecaster):
       - "mean": np.nanmean over rows
     - tile the predictions using the seasonal periodicity
 
+    Out-of-sample predictions for panel and hierarchical data are made for all series
+    at once, if all series end at the same time point and the time index is regular.
+    Otherwise, and for in-sample predictions and prediction intervals, one clone is
+    fitted per series.
+
     To compute prediction quantiles, we first estimate the standard error
     of prediction residuals under the assumption of uncorrelated residuals.
     The forecast variance is then computed by multiplying the residual
@@ -90,6 +102,15 @@ class NaiveForecaster(_BaseWindowForecaster):
         Window length to use in the `mean` strategy. If None, entire training
             series will be used.
 
+    max_memory_length : int or None, default=None
+        Number of most recent time points remembered by fit and update. If None,
+        all data seen is remembered. If an int, the cost of update does not grow
+        with the number of time points seen, but in-sample predictions are only
+        possible for the remembered time points. Must be at least `window_length`,
+        or `sp` for the `last` strategy if `window_length` is None. The `mean` and
+        `drift` strategies with `window_length` None use all data seen, so
+        max_memory_length must then be None.
+
     References
     ----------
     .. [1] Hyndman, R.J., & Athanasopoulos, G. (2021) Forecasting:
@@ -108,7 +129,8 @@ class NaiveForecaster(_BaseWindowForecaster):
     """
 
     _tags = {
-        "y_inner_mtype": "pd.Series",
+        "y_inner_mtype": ["pd.Series", "pd-multiindex", "pd_multiindex_hier"],
+        "X_inner_mtype": ["pd.DataFrame", "pd-multiindex", "pd_multiindex_hier"],
         "requires-fh-in-fit": False,
         "handles-missing-data": True,
         "scitype:y": "univariate",
@@ -116,11 +138,15 @@ class NaiveForecaster(_BaseWindowForecaster):
         "capability:pred_int": True,
     }
 
-    def __init__(self, strategy="last", window_length=None, sp=1):
-        super(NaiveForecaster, self).__init__()
+    def __init__(
+        self, strategy="last", window_length=None, sp=1, max_memory_length=None
+    ):
+        super(NaiveForecaster, self).__init__(
+            window_length=window_length, max_memory_length=max_memory_length
+        )
         self.strategy = strategy
         self.sp = sp
-        self.window_length = window_length
+        self.max_memory_length = max_memory_length
 
         # Override tag for handling missing data
         # todo: remove if GH1367 is fixed
@@ -144,9 +170,49 @@ class NaiveForecaster(_BaseWindowForecaster):
         self : returns an instance of self.
         """
         # X_train is ignored
-        sp = self.sp or 1
+        self._check_max_memory_length()
+        if isinstance(y.index, pd.MultiIndex):
+            return self._fit_panel(y)
+
+        self.window_length_ = self._get_window_length(len(y))
+        return self
+
+    def _fit_panel(self, y):
+        """Fit to all series of a panel, or fit one clone per series."""
+        values, n_obs, self._instances, _ = _panel_values(y, regular=True)
+        self._panel_window_lengths = None
+        if values is not None:
+            window_lengths = {n: self._get_window_length(n) for n in np.unique(n_obs)}
+            if all(isinstance(w, (int, np.integer)) for w in window_lengths.values()):
+                self._panel_window_lengths = np.array(
+                    [window_lengths[n] for n in n_obs], dtype=int
+                )
 
-        n_timepoints = y.shape[0]
+        if self._panel_window_lengths is None:
+            _vectorize_panel(self, "fit")
+        return self
+
+    def _check_max_memory_length(self):
+        """Check the remembered time points are enough for the strategy."""
+        if self.max_memory_length is None:
+            return
+        if self.window_length is None and self.strategy in ("mean", "drift"):
+            raise ValueError(
+                f"The `{self.strategy}` strategy with `window_length`: None uses "
+                f"all data seen, so `max_memory_length` must be None, but found "
+                f"`max_memory_length`: {self.max_memory_length}."
+            )
+        min_length = self.window_length or self.sp or 1
+        if self.max_memory_length < min_length:
+            param = "window_length" if self.window_length else "sp"
+            raise ValueError(
+                f"The `max_memory_length`: {self.max_memory_length} is smaller "
+                f"than `{param}`: {min_length}."
+            )
+
+    def _get_window_length(self, n_timepoints):
+        """Check the parameters and get the window length for a series length."""
+        sp = self.sp or 1
 
         if self.strategy in ("last", "mean"):
             # check window length is greater than sp for seasonal mean or seasonal last
@@ -157,21 +223,21 @@ class NaiveForecaster(_BaseWindowForecaster):
                         f"{self.window_length} is smaller than "
                         f"`sp`: {sp}."
                     )
-            self.window_length_ = check_window_length(self.window_length, n_timepoints)
+            window_length = check_window_length(self.window_length, n_timepoints)
             self.sp_ = check_sp(sp)
 
             #  if not given, set default window length
             if self.window_length is None:
-                self.window_length_ = len(y)
+                window_length = n_timepoints
 
         elif self.strategy == "drift":
             if sp != 1:
                 warn("For the `drift` strategy, the `sp` value will be ignored.")
             # window length we need for forecasts is just the
             # length of seasonal periodicity
-            self.window_length_ = check_window_length(self.window_length, n_timepoints)
+            window_length = check_window_length(self.window_length, n_timepoints)
             if self.window_length is None:
-                self.window_length_ = len(y)
+                window_length = n_timepoints
             if self.window_length == 1:
                 raise ValueError(
                     f"For the `drift` strategy, "
@@ -187,14 +253,13 @@ class NaiveForecaster(_BaseWindowForecaster):
             )
 
         # check window length
-        if self.window_length_ > len(self._y):
+        if window_length > n_timepoints:
             param = "sp" if self.strategy == "last" and sp != 1 else "window_length_"
             raise ValueError(
-                f"The {param}: {self.window_length_} is larger than "
-                f"the training series."
+                f"The {param}: {window_length} is larger than the training series."
             )
 
-        return self
+        return window_length
 
     def _predict_last_window(
         self, fh, X=None, return_pred_int=False, alpha=DEFAULT_ALPHA
@@ -333,6 +398,12 @@ class NaiveForecaster(_BaseWindowForecaster):
         X : pd.DataFrame, optional (default=None)
             Exogenous time series
         """
+        if isinstance(self._y.index, pd.MultiIndex):
+            y_pred = self._predict_panel(fh)
+            if y_pred is None:
+                y_pred = _vectorize_panel(self, "predict", fh=fh, X=X)
+            return y_pred
+
         y_pred = super(NaiveForecaster, self)._predict(fh=fh, X=X)
 
         # test_predict_time_index_in_sample_full[ForecastingPipeline-0-int-int-True]
@@ -350,6 +421,69 @@ class NaiveForecaster(_BaseWindowForecaster):
 
         return y_pred
 
+    def _predict_panel(self, fh):
+        """Calculate out-of-sample predictions for all series of a panel.
+
+        Returns None if the series cannot be predicted at once, i.e. if the panel is
+        not aligned or fh contains in-sample time points.
+        """
+        window_lengths = self._panel_window_lengths
+        if window_lengths is None:
+            return None
+        values, _, instances, times = _panel_values(self._y, regular=True)
+        if values is None or not instances.equals(self._instances):
+            return None
+        n_instances, n_timepoints = values.shape
+        cutoff = _panel_cutoff(self.cutoff, times)
+        if window_lengths.max() > n_timepoints or not fh.is_all_out_of_sample(cutoff):
+            return None
+
+        fh_idx = fh.to_absolute(cutoff).to_pandas()
+        steps = fh.to_relative(cutoff).to_numpy()
+
+        # last windows of all series, right-aligned and padded with NaN on the left
+        max_window = window_lengths.max()
+        last_windows = values[:, n_timepoints - max_window :].copy()
+        last_windows[
+            np.arange(max_window) < (max_window - window_lengths)[:, None]
+        ] = np.nan
+
+        if self.strategy in ("last", "mean"):
+            sp = self.sp_
+            # the season of a time point only depends on its distance to the cutoff
+            seasons = np.arange(-max_window, 0) % sp
+            season_preds = np.full((n_instances, sp), np.nan)
+            for season in range(min(sp, max_window)):
+                window = last_windows[:, seasons == season]
+                if self.strategy == "mean":
+                    season_preds[:, season] = np.nanmean(window, axis=1)
+                else:
+                    observed = ~np.isnan(window)
+                    last = window.shape[1] - 1 - observed[:, ::-1].argmax(axis=1)
+                    season_preds[:, season] = window[np.arange(n_instances), last]
+            y_pred = season_preds[:, (steps - 1) % sp]
+
+        else:
+            first = last_windows[np.arange(n_instances), max_window - window_lengths]
+            last = last_windows[:, -1]
+            missing = np.isnan(first) | np.isnan(last)
+            if (missing & ~np.isnan(last_windows).all(axis=1)).any():
+                raise ValueError(
+                    f"For {self.strategy},"
+                    f"first and last elements in the last "
+                    f"window must not be a missing value."
+                )
+            # series with a window of length one are predicted by their last value
+            slope = np.divide(
+                last - first,
+                window_lengths - 1,
+                out=np.zeros(n_instances),
+                where=window_lengths > 1,
+            )
+            y_pred = last[:, None] + steps * slope[:, None]
+
+        return _panel_prediction(y_pred, instances, fh_idx, self._y)
+
     def _predict_quantiles(self, fh, X=None, alpha=0.5):
         """Compute/return prediction quantiles for a forecast.
 
@@ -374,6 +508,9 @@ class NaiveForecaster(_BaseWindowForecaster):
             Row index is fh. Entries are quantile forecasts, for var in col index,
                 at quantile probability in second-level col index, for each row index.
         """
+        if isinstance(self._y.index, pd.MultiIndex):
+            return _vectorize_panel(self, "predict_quantiles", fh=fh, alpha=alpha)
+
         y_pred = self.predict(fh)
         y_pred = convert(y_pred, from_type=self._y_mtype_last_seen, to_type="pd.Series")
 
@@ -422,6 +559,9 @@ class NaiveForecaster(_BaseWindowForecaster):
         ----------
         .. [1] https://otexts.com/fpp3/prediction-intervals.html#benchmark-methods
         """
+        if isinstance(self._y.index, pd.MultiIndex):
+            return _vectorize_panel(self, "predict_var", fh=fh, cov=cov)
+
         y = self._y
         y = convert_to(y, "pd.Series")
         T = len(y)
@@ -612,6 +752,9 @@ class NaiveVariance(BaseForecaster):
         ]
         self.clone_tags(self.forecaster, tags_to_clone)
 
+        # residuals are computed per series, panels are vectorized
+        _restrict_to_series_mtypes(self)
+
     def _fit(self, y, X=None, fh=None):
         self.fh_early_ = fh is not None
         self.forecaster_ = self.forecaster.clone()
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import pandas as pd
 import pytest
 
 from aeon.datasets import load_PBS_dataset
@@ -35,3 +36,16 @@ def test_Croston_against_r_implementation(smoothing, fh, r_forecast):
     forecaster.fit(y)
     y_pred = forecaster.predict(fh=fh)
     np.testing.assert_almost_equal(y_pred, np.full(len(fh), r_forecast), decimal=5)
+
+
+def test_Croston_panel():
+    """Test predictions for panel data against predictions for each series."""
+    y = load_PBS_dataset()
+    series = [y.iloc[i * 10 :] for i in range(3)]
+    y_panel = pd.concat(series, keys=[0, 1, 2]).to_frame()
+
+    y_pred = Croston(0.2).fit(y_panel).predict(fh=[1, 2])
+
+    for i, s in enumerate(series):
+        expected = Croston(0.2).fit(s).predict(fh=[1, 2])
+        np.testing.assert_array_almost_equal(y_pred.loc[i].iloc[:, 0], expected)
@@ -405,3 +405,28 @@ def test_naive_predict_interval_against_R_naive(strategy, sp, lower, upper):
     expected[("Coverage", coverage, "upper")] = upper
 
     pd.testing.assert_frame_equal(y_pred_ints, expected)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"strategy": "last", "sp": 3},
+        {"strategy": "mean", "window_length": 5},
+        {"strategy": "drift"},
+    ],
+)
+@pytest.mark.parametrize("fh", [[1, 2, 5], [-2, -1, 0]])
+def test_naive_panel(params, fh):
+    """Test predictions for panel data against predictions for each series."""
+    series = [
+        pd.Series(np.random.RandomState(i).normal(size=n), index=range(40 - n, 40))
+        for i, n in enumerate([12, 15, 20])
+    ]
+    y = pd.concat(series, keys=["a", "b", "c"]).to_frame("y")
+
+    y_pred = NaiveForecaster(**params).fit(y).predict(fh)
+
+    for key, s in zip(["a", "b", "c"], series):
+        expected = NaiveForecaster(**params).fit(s).predict(fh)
+        np.testing.assert_array_almost_equal(y_pred.loc[key, "y"], expected)
+        assert y_pred.loc[key].index.equals(expected.index)
@@ -7,6 +7,11 @@ from aeon.registry._base_classes import (
     BASE_CLASS_REGISTER,
     BASE_CLASS_SCITYPE_LIST,
 )
+from aeon.registry._config import (
+    ESTIMATOR_CONFIG_LIST,
+    ESTIMATOR_CONFIG_REGISTER,
+    check_config_is_valid,
+)
 from aeon.registry._lookup import all_estimators, all_tags
 from aeon.registry._scitype import scitype
 from aeon.registry._tags import (
@@ -19,9 +24,12 @@ __all__ = [
     "all_estimators",
     "all_tags",
     "check_tag_is_valid",
+    "check_config_is_valid",
     "scitype",
     "ESTIMATOR_TAG_LIST",
     "ESTIMATOR_TAG_REGISTER",
+    "ESTIMATOR_CONFIG_LIST",
+    "ESTIMATOR_CONFIG_REGISTER",
     "BASE_CLASS_REGISTER",
     "BASE_CLASS_LIST",
     "BASE_CLASS_LOOKUP",
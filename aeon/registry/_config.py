@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Register of estimator config flags.
+
+Config flags set how an estimator runs, e.g., the parallel backend it uses, rather
+than describing the estimator like tags. They are set with set_config and kept by
+reset and clone. New config flags should be entered in ESTIMATOR_CONFIG_REGISTER,
+and their default in the _config dictionary of the base classes they apply to.
+
+This module exports the following:
+
+---
+ESTIMATOR_CONFIG_REGISTER - list of tuples
+
+each tuple corresponds to a config flag, elements as follows:
+    0 : string - name of the config flag as used in the _config dictionary
+    1 : string or list of string - name of the scitypes this config flag applies to
+                 must be in _base_classes.BASE_CLASS_SCITYPE_LIST
+    2 : expected value of the config flag
+        should be one of:
+            "dict" - valid values are all dicts and None
+            list - any element of the list is valid
+    3 : string - plain English description of the config flag
+
+---
+
+ESTIMATOR_CONFIG_LIST - list of string
+    elements are 0-th entries of ESTIMATOR_CONFIG_REGISTER, in same order
+
+---
+
+check_config_is_valid(config_name, config_value) - checks whether config_value is
+    valid for config_name
+
+"""
+
+__all__ = [
+    "ESTIMATOR_CONFIG_REGISTER",
+    "ESTIMATOR_CONFIG_LIST",
+    "check_config_is_valid",
+]
+
+from aeon.datatypes._vectorize import BACKENDS_SUPPORTED
+
+ESTIMATOR_CONFIG_REGISTER = [
+    (
+        "backend:parallel",
+        ["forecaster", "transformer"],
+        BACKENDS_SUPPORTED,
+        "backend for vectorization over series or columns, None = sequential",
+    ),
+    (
+        "backend:parallel:params",
+        ["forecaster", "transformer"],
+        "dict",
+        "params passed to the parallel backend, e.g., n_jobs for joblib, "
+        "None = backend defaults",
+    ),
+]
+
+ESTIMATOR_CONFIG_LIST = [config[0] for config in ESTIMATOR_CONFIG_REGISTER]
+
+
+def check_config_is_valid(config_name, config_value):
+    """Check validity of a config flag value.
+
+    Parameters
+    ----------
+    config_name : string, name of the config flag
+    config_value : object, value of the config flag
+
+    Raises
+    ------
+    KeyError - if config_name is not a valid config flag in ESTIMATOR_CONFIG_LIST
+    ValueError - if config_value is not valid for the config flag config_name
+    """
+    if config_name not in ESTIMATOR_CONFIG_LIST:
+        raise KeyError(config_name + " is not a valid config flag")
+
+    config_type = ESTIMATOR_CONFIG_REGISTER[ESTIMATOR_CONFIG_LIST.index(config_name)][2]
+
+    if config_type == "dict" and not isinstance(config_value, (dict, type(None))):
+        raise ValueError(f"{config_name} must be a dict or None, found {config_value}")
+
+    if isinstance(config_type, list) and config_value not in config_type:
+        raise ValueError(
+            f"{config_name} must be one of {config_type}, found {config_value}"
+        )
@@ -333,6 +333,12 @@ ESTIMATOR_TAG_REGISTER = [
         "bool",
         "whether estimator remembers all data seen as self._X, self._y, etc",
     ),
+    (
+        "max_memory_length",
+        "forecaster",
+        "int",
+        "max number of most recent time points remembered as _y/_X, None = all",
+    ),
     (
         "distribution_type",
         "estimator",
@@ -11,8 +11,9 @@ __all__ = ["KNeighborsTimeSeriesRegressor"]
 
 import numpy as np
 
-from aeon.distances import distance_factory
+from aeon.distances import pairwise_distance
 from aeon.regression.base import BaseRegressor
+from aeon.utils.validation import check_n_jobs
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
 
@@ -45,6 +46,11 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             output must be mxn array if X is array of m Series, X2 of n Series
     distance_params : dict, optional. default = None.
         dictionary for metric parameters , in case that distance is a str
+    n_jobs : int, default=1
+        The number of parallel jobs to run for neighbors search.
+        ``-1`` means using all processors. The distances between the cases to
+        predict and the training cases are computed in parallel with this many
+        threads.
 
     Examples
     --------
@@ -69,10 +75,12 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         distance_params=None,
         n_neighbors=1,
         weights="uniform",
+        n_jobs=1,
     ):
         self.distance = distance
         self.distance_params = distance_params
         self.n_neighbors = n_neighbors
+        self.n_jobs = n_jobs
 
         if weights not in WEIGHTS_SUPPORTED:
             raise ValueError(
@@ -93,14 +101,6 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         y : array-like, shape = [n_instances]
             The class labels.
         """
-        if isinstance(self.distance, str):
-            if self.distance_params is None:
-                self.metric_ = distance_factory(X[0], X[0], metric=self.distance)
-            else:
-                self.metric_ = distance_factory(
-                    X[0], X[0], metric=self.distance, **self.distance_params
-                )
-
         self.X_ = X
         self.y_ = y
         return self
@@ -120,32 +120,33 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         """
         self.check_is_fitted()
 
-        preds = np.zeros(X.shape[0])
-        for i in range(X.shape[0]):
-            idx, weights = self._kneighbors(X[i])
-            preds[i] = np.average(self.y_[idx], weights=weights)
-
-        return preds
+        idx, weights = self._kneighbors(X)
+        return np.average(self.y_[idx], weights=weights, axis=1)
 
     def _kneighbors(self, X):
-        """Find the K-neighbors of a point.
+        """Find the K-neighbors of each case in X.
 
-        Returns indices and weights of each point.
+        Returns indices and weights of the neighbors of each case.
 
         Parameters
         ----------
         X : 3D np.array of shape = [n_instances, n_dimensions, series_length]
-            The training data.
+            The cases to find the neighbors of.
 
         Returns
         -------
-        ind : array
+        ind : array of shape = [n_instances, n_neighbors]
             Indices of the nearest points in the population matrix.
-        ws : array
+        ws : array of shape = [n_instances, n_neighbors]
             Array representing the weights of each neighbor.
         """
-        distances = np.array(
-            [self.metric_(X, self.X_[j]) for j in range(self.X_.shape[0])]
+        params = {} if self.distance_params is None else self.distance_params
+        distances = pairwise_distance(
+            X,
+            self.X_,
+            metric=self.distance,
+            n_jobs=check_n_jobs(self.n_jobs),
+            **params,
         )
 
         # Find indices of k nearest neighbors using partitioning:
@@ -153,17 +154,17 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         # They might not be ordered within themselves,
         # but it is not necessary and partitioning is
         # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        closest_idx = np.argpartition(distances, self.n_neighbors, axis=1)
+        closest_idx = closest_idx[:, : self.n_neighbors]
 
         if self.weights == "distance":
-            ws = distances[closest_idx]
+            ws = np.take_along_axis(distances, closest_idx, axis=1)
             ws = ws**2
 
             # Using epsilon ~= 0 to avoid division by zero
             ws = 1 / (ws + np.finfo(float).eps)
         elif self.weights == "uniform":
-            ws = np.repeat(1.0, self.n_neighbors)
+            ws = np.ones(closest_idx.shape)
         else:
             raise Exception(f"Invalid kNN weights: {self.weights}")
 
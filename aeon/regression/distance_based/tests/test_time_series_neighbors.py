@@ -24,3 +24,20 @@ def test_knn_neighbors():
     y_pred_expected = np.array([-216.06541863, -4.54133078, -324.7624233])
 
     assert np.abs(y_pred - y_pred_expected).max() < 1e-6
+
+
+def test_knn_n_jobs():
+    """Test predictions do not depend on the number of jobs."""
+    from aeon.datasets import load_covid_3month
+
+    X_train, y_train = load_covid_3month(split="train")
+    X_test, _ = load_covid_3month(split="test")
+    preds = [
+        KNeighborsTimeSeriesRegressor(distance=distance, n_neighbors=3, n_jobs=n_jobs)
+        .fit(X_train[:30], y_train[:30])
+        .predict(X_test[:10])
+        for distance in ["euclidean", "dtw", "msm"]
+        for n_jobs in [1, -1]
+    ]
+    for i in range(0, len(preds), 2):
+        np.testing.assert_array_almost_equal(preds[i], preds[i + 1])
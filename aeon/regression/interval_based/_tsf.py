@@ -13,6 +13,7 @@ from aeon.regression.base import BaseRegressor
 from aeon.series_as_features.base.estimators.interval_based._tsf import (
     BaseTimeSeriesForest,
     _transform,
+    _transform_tables,
 )
 
 
@@ -123,13 +124,14 @@ class TimeSeriesForestRegressor(BaseTimeSeriesForest, ForestRegressor, BaseRegre
                 "The number of time points in the training data does not match "
                 "that in the test data."
             )
+        tables = _transform_tables(X)
         y_pred = Parallel(n_jobs=self.n_jobs)(
-            delayed(_predict)(X, self.estimators_[i], self.intervals_[i])
+            delayed(_predict)(X, self.estimators_[i], self.intervals_[i], tables)
             for i in range(self.n_estimators)
         )
         return np.mean(y_pred, axis=0)
 
 
-def _predict(X, estimator, intervals):
-    Xt = _transform(X, intervals)
+def _predict(X, estimator, intervals, tables=None):
+    Xt = _transform(X, intervals, tables)
     return estimator.predict(Xt)
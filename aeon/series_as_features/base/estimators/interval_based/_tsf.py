@@ -12,6 +12,7 @@ __author__ = [
 __all__ = [
     "BaseTimeSeriesForest",
     "_transform",
+    "_transform_tables",
     "_get_intervals",
     "_fit_estimator",
 ]
@@ -24,9 +25,15 @@ from sklearn.utils.multiclass import class_distribution
 from sklearn.utils.validation import check_random_state
 
 from aeon.base._base import _clone_estimator
-from aeon.utils.slope_and_trend import _slope
+from aeon.utils.numba.interval_stats import (
+    interval_stats_from_tables,
+    interval_stats_tables,
+)
 from aeon.utils.validation import check_n_jobs
 
+# mean, standard deviation and slope, see INTERVAL_STATS
+TSF_STATS = [0, 1, 2]
+
 
 class BaseTimeSeriesForest:
     """Base time series forest classifier."""
@@ -110,9 +117,14 @@ class BaseTimeSeriesForest:
             for _ in range(self.n_estimators)
         ]
 
+        tables = _transform_tables(X)
         self.estimators_ = Parallel(n_jobs=n_jobs)(
             delayed(_fit_estimator)(
-                _clone_estimator(self._estimator, rng), X, y, self.intervals_[i]
+                _clone_estimator(self._estimator, rng),
+                X,
+                y,
+                self.intervals_[i],
+                tables,
             )
             for i in range(self.n_estimators)
         )
@@ -128,7 +140,7 @@ class BaseTimeSeriesForest:
         }
 
 
-def _transform(X, intervals):
+def _transform(X, intervals, tables=None):
     """Transform X for given intervals.
 
     Compute the mean, standard deviation and slope for given intervals of input data X.
@@ -139,25 +151,35 @@ def _transform(X, intervals):
         Panel data to transform.
     intervals : np.ndarray
         Intervals containing start and end values.
+    tables : tuple of np.ndarray, optional (default=None)
+        Precomputed interval statistic tables for X from _transform_tables. Computed
+        if None, pass these when transforming the same X for multiple intervals.
 
     Returns
     -------
     Xt: np.ndarray or pd.DataFrame
      Transformed X, containing the mean, std and slope for each interval
     """
-    n_instances, _ = X.shape
+    X = X.reshape((X.shape[0], 1, -1))
+    if tables is None:
+        tables = _transform_tables(X)
+
     n_intervals, _ = intervals.shape
-    transformed_x = np.empty(shape=(3 * n_intervals, n_instances), dtype=np.float32)
-    for j in range(n_intervals):
-        X_slice = X[:, intervals[j][0] : intervals[j][1]]
-        means = np.mean(X_slice, axis=1)
-        std_dev = np.std(X_slice, axis=1)
-        slope = _slope(X_slice, axis=1)
-        transformed_x[3 * j] = means
-        transformed_x[3 * j + 1] = std_dev
-        transformed_x[3 * j + 2] = slope
+    transformed_x = interval_stats_from_tables(
+        X,
+        tables,
+        np.repeat(intervals[:, 0], len(TSF_STATS)),
+        np.repeat(intervals[:, 1], len(TSF_STATS)),
+        np.zeros(len(TSF_STATS) * n_intervals, dtype=int),
+        np.tile(TSF_STATS, n_intervals),
+    )
+
+    return transformed_x.astype(np.float32)
+
 
-    return transformed_x.T
+def _transform_tables(X):
+    """Precompute the interval statistic tables used by _transform for X."""
+    return interval_stats_tables(X.reshape((X.shape[0], 1, -1)), TSF_STATS)
 
 
 def _get_intervals(n_intervals, min_interval, series_length, rng):
@@ -172,7 +194,7 @@ def _get_intervals(n_intervals, min_interval, series_length, rng):
     return intervals
 
 
-def _fit_estimator(estimator, X, y, intervals):
+def _fit_estimator(estimator, X, y, intervals, tables=None):
     """Fit an estimator on input data (X, y)."""
-    transformed_x = _transform(X, intervals)
+    transformed_x = _transform(X, intervals, tables)
     return estimator.fit(transformed_x, y)
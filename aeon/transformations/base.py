@@ -128,6 +128,12 @@ class BaseTransformer(BaseEstimator):
         "remember_data": False,  # whether all data seen is remembered as self._X
     }
 
+    # default config values, set with set_config, see aeon.registry._config
+    _config = {
+        "backend:parallel": None,  # backend for vectorization over series/columns
+        "backend:parallel:params": None,  # dict of params passed to parallel backend
+    }
+
     # allowed mtypes for transformers - Series and Panel
     ALLOWED_INPUT_TYPES = [
         "pd.Series",
@@ -1094,6 +1100,9 @@ class BaseTransformer(BaseEstimator):
         kwargs["args_rowvec"] = {"y": y}
         kwargs["rowname_default"] = "transformers"
         kwargs["colname_default"] = "transformers"
+        config = self.get_config()
+        kwargs["backend"] = config["backend:parallel"]
+        kwargs["backend_params"] = config["backend:parallel:params"]
 
         FIT_METHODS = ["fit", "update"]
         TRAFO_METHODS = ["transform", "inverse_transform"]
@@ -11,7 +11,7 @@ import math
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit
+from numba import config, get_num_threads, njit, prange, set_num_threads
 
 from aeon.transformations.base import BaseTransformer
 from aeon.utils.validation import check_n_jobs
@@ -158,113 +158,63 @@ class Catch22(BaseTransformer):
         c22 : numpy array of shape (n_instances, c*n_channels) where c is the
              number of features requested, containing Catch22 features for X.
         """
-        n_instances = X.shape[0]
+        n_instances, n_channels, _ = X.shape
 
         f_idx = _verify_features(self.features, self.catch24)
 
-        threads_to_use = check_n_jobs(self.n_jobs)
+        n_features = len(f_idx) * n_channels
+        if (
+            self._transform_features is not None
+            and len(self._transform_features) == n_features
+        ):
+            transform_feature = np.asarray(self._transform_features, dtype=np.bool_)
+        else:
+            transform_feature = np.ones(n_features, dtype=np.bool_)
 
-        c22_list = Parallel(n_jobs=threads_to_use, prefer="threads")(
-            delayed(self._transform_case)(
-                X[i],
-                f_idx,
-            )
-            for i in range(n_instances)
+        c22 = self._transform_batch(
+            X.reshape(n_instances * n_channels, -1),
+            f_idx,
+            transform_feature.reshape(n_channels, len(f_idx)),
         )
+        c22 = c22.reshape(n_instances, n_features)
 
         if self.replace_nans:
-            c22_list = np.nan_to_num(c22_list, False, 0, 0, 0)
-
-        return np.array(c22_list)
-
-    def _transform_case(self, X, f_idx):
-        c22 = np.zeros(len(f_idx) * len(X))
+            c22 = np.nan_to_num(c22, False, 0, 0, 0)
 
-        if self._transform_features is not None and len(
-            self._transform_features
-        ) == len(c22):
-            transform_feature = self._transform_features
-        else:
-            transform_feature = [True] * len(c22)
+        return c22
 
-        f_count = -1
-        for i in range(len(X)):
-            series = np.array(X[i])
-            dim = i * len(f_idx)
-            outlier_series = None
-            smin = None
-            smax = None
-            smean = None
-            fft = None
-            ac = None
-            acfz = None
-
-            for n, feature in enumerate(f_idx):
-                f_count += 1
-                if not transform_feature[f_count]:
-                    continue
-
-                args = [series]
-
-                if feature == 0 or feature == 1 or feature == 11:
-                    if smin is None:
-                        smin = np.min(series)
-                    if smax is None:
-                        smax = np.max(series)
-                    args = [series, smin, smax]
-                elif feature == 2 or feature == 22:
-                    if smean is None:
-                        smean = np.mean(series)
-                    args = [series, smean]
-                elif feature == 3 or feature == 4:
-                    if self.outlier_norm:
-                        if smean is None:
-                            smean = np.mean(series)
-                        if outlier_series is None:
-                            outlier_series = _normalise_series(series, smean)
-                        args = [outlier_series]
-                    else:
-                        args = [series]
-                elif feature == 7 or feature == 8:
-                    if smean is None:
-                        smean = np.mean(series)
-                    if fft is None:
-                        nfft = int(
-                            np.power(2, np.ceil(np.log(len(series)) / np.log(2)))
-                        )
-                        fft = np.fft.fft(series - smean, n=nfft)
-                    args = [series, fft]
-                elif feature == 5 or feature == 6 or feature == 12:
-                    if smean is None:
-                        smean = np.mean(series)
-                    if fft is None:
-                        nfft = int(
-                            np.power(2, np.ceil(np.log(len(series)) / np.log(2)))
-                        )
-                        fft = np.fft.fft(series - smean, n=nfft)
-                    if ac is None:
-                        ac = _autocorr(series, fft)
-                    args = [ac]
-                elif feature == 16 or feature == 17 or feature == 20:
-                    if smean is None:
-                        smean = np.mean(series)
-                    if fft is None:
-                        nfft = int(
-                            np.power(2, np.ceil(np.log(len(series)) / np.log(2)))
-                        )
-                        fft = np.fft.fft(series - smean, n=nfft)
-                    if ac is None:
-                        ac = _autocorr(series, fft)
-                    if acfz is None:
-                        acfz = _ac_first_zero(ac)
-                    args = [series, acfz]
-
-                if feature == 22:
-                    c22[dim + n] = smean
-                elif feature == 23:
-                    c22[dim + n] = np.std(series)
-                else:
-                    c22[dim + n] = features[feature](*args)
+    def _transform_batch(self, X, f_idx, transform_feature):
+        # Features for each row of the 2D array X, with the FFT based intermediates
+        # computed for all rows at once and the features in a compiled parallel loop.
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        n_series, series_length = X.shape
+        f_idx = np.asarray(f_idx, dtype=np.int_)
+
+        X_fft = np.zeros((n_series, 0), dtype=np.complex128)
+        X_ac = np.zeros((n_series, 0))
+        res_ac = np.zeros((n_series, 0))
+        if np.isin(f_idx, [5, 6, 7, 8, 12, 16, 17, 20]).any():
+            X_fft = _batch_fft(X)
+            if np.isin(f_idx, [5, 6, 12, 16, 17, 20]).any():
+                X_ac = _batch_autocorr(X, X_fft)
+        if 16 in f_idx and series_length > 1:
+            res = X[:, 1:] - X[:, :-1]
+            res_ac = _batch_autocorr(res, _batch_fft(res))
+
+        prev_threads = get_num_threads()
+        set_num_threads(min(check_n_jobs(self.n_jobs), config.NUMBA_NUM_THREADS))
+        try:
+            c22 = _catch22_batch(
+                X,
+                f_idx,
+                transform_feature,
+                X_fft,
+                X_ac,
+                res_ac,
+                self.outlier_norm,
+            )
+        finally:
+            set_num_threads(prev_threads)
 
         return c22
 
@@ -317,15 +267,19 @@ class Catch22(BaseTransformer):
                         "feature transform."
                     )
 
+        if case_id is None:
+            c22 = self._transform_batch(X, [feature], np.ones((1, 1), dtype=np.bool_))
+            c22 = c22.reshape(n_instances)
+
+            if self.replace_nans:
+                c22 = np.nan_to_num(c22, False, 0, 0, 0)
+
+            return c22
+
         threads_to_use = check_n_jobs(self.n_jobs)
 
         c22_list = Parallel(n_jobs=threads_to_use, prefer="threads")(
-            delayed(self._transform_case_single)(
-                X[i],
-                feature,
-                case_id,
-                i,
-            )
+            delayed(self._transform_case_single)(X[i], feature, i)
             for i in range(n_instances)
         )
 
@@ -334,97 +288,63 @@ class Catch22(BaseTransformer):
 
         return np.asarray(c22_list)
 
-    def _transform_case_single(self, series, feature, case_id, inst_idx):
+    def _transform_case_single(self, series, feature, inst_idx):
+        """Compute a single feature of one case, reusing the cached statistics.
+
+        Only used when a case_id is given to _transform_single_feature, the cached
+        statistics of case inst_idx are filled in as they are required.
+        """
         args = [series]
 
-        if case_id is None:
-            if feature == 0 or feature == 1 or feature == 11:
-                smin = np.min(series)
-                smax = np.max(series)
-                args = [series, smin, smax]
-            elif feature == 2:
-                smean = np.mean(series)
-                args = [series, smean]
-            elif feature == 3 or feature == 4:
-                if self.outlier_norm:
+        if feature == 0 or feature == 1 or feature == 11:
+            if self._smin[inst_idx] is None:
+                self._smin[inst_idx] = np.min(series)
+            if self._smax[inst_idx] is None:
+                self._smax[inst_idx] = np.max(series)
+            args = [series, self._smin[inst_idx], self._smax[inst_idx]]
+        elif feature == 2:
+            if self._smean[inst_idx] is None:
+                self._smean[inst_idx] = np.mean(series)
+            args = [series, self._smean[inst_idx]]
+        elif feature == 3 or feature == 4:
+            if self.outlier_norm:
+                if self._outlier_series[inst_idx] is None:
                     std = np.std(series)
                     if std > 0:
-                        series = (series - np.mean(series)) / std
-                args = [series]
-            elif feature == 7 or feature == 8:
-                smean = np.mean(series)
+                        self._outlier_series[inst_idx] = (
+                            series - np.mean(series)
+                        ) / std
+                    else:
+                        self._outlier_series[inst_idx] = series
+                series = self._outlier_series[inst_idx]
+            args = [series]
+        elif feature == 7 or feature == 8:
+            if self._smean[inst_idx] is None:
+                self._smean[inst_idx] = np.mean(series)
+            if self._fft[inst_idx] is None:
                 nfft = int(np.power(2, np.ceil(np.log(len(series)) / np.log(2))))
-                fft = np.fft.fft(series - smean, n=nfft)
-                args = [series, fft]
-            elif feature == 5 or feature == 6 or feature == 12:
-                smean = np.mean(series)
+                self._fft[inst_idx] = np.fft.fft(series - self._smean[inst_idx], n=nfft)
+            args = [series, self._fft[inst_idx]]
+        elif feature == 5 or feature == 6 or feature == 12:
+            if self._smean[inst_idx] is None:
+                self._smean[inst_idx] = np.mean(series)
+            if self._fft[inst_idx] is None:
                 nfft = int(np.power(2, np.ceil(np.log(len(series)) / np.log(2))))
-                fft = np.fft.fft(series - smean, n=nfft)
-                ac = _autocorr(series, fft)
-                args = [ac]
-            elif feature == 16 or feature == 17 or feature == 20:
-                smean = np.mean(series)
+                self._fft[inst_idx] = np.fft.fft(series - self._smean[inst_idx], n=nfft)
+            if self._ac[inst_idx] is None:
+                self._ac[inst_idx] = _autocorr(series, self._fft[inst_idx])
+            args = [self._ac[inst_idx]]
+        elif feature == 16 or feature == 17 or feature == 20:
+            if self._smean[inst_idx] is None:
+                self._smean[inst_idx] = np.mean(series)
+            if self._fft[inst_idx] is None:
                 nfft = int(np.power(2, np.ceil(np.log(len(series)) / np.log(2))))
-                fft = np.fft.fft(series - smean, n=nfft)
-                ac = _autocorr(series, fft)
-                acfz = _ac_first_zero(ac)
-                args = [series, acfz]
-        else:
-            if feature == 0 or feature == 1 or feature == 11:
-                if self._smin[inst_idx] is None:
-                    self._smin[inst_idx] = np.min(series)
-                if self._smax[inst_idx] is None:
-                    self._smax[inst_idx] = np.max(series)
-                args = [series, self._smin[inst_idx], self._smax[inst_idx]]
-            elif feature == 2:
-                if self._smean[inst_idx] is None:
-                    self._smean[inst_idx] = np.mean(series)
-                args = [series, self._smean[inst_idx]]
-            elif feature == 3 or feature == 4:
-                if self.outlier_norm:
-                    if self._outlier_series[inst_idx] is None:
-                        std = np.std(series)
-                        if std > 0:
-                            self._outlier_series[inst_idx] = (
-                                series - np.mean(series)
-                            ) / std
-                        else:
-                            self._outlier_series[inst_idx] = series
-                    series = self._outlier_series[inst_idx]
-                args = [series]
-            elif feature == 7 or feature == 8:
-                if self._smean[inst_idx] is None:
-                    self._smean[inst_idx] = np.mean(series)
-                if self._fft[inst_idx] is None:
-                    nfft = int(np.power(2, np.ceil(np.log(len(series)) / np.log(2))))
-                    self._fft[inst_idx] = np.fft.fft(
-                        series - self._smean[inst_idx], n=nfft
-                    )
-                args = [series, self._fft[inst_idx]]
-            elif feature == 5 or feature == 6 or feature == 12:
-                if self._smean[inst_idx] is None:
-                    self._smean[inst_idx] = np.mean(series)
-                if self._fft[inst_idx] is None:
-                    nfft = int(np.power(2, np.ceil(np.log(len(series)) / np.log(2))))
-                    self._fft[inst_idx] = np.fft.fft(
-                        series - self._smean[inst_idx], n=nfft
-                    )
-                if self._ac[inst_idx] is None:
-                    self._ac[inst_idx] = _autocorr(series, self._fft[inst_idx])
-                args = [self._ac[inst_idx]]
-            elif feature == 16 or feature == 17 or feature == 20:
-                if self._smean[inst_idx] is None:
-                    self._smean[inst_idx] = np.mean(series)
-                if self._fft[inst_idx] is None:
-                    nfft = int(np.power(2, np.ceil(np.log(len(series)) / np.log(2))))
-                    self._fft[inst_idx] = np.fft.fft(
-                        series - self._smean[inst_idx], n=nfft
-                    )
-                if self._ac[inst_idx] is None:
-                    self._ac[inst_idx] = _autocorr(series, self._fft[inst_idx])
-                if self._acfz[inst_idx] is None:
-                    self._acfz[inst_idx] = _ac_first_zero(self._ac[inst_idx])
-                args = [series, self._acfz[inst_idx]]
+                self._fft[inst_idx] = np.fft.fft(series - self._smean[inst_idx], n=nfft)
+            if self._ac[inst_idx] is None:
+                self._ac[inst_idx] = _autocorr(series, self._fft[inst_idx])
+            if self._acfz[inst_idx] is None:
+                self._acfz[inst_idx] = _ac_first_zero(self._ac[inst_idx])
+            args = [series, self._acfz[inst_idx]]
 
         return features[feature](*args)
 
@@ -1429,3 +1349,118 @@ features = [
     Catch22._SB_TransitionMatrix_3ac_sumdiagcov,
     Catch22._PD_PeriodicityWang_th0_01,
 ]
+
+# compiled feature functions, referenced as globals by the _catch22_batch kernel
+_sb_binarystats_diff_longstretch0 = Catch22._SB_BinaryStats_diff_longstretch0
+_co_f1ecac = Catch22._CO_f1ecac
+_co_firstmin_ac = Catch22._CO_FirstMin_ac
+_fc_localsimple_mean3_stderr = Catch22._FC_LocalSimple_mean3_stderr
+_co_trev_1_num = Catch22._CO_trev_1_num
+_co_histogramami_even_2_5 = Catch22._CO_HistogramAMI_even_2_5
+_in_automutualinfostats_40_gaussian_fmmi = (
+    Catch22._IN_AutoMutualInfoStats_40_gaussian_fmmi
+)
+_md_hrv_classic_pnn40 = Catch22._MD_hrv_classic_pnn40
+_sb_binarystats_mean_longstretch1 = Catch22._SB_BinaryStats_mean_longstretch1
+_sb_motifthree_quantile_hh = Catch22._SB_MotifThree_quantile_hh
+_co_embed2_dist_tau_d_expfit_meandiff = Catch22._CO_Embed2_Dist_tau_d_expfit_meandiff
+_sc_fluctanal_2_dfa_50_1_2_logi_prop_r1 = (
+    Catch22._SC_FluctAnal_2_dfa_50_1_2_logi_prop_r1
+)
+_sc_fluctanal_2_rsrangefit_50_1_logi_prop_r1 = (
+    Catch22._SC_FluctAnal_2_rsrangefit_50_1_logi_prop_r1
+)
+_sb_transitionmatrix_3ac_sumdiagcov = Catch22._SB_TransitionMatrix_3ac_sumdiagcov
+_pd_periodicitywang_th0_01 = Catch22._PD_PeriodicityWang_th0_01
+
+
+def _batch_fft(X):
+    # FFT of each mean centred row, zero padded to the next power of two.
+    nfft = int(np.power(2, np.ceil(np.log(X.shape[1]) / np.log(2))))
+    return np.fft.fft(X - X.mean(axis=1, keepdims=True), n=nfft, axis=1)
+
+
+def _batch_autocorr(X, X_fft):
+    # Row-wise version of _autocorr, rows with zero variance get an all zero acf.
+    ca = np.fft.ifft(X_fft * np.conj(X_fft), axis=1).real[:, : X.shape[1]]
+    acf = np.zeros(ca.shape)
+    np.divide(ca, ca[:, :1], out=acf, where=ca[:, :1] != 0)
+    return acf
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _catch22_batch(X, f_idx, transform_feature, X_fft, X_ac, res_ac, outlier_norm):
+    n_series, series_length = X.shape
+    n_channels = transform_feature.shape[0]
+    c22 = np.zeros((n_series, len(f_idx)))
+
+    for i in prange(n_series):
+        series = X[i]
+        channel_mask = transform_feature[i % n_channels]
+
+        smin = np.min(series)
+        smax = np.max(series)
+        smean = np.mean(series)
+        outlier_series = series
+        if outlier_norm:
+            outlier_series = _normalise_series(series, smean)
+        acfz = 0
+        if X_ac.shape[1] > 0:
+            acfz = _ac_first_zero(X_ac[i])
+
+        for n in range(len(f_idx)):
+            if not channel_mask[n]:
+                continue
+
+            feature = f_idx[n]
+            if feature == 0:
+                c22[i, n] = _histogram_mode(series, 5, smin, smax)
+            elif feature == 1:
+                c22[i, n] = _histogram_mode(series, 10, smin, smax)
+            elif feature == 2:
+                c22[i, n] = _sb_binarystats_diff_longstretch0(series, smean)
+            elif feature == 3:
+                c22[i, n] = _outlier_include(outlier_series)
+            elif feature == 4:
+                c22[i, n] = _outlier_include(-outlier_series)
+            elif feature == 5:
+                c22[i, n] = _co_f1ecac(X_ac[i])
+            elif feature == 6:
+                c22[i, n] = _co_firstmin_ac(X_ac[i])
+            elif feature == 7:
+                c22[i, n] = _summaries_welch_rect(series, False, X_fft[i])
+            elif feature == 8:
+                c22[i, n] = _summaries_welch_rect(series, True, X_fft[i])
+            elif feature == 9:
+                c22[i, n] = _fc_localsimple_mean3_stderr(series)
+            elif feature == 10:
+                c22[i, n] = _co_trev_1_num(series)
+            elif feature == 11:
+                c22[i, n] = _co_histogramami_even_2_5(series, smin, smax)
+            elif feature == 12:
+                c22[i, n] = _in_automutualinfostats_40_gaussian_fmmi(X_ac[i])
+            elif feature == 13:
+                c22[i, n] = _md_hrv_classic_pnn40(series)
+            elif feature == 14:
+                c22[i, n] = _sb_binarystats_mean_longstretch1(series)
+            elif feature == 15:
+                c22[i, n] = _sb_motifthree_quantile_hh(series)
+            elif feature == 16:
+                if series_length > 1:
+                    c22[i, n] = _ac_first_zero(res_ac[i]) / acfz
+            elif feature == 17:
+                c22[i, n] = _co_embed2_dist_tau_d_expfit_meandiff(series, acfz)
+            elif feature == 18:
+                c22[i, n] = _sc_fluctanal_2_dfa_50_1_2_logi_prop_r1(series)
+            elif feature == 19:
+                c22[i, n] = _sc_fluctanal_2_rsrangefit_50_1_logi_prop_r1(series)
+            elif feature == 20:
+                c22[i, n] = _sb_transitionmatrix_3ac_sumdiagcov(series, acfz)
+            elif feature == 21:
+                c22[i, n] = _pd_periodicitywang_th0_01(series)
+            elif feature == 22:
+                c22[i, n] = smean
+            elif feature == 23:
+                c22[i, n] = np.std(series)
+
+    return c22
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Cache of windowed DFT coefficients shared by the SFA transformers of an ensemble.
+
+Ensembles such as BOSS, cBOSS and TDE build many SFA transformers over the same data
+which share a window size but differ in word length, normalisation or alphabet size.
+The windowed Fourier coefficients only depend on the window size, so they are computed
+once at the longest length required and each transformer truncates them to its own
+word length before deriving words and bags.
+"""
+
+__all__ = ["_DFTCache"]
+
+import copy
+from collections import OrderedDict
+
+import numpy as np
+
+
+class _DFTCache:
+    """Windowed DFT coefficients of a time series collection, shared between SFAs.
+
+    Entries are computed for the full collection and are keyed by the transformer
+    settings they depend on (i.e. the window size). Stored coefficients are truncated
+    to the requested length, and are recomputed if a longer length is requested.
+
+    Parameters
+    ----------
+    X : 3D np.ndarray of shape (n_instances, n_dims, series_length)
+        The collection the coefficients are computed for.
+    max_bytes : int, default=2**28
+        Least recently used entries are dropped once the size of the cached arrays
+        exceeds this limit. The most recently used entry is always kept.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.transformations.panel.dictionary_based._dft_cache import _DFTCache
+    >>> X = np.random.random((5, 1, 20))
+    >>> cache = _DFTCache(X)
+    >>> compute = lambda X, length: np.fft.rfft(X)[:, :length]
+    >>> cache.get(X[:, 0], ("rfft",), 4, compute).shape
+    (5, 4)
+    >>> cache.subset(rows=[0, 2]).get(X[[0, 2], 0], ("rfft",), 2, compute).shape
+    (2, 2)
+    """
+
+    def __init__(self, X, max_bytes=2**28):
+        self.X = X
+        self.max_bytes = max_bytes
+
+        self.rows = None
+        self.dim = 0
+        self._store = OrderedDict()
+
+    def subset(self, rows=None, dim=None):
+        """Return a view of the cache for a subset of cases or a single dimension.
+
+        The view shares the stored coefficients, which are always computed for the
+        full collection.
+
+        Parameters
+        ----------
+        rows : array-like of int or None, default=None
+            The cases of the collection the view is used for. If None, the rows of
+            this cache are kept.
+        dim : int or None, default=None
+            The dimension of the collection the view is used for. If None, the
+            dimension of this cache is kept.
+
+        Returns
+        -------
+        cache : _DFTCache
+            The view of the cache.
+        """
+        cache = copy.copy(self)
+        if rows is not None:
+            cache.rows = np.asarray(rows)
+        if dim is not None:
+            cache.dim = dim
+        return cache
+
+    def get(self, X, key, length, compute):
+        """Get the coefficients of X, computing them if they are not stored.
+
+        Parameters
+        ----------
+        X : 2D np.ndarray of shape (n_instances, series_length)
+            The series the coefficients are requested for. If X is not equal in value
+            to the rows and dimension of the cached collection, e.g. new data passed
+            to transform, the coefficients are computed from X and not stored.
+        key : tuple
+            The settings the coefficients depend on.
+        length : int
+            The number of coefficients required, the size of the last axis.
+        compute : callable
+            Function computing the coefficients from a 2D array of series and a length.
+            The first axis of the output must correspond to the input series.
+
+        Returns
+        -------
+        dfts : np.ndarray
+            The coefficients of X.
+        """
+        if not self._is_cached(X):
+            return compute(X, length)
+
+        key = (self.dim,) + tuple(key)
+        dfts = self._store.get(key)
+        if dfts is None or dfts.shape[-1] < length:
+            dfts = compute(np.ascontiguousarray(self.X[:, self.dim]), length)
+            self._store[key] = dfts
+            self._evict()
+        self._store.move_to_end(key)
+
+        dfts = dfts[..., :length]
+        return dfts if self.rows is None else dfts[self.rows]
+
+    def _is_cached(self, X):
+        """Check X is equal to the rows and dimension of the cached collection.
+
+        Different data of the same shape is not cached. Comparing the values is linear
+        in the size of X, much cheaper than computing the windowed coefficients.
+        """
+        n_instances = self.X.shape[0] if self.rows is None else len(self.rows)
+        if X.shape != (n_instances, self.X.shape[2]):
+            return False
+        cached = (
+            self.X[:, self.dim] if self.rows is None else self.X[self.rows, self.dim]
+        )
+        return np.array_equal(X, cached)
+
+    def _evict(self):
+        size = sum(dfts.nbytes for dfts in self._store.values())
+        while size > self.max_bytes and len(self._store) > 1:
+            _, dfts = self._store.popitem(last=False)
+            size -= dfts.nbytes
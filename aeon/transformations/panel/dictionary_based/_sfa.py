@@ -165,6 +165,7 @@ class SFA(BaseTransformer):
         self.typed_dict = typed_dict
 
         self.n_jobs = n_jobs
+        self._dft_cache = None
 
         self.n_instances = 0
         self.series_length = 0
@@ -254,12 +255,19 @@ class SFA(BaseTransformer):
         """
         X = X.squeeze(1)
 
+        if self.keep_binning_dft:
+            dfts = self.binning_dft
+        elif self._dft_cache is not None:
+            dfts = self._cached_mft(X)
+        else:
+            dfts = None
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NumbaTypeSafetyWarning)
             transform = Parallel(n_jobs=self.n_jobs, prefer="threads")(
                 delayed(self._transform_case)(
                     X[i, :],
-                    supplied_dft=self.binning_dft[i] if self.keep_binning_dft else None,
+                    supplied_dft=dfts[i] if dfts is not None else None,
                 )
                 for i in range(X.shape[0])
             )
@@ -386,12 +394,33 @@ class SFA(BaseTransformer):
 
     def _binning(self, X, y=None):
         num_windows_per_inst = math.ceil(self.series_length / self.window_size)
-        dft = np.array(
-            [
-                self._binning_dft(X[i, :], num_windows_per_inst)
-                for i in range(self.n_instances)
-            ]
-        )
+        if self._dft_cache is not None:
+            # the cache stores all coefficients from the first, the first two are
+            # dropped if normalising
+            start = 2 if self.norm else 0
+            dft = self._dft_cache.get(
+                X,
+                (
+                    "sfa_binning",
+                    self.window_size,
+                    self.lower_bounding,
+                    self._use_fallback_dft,
+                ),
+                start + self.dft_length,
+                lambda X, length: np.array(
+                    [
+                        self._binning_dft(X[i, :], num_windows_per_inst, length, False)
+                        for i in range(len(X))
+                    ]
+                ),
+            )[:, :, start:]
+        else:
+            dft = np.array(
+                [
+                    self._binning_dft(X[i, :], num_windows_per_inst)
+                    for i in range(self.n_instances)
+                ]
+            )
         if self.keep_binning_dft:
             self.binning_dft = dft
         dft = dft.reshape(len(X) * num_windows_per_inst, self.dft_length)
@@ -487,9 +516,14 @@ class SFA(BaseTransformer):
 
         return np.sort(breakpoints, axis=1)
 
-    def _binning_dft(self, series, num_windows_per_inst):
+    def _binning_dft(self, series, num_windows_per_inst, dft_length=None, norm=None):
         # Splits individual time series into windows and returns the DFT for
         # each
+        if dft_length is None:
+            dft_length = self.dft_length
+        if norm is None:
+            norm = self.norm
+
         split = np.split(
             series,
             np.linspace(
@@ -502,24 +536,24 @@ class SFA(BaseTransformer):
         start = self.series_length - self.window_size
         split[-1] = series[start : self.series_length]
 
-        result = np.zeros((len(split), self.dft_length), dtype=np.float64)
+        result = np.zeros((len(split), dft_length), dtype=np.float64)
 
         for i, row in enumerate(split):
             result[i] = (
                 self._discrete_fourier_transform(
                     row,
-                    self.dft_length,
-                    self.norm,
+                    dft_length,
+                    norm,
                     self.inverse_sqrt_win_size,
                     self.lower_bounding,
                 )
                 if self._use_fallback_dft
-                else self._fast_fourier_transform(row)
+                else self._fast_fourier_transform(row, dft_length, norm)
             )
 
         return result
 
-    def _fast_fourier_transform(self, series):
+    def _fast_fourier_transform(self, series, dft_length=None, norm=None):
         """Perform a discrete fourier transform using the fast fourier transform.
 
         if self.norm is True, then the first term of the DFT is ignored
@@ -535,8 +569,13 @@ class SFA(BaseTransformer):
         num_atts or
         num_atts-2 if if self.norm is True
         """
+        if dft_length is None:
+            dft_length = self.dft_length
+        if norm is None:
+            norm = self.norm
+
         # first two are real and imaginary parts
-        start = 2 if self.norm else 0
+        start = 2 if norm else 0
 
         s = np.std(series)
         std = s if s > 1e-8 else 1
@@ -545,7 +584,7 @@ class SFA(BaseTransformer):
         reals = np.real(X_fft)
         imags = np.imag(X_fft)
 
-        length = start + self.dft_length
+        length = start + dft_length
         dft = np.empty((length,), dtype=reals.dtype)
         dft[0::2] = reals[: np.uint32(length / 2)]
         dft[1::2] = imags[: np.uint32(length / 2)]
@@ -613,6 +652,35 @@ class SFA(BaseTransformer):
     def _mft(self, series):
         start_offset = 2 if self.norm else 0
         length = self.dft_length + start_offset + self.dft_length % 2
+        transformed = self._windowed_dft(series, length)
+
+        return (
+            transformed[:, start_offset:][:, self.support]
+            if self.anova
+            else transformed[:, start_offset:]
+        )
+
+    def _cached_mft(self, X):
+        # the cache stores all coefficients from the first
+        start_offset = 2 if self.norm else 0
+        dfts = self._dft_cache.get(
+            X,
+            ("sfa_mft", self.window_size, self.lower_bounding, self._use_fallback_dft),
+            self.dft_length + start_offset + self.dft_length % 2,
+            lambda X, length: np.array(
+                [self._windowed_dft(X[i], length) for i in range(len(X))]
+            ),
+        )
+
+        return (
+            dfts[:, :, start_offset:][:, :, self.support]
+            if self.anova
+            else dfts[:, :, start_offset:]
+        )
+
+    def _windowed_dft(self, series, length):
+        # the first length DFT coefficients of each window, not dropping the first
+        # two when normalising
         end = max(1, len(series) - self.window_size + 1)
 
         phis = SFA._get_phis(self.window_size, length)
@@ -623,8 +691,8 @@ class SFA(BaseTransformer):
         if self._use_fallback_dft:
             mft_data = self._discrete_fourier_transform(
                 series[0 : self.window_size],
-                self.dft_length,
-                self.norm,
+                length,
+                False,
                 self.inverse_sqrt_win_size,
                 self.lower_bounding,
                 apply_normalising_factor=False,
@@ -655,11 +723,7 @@ class SFA(BaseTransformer):
         if self.lower_bounding:
             transformed[:, 1::2] = transformed[:, 1::2] * -1  # lower bounding
 
-        return (
-            transformed[:, start_offset:][:, self.support]
-            if self.anova
-            else transformed[:, start_offset:]
-        )
+        return transformed
 
     @staticmethod
     @njit(fastmath=True, cache=True)
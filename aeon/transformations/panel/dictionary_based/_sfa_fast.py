@@ -228,6 +228,7 @@ class SFAFast(BaseTransformer):
         self.return_pandas_data_series = return_pandas_data_series
 
         self.random_state = random_state
+        self._dft_cache = None
         super(SFAFast, self).__init__()
 
         if not return_pandas_data_series:
@@ -278,22 +279,15 @@ class SFAFast(BaseTransformer):
         self.breakpoints = self._binning(X2, y)
         self._is_fitted = True
 
-        words, dfts = _transform_case(
-            X2,
+        words = _transform_words(
+            self._windowed_dfts(X2),
             self.window_size,
-            self.dft_length,
             self.word_length_actual,
-            self.norm,
             self.remove_repeat_words,
-            self.support,
-            self.anova,
-            self.variance,
             self.breakpoints,
             self.letter_bits,
             self.bigrams,
             self.skip_grams,
-            self.inverse_sqrt_win_size,
-            self.lower_bounding,
         )
 
         if self.remove_repeat_words:
@@ -342,22 +336,15 @@ class SFAFast(BaseTransformer):
         else:
             X2, self.X_index = X, np.arange(X.shape[-1])
 
-        words, dfts = _transform_case(
-            X2,
+        words = _transform_words(
+            self._windowed_dfts(X2),
             self.window_size,
-            self.dft_length,
             self.word_length_actual,
-            self.norm,
             self.remove_repeat_words,
-            self.support,
-            self.anova,
-            self.variance,
             self.breakpoints,
             self.letter_bits,
             self.bigrams,
             self.skip_grams,
-            self.inverse_sqrt_win_size,
-            self.lower_bounding,
         )
 
         # only save at fit
@@ -483,16 +470,80 @@ class SFAFast(BaseTransformer):
             bag_of_words = csr_matrix(bag_of_words, dtype=np.uint32)
         return bag_of_words
 
-    def _binning(self, X, y=None):
-        dft = _binning_dft(
+    def _use_dft_cache(self):
+        # the cached coefficients are of the undilated series
+        return self._dft_cache is not None and not (
+            self.dilation >= 1 or self.first_difference
+        )
+
+    def _windowed_dfts(self, X):
+        if not self._use_dft_cache():
+            return _mft(
+                X,
+                self.window_size,
+                self.dft_length,
+                self.norm,
+                self.support,
+                self.anova,
+                self.variance,
+                self.inverse_sqrt_win_size,
+                self.lower_bounding,
+            )
+
+        # the cache stores all coefficients from the first, the first two are
+        # dropped if normalising and the selected coefficients kept with anova
+        start = 2 if self.norm else 0
+        dfts = self._dft_cache.get(
             X,
-            self.window_size,
-            self.series_length,
-            self.dft_length,
-            self.norm,
-            self.inverse_sqrt_win_size,
-            self.lower_bounding,
+            ("mft", self.window_size, self.lower_bounding),
+            start + self.dft_length,
+            lambda X, length: _mft(
+                X,
+                self.window_size,
+                length,
+                False,
+                self.support,
+                False,
+                False,
+                self.inverse_sqrt_win_size,
+                self.lower_bounding,
+            ),
         )
+        if self.anova or self.variance:
+            return dfts[:, :, self.support + start]
+        return dfts[:, :, start:]
+
+    def _binning_dfts(self, X):
+        if not self._use_dft_cache():
+            return _binning_dft(
+                X,
+                self.window_size,
+                self.series_length,
+                self.dft_length,
+                self.norm,
+                self.inverse_sqrt_win_size,
+                self.lower_bounding,
+            )
+
+        start = 2 if self.norm else 0
+        dfts = self._dft_cache.get(
+            X,
+            ("binning", self.window_size, self.lower_bounding),
+            start + self.dft_length,
+            lambda X, length: _binning_dft(
+                X,
+                self.window_size,
+                X.shape[1],
+                length,
+                False,
+                self.inverse_sqrt_win_size,
+                self.lower_bounding,
+            ).reshape(len(X), -1, length),
+        )
+        return dfts[:, :, start:].reshape(-1, self.dft_length)
+
+    def _binning(self, X, y=None):
+        dft = self._binning_dfts(X)
 
         if y is not None:
             y = np.repeat(y, dft.shape[0] / len(y))
@@ -752,35 +803,16 @@ def _fast_fourier_transform(X, norm, dft_length, inverse_sqrt_win_size):
 
 
 @njit(fastmath=True, cache=True)
-def _transform_case(
-    X,
+def _transform_words(
+    dfts,
     window_size,
-    dft_length,
     word_length,
-    norm,
     remove_repeat_words,
-    support,
-    anova,
-    variance,
     breakpoints,
     letter_bits,
     bigrams,
     skip_grams,
-    inverse_sqrt_win_size,
-    lower_bounding,
 ):
-    dfts = _mft(
-        X,
-        window_size,
-        dft_length,
-        norm,
-        support,
-        anova,
-        variance,
-        inverse_sqrt_win_size,
-        lower_bounding,
-    )
-
     words = generate_words(
         dfts,
         bigrams,
@@ -794,7 +826,7 @@ def _transform_case(
     if remove_repeat_words:
         words = remove_repeating_words(words)
 
-    return words, dfts
+    return words
 
 
 @njit(fastmath=True, cache=True)
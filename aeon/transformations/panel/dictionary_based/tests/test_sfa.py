@@ -4,7 +4,9 @@ import sys
 import numpy as np
 import pytest
 
+from aeon.transformations.panel.dictionary_based._dft_cache import _DFTCache
 from aeon.transformations.panel.dictionary_based._sfa import SFA
+from aeon.transformations.panel.dictionary_based._sfa_fast import SFAFast
 
 
 # Check the transformer has changed the data correctly.
@@ -209,3 +211,58 @@ def test_typed_dict():
     word_list2 = p2.bag_to_string(p2.transform(X, y)[0][0])
 
     assert word_list == word_list2
+
+
+@pytest.mark.parametrize("sfa", [SFA, SFAFast])
+@pytest.mark.parametrize("norm", [True, False])
+@pytest.mark.parametrize("anova", [True, False])
+def test_dft_cache(sfa, norm, anova):
+    X = np.random.rand(10, 1, 100)
+    y = np.array([0, 0, 0, 0, 0, 1, 1, 1, 1, 1])
+    subsample = np.array([0, 2, 3, 5, 6, 9])
+    cache = _DFTCache(X)
+
+    # fill the cache using a transformer with longer words
+    long = sfa(word_length=10, window_size=16, norm=not norm)
+    long._dft_cache = cache
+    long.fit(X, y)
+
+    for rows in [None, subsample]:
+        X_rows = X if rows is None else X[rows]
+        y_rows = y if rows is None else y[rows]
+
+        p = sfa(word_length=6, window_size=16, norm=norm, anova=anova)
+        p._dft_cache = cache.subset(rows=rows)
+        p.fit(X_rows, y_rows)
+        p2 = sfa(word_length=6, window_size=16, norm=norm, anova=anova)
+        p2.fit(X_rows, y_rows)
+
+        np.testing.assert_array_equal(p.breakpoints, p2.breakpoints)
+        if sfa is SFA:
+            assert p.transform(X_rows) == p2.transform(X_rows)
+        else:
+            assert (p.transform(X_rows) != p2.transform(X_rows)).nnz == 0
+
+
+def test_dft_cache_different_data():
+    """Test coefficients of different data of the same shape are not cached."""
+    X = np.random.rand(10, 1, 20)
+    X_new = np.random.rand(10, 1, 20)
+    cache = _DFTCache(X)
+
+    def compute(X, length):
+        return np.fft.rfft(X)[:, :length]
+
+    np.testing.assert_array_equal(
+        cache.get(X[:, 0], ("rfft",), 4, compute), compute(X[:, 0], 4)
+    )
+    np.testing.assert_array_equal(
+        cache.get(X_new[:, 0], ("rfft",), 4, compute), compute(X_new[:, 0], 4)
+    )
+    rows = cache.subset(rows=[1, 3])
+    np.testing.assert_array_equal(
+        rows.get(X_new[[1, 3], 0], ("rfft",), 4, compute), compute(X_new[[1, 3], 0], 4)
+    )
+    np.testing.assert_array_equal(
+        rows.get(X[[1, 3], 0], ("rfft",), 4, compute), compute(X[[1, 3], 0], 4)
+    )
@@ -1017,7 +1017,6 @@ class RandomShapeletTransform(BaseTransformer):
         self._batch_size = batch_size
         self._class_counts = []
         self._class_dictionary = {}
-        self._sorted_indicies = []
 
         super(RandomShapeletTransform, self).__init__(_output_convert=False)
 
@@ -1059,6 +1058,10 @@ class RandomShapeletTransform(BaseTransformer):
         start_time = time.time()
         fit_time = 0
 
+        # sliding dot product and window statistic tables of each channel, shared by
+        # all candidate shapelets
+        tables = [_series_tables(X[:, i]) for i in range(self.n_channels)]
+
         max_shapelets_per_class = int(self._max_shapelets / self.n_classes)
         if max_shapelets_per_class < 1:
             max_shapelets_per_class = 1
@@ -1079,6 +1082,7 @@ class RandomShapeletTransform(BaseTransformer):
                     delayed(self._extract_random_shapelet)(
                         X,
                         y,
+                        tables,
                         n_shapelets_extracted + i,
                         shapelets,
                         max_shapelets_per_class,
@@ -1116,6 +1120,7 @@ class RandomShapeletTransform(BaseTransformer):
                     delayed(self._extract_random_shapelet)(
                         X,
                         y,
+                        tables,
                         n_shapelets_extracted + i,
                         shapelets,
                         max_shapelets_per_class,
@@ -1157,14 +1162,6 @@ class RandomShapeletTransform(BaseTransformer):
         to_keep = self._remove_identical_shapelets(List(self.shapelets))
         self.shapelets = [n for (n, b) in zip(self.shapelets, to_keep) if b]
 
-        self._sorted_indicies = []
-        for s in self.shapelets:
-            sabs = np.abs(s[6])
-            self._sorted_indicies.append(
-                np.array(
-                    sorted(range(s[1]), reverse=True, key=lambda j, sabs=sabs: sabs[j])
-                )
-            )
         return self
 
     def _transform(self, X, y=None):
@@ -1181,22 +1178,28 @@ class RandomShapeletTransform(BaseTransformer):
             The transformed data.
         """
         output = np.zeros((len(X), len(self.shapelets)))
-
-        for i, series in enumerate(X):
-            dists = Parallel(
-                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-            )(
-                delayed(_online_shapelet_distance)(
-                    series[shapelet[3]],
-                    shapelet[6],
-                    self._sorted_indicies[n],
-                    shapelet[2],
-                    shapelet[1],
-                )
-                for n, shapelet in enumerate(self.shapelets)
+        if len(self.shapelets) == 0:
+            return output
+
+        tables = {
+            dim: _series_tables(X[:, dim])
+            for dim in {shapelet[3] for shapelet in self.shapelets}
+        }
+
+        dists = Parallel(
+            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(_shapelet_distances)(
+                X[:, shapelet[3]],
+                tables[shapelet[3]],
+                shapelet[6],
+                shapelet[2],
             )
+            for shapelet in self.shapelets
+        )
 
-            output[i] = dists
+        for n, shapelet_dists in enumerate(dists):
+            output[:, n] = shapelet_dists
 
         return output
 
@@ -1220,7 +1223,9 @@ class RandomShapeletTransform(BaseTransformer):
         """
         return {"max_shapelets": 5, "n_shapelet_samples": 50, "batch_size": 20}
 
-    def _extract_random_shapelet(self, X, y, i, shapelets, max_shapelets_per_class):
+    def _extract_random_shapelet(
+        self, X, y, tables, i, shapelets, max_shapelets_per_class
+    ):
         rs = 255 if self.random_state == 0 else self.random_state
         rs = (
             None
@@ -1245,19 +1250,11 @@ class RandomShapeletTransform(BaseTransformer):
         dim = rng.randint(0, self.n_channels)
 
         shapelet = z_normalise_series(X[inst_idx, dim, position : position + length])
-        sabs = np.abs(shapelet)
-        sorted_indicies = np.array(
-            sorted(range(length), reverse=True, key=lambda j: sabs[j])
-        )
+        distances = _shapelet_distances(X[:, dim], tables[dim], shapelet, position)
 
         quality = self._find_shapelet_quality(
-            X,
+            distances,
             y,
-            shapelet,
-            sorted_indicies,
-            position,
-            length,
-            dim,
             inst_idx,
             self._class_counts[cls_idx],
             self.n_instances - self._class_counts[cls_idx],
@@ -1269,30 +1266,23 @@ class RandomShapeletTransform(BaseTransformer):
     @staticmethod
     @njit(fastmath=True, cache=True)
     def _find_shapelet_quality(
-        X,
+        distances,
         y,
-        shapelet,
-        sorted_indicies,
-        position,
-        length,
-        dim,
         inst_idx,
         this_cls_count,
         other_cls_count,
         worst_quality,
     ):
-        # This is slow and could be optimised, we spend 99% of time here
-        orderline = []
+        # the orderline holds the distances and classes of the series traversed so
+        # far, sorted by (distance, class) using binary insertion
+        n_instances = len(distances)
+        orderline_dists = np.zeros(n_instances)
+        orderline = np.zeros(n_instances, dtype=np.int64)
         this_cls_traversed = 0
         other_cls_traversed = 0
 
-        for i, series in enumerate(X):
-            if i != inst_idx:
-                distance = _online_shapelet_distance(
-                    series[dim], shapelet, sorted_indicies, position, length
-                )
-            else:
-                distance = 0
+        for i in range(n_instances):
+            distance = distances[i] if i != inst_idx else 0
 
             if y[i] == y[inst_idx]:
                 cls = 1
@@ -1301,12 +1291,26 @@ class RandomShapeletTransform(BaseTransformer):
                 cls = -1
                 other_cls_traversed += 1
 
-            orderline.append((distance, cls))
-            orderline.sort()
+            lo = 0
+            hi = i
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if orderline_dists[mid] < distance or (
+                    orderline_dists[mid] == distance and orderline[mid] <= cls
+                ):
+                    lo = mid + 1
+                else:
+                    hi = mid
+
+            for n in range(i, lo, -1):
+                orderline_dists[n] = orderline_dists[n - 1]
+                orderline[n] = orderline[n - 1]
+            orderline_dists[lo] = distance
+            orderline[lo] = cls
 
             if worst_quality > 0:
                 quality = _calc_early_binary_ig(
-                    orderline,
+                    orderline[: i + 1],
                     this_cls_traversed,
                     other_cls_traversed,
                     this_cls_count - this_cls_traversed,
@@ -1378,67 +1382,124 @@ class RandomShapeletTransform(BaseTransformer):
         return to_keep
 
 
-@njit(fastmath=True, cache=True)
-def _online_shapelet_distance(series, shapelet, sorted_indicies, position, length):
-    subseq = series[position : position + length]
-
-    sum = 0.0
-    sum2 = 0.0
-    for i in subseq:
-        sum += i
-        sum2 += i * i
-
-    mean = sum / length
-    std = (sum2 - mean * mean * length) / length
-    if std > 0:
-        subseq = (subseq - mean) / std
-    else:
-        subseq = np.zeros(length)
-
-    best_dist = 0
-    for i, n in zip(shapelet, subseq):
-        temp = i - n
-        best_dist += temp * temp
-
-    i = 1
-    traverse = [True, True]
-    sums = [sum, sum]
-    sums2 = [sum2, sum2]
-
-    while traverse[0] or traverse[1]:
-        for n in range(2):
-            mod = -1 if n == 0 else 1
-            pos = position + mod * i
-            traverse[n] = pos >= 0 if n == 0 else pos <= len(series) - length
-
-            if not traverse[n]:
-                continue
+def _series_tables(X):
+    """Precompute the tables used to find distances between shapelets and series.
+
+    Parameters
+    ----------
+    X : 2D np.ndarray of shape (n_instances, series_length)
+        A single channel of the series.
+
+    Returns
+    -------
+    tables : tuple
+        The FFT of the mean centred series zero padded to a power of two, and the
+        cumulative sums of the mean centred series and their squares. Used for the
+        sliding dot products and the mean and standard deviation of each window.
+    """
+    n_instances, series_length = X.shape
+    # the sliding dot products of all windows are not affected by the circular
+    # convolution as long as the padded length is at least the series length
+    n_fft = 1 << int(series_length - 1).bit_length()
 
-            start = series[pos - n]
-            end = series[pos - n + length]
+    # centring the series reduces the cancellation in the window variances
+    X = X - X.mean(axis=1, keepdims=True)
+    X_fft = np.fft.rfft(X, n=n_fft, axis=1)
+    cumsum = np.zeros((n_instances, series_length + 1))
+    cumsum[:, 1:] = np.cumsum(X, axis=1)
+    cumsum2 = np.zeros((n_instances, series_length + 1))
+    cumsum2[:, 1:] = np.cumsum(X * X, axis=1)
 
-            sums[n] += mod * end - mod * start
-            sums2[n] += mod * end * end - mod * start * start
+    return X_fft, cumsum, cumsum2
 
-            mean = sums[n] / length
-            std = math.sqrt((sums2[n] - mean * mean * length) / length)
 
-            dist = 0
-            use_std = std != 0
-            for j in range(length):
-                val = (series[pos + sorted_indicies[j]] - mean) / std if use_std else 0
-                temp = shapelet[sorted_indicies[j]] - val
-                dist += temp * temp
+def _shapelet_distances(X, tables, shapelet, position):
+    """Find the distance between a shapelet and each series.
 
-                if dist > best_dist:
-                    break
+    The distance is the minimum squared Euclidean distance between the shapelet and
+    the z-normalised windows of the series, divided by the shapelet length. The
+    distance profile of every series is computed at once with FFT sliding dot
+    products (MASS), and the distance of the best window is recomputed exactly.
+
+    Parameters
+    ----------
+    X : 2D np.ndarray of shape (n_instances, series_length)
+        A single channel of the series.
+    tables : tuple
+        The tables of X, as returned by _series_tables.
+    shapelet : 1D np.ndarray
+        The z-normalised shapelet.
+    position : int
+        The position the shapelet was extracted from. The window at this position
+        is normalised as in the online distance of the original implementation.
+
+    Returns
+    -------
+    distances : 1D np.ndarray of shape (n_instances,)
+        The distance between the shapelet and each series.
+    """
+    X_fft, cumsum, cumsum2 = tables
+    n_fft = 2 * (X_fft.shape[1] - 1)
+
+    shapelet_fft = np.fft.rfft(shapelet[::-1], n=n_fft)
+    dots = np.fft.irfft(X_fft * shapelet_fft, n=n_fft, axis=1)
 
-            if dist < best_dist:
-                best_dist = dist
+    return _min_distances(X, dots, cumsum, cumsum2, shapelet, position)
+
+
+@njit(fastmath=True, cache=True)
+def _min_distances(X, dots, cumsum, cumsum2, shapelet, position):
+    n_instances, series_length = X.shape
+    length = len(shapelet)
+    shapelet_sum = np.sum(shapelet)
+    shapelet_sum2 = np.sum(shapelet * shapelet)
+    distances = np.zeros(n_instances)
+
+    for i in range(n_instances):
+        # the window at the shapelet position is divided by its variance
+        subseq = X[i, position : position + length]
+        mean = np.sum(subseq) / length
+        std = (np.sum(subseq * subseq) - mean * mean * length) / length
+        if std > 0:
+            subseq = (subseq - mean) / std
+        else:
+            subseq = np.zeros(length)
+        best_dist = np.sum((shapelet - subseq) ** 2)
+
+        # find the best other window from the distance profile, windows which are
+        # constant up to rounding errors are normalised to zeros
+        scale = 1e-10 * cumsum2[i, series_length] / series_length
+        best_pos = -1
+        best_profile = np.inf
+        for pos in range(series_length - length + 1):
+            if pos == position:
+                continue
+
+            mean = (cumsum[i, pos + length] - cumsum[i, pos]) / length
+            var = (cumsum2[i, pos + length] - cumsum2[i, pos]) / length - mean * mean
+            if var > scale:
+                dot = dots[i, pos + length - 1] - mean * shapelet_sum
+                profile = shapelet_sum2 + length - 2 * dot / math.sqrt(var)
+            else:
+                profile = shapelet_sum2
+
+            if profile < best_profile:
+                best_profile = profile
+                best_pos = pos
+
+        if best_pos >= 0:
+            subseq = X[i, best_pos : best_pos + length]
+            mean = np.sum(subseq) / length
+            std = (np.sum(subseq * subseq) - mean * mean * length) / length
+            if std > 0:
+                subseq = (subseq - mean) / math.sqrt(std)
+            else:
+                subseq = np.zeros(length)
+            best_dist = min(best_dist, np.sum((shapelet - subseq) ** 2))
 
-        i += 1
+        distances[i] = best_dist / length
 
-    return best_dist if best_dist == 0 else 1 / length * best_dist
+    return distances
 
 
 @njit(fastmath=True, cache=True)
@@ -1464,7 +1525,7 @@ def _calc_early_binary_ig(
 
     # evaluate each split point
     for split in range(len(orderline)):
-        next_class = orderline[split][1]  # +1 if this class, -1 if other
+        next_class = orderline[split]  # +1 if this class, -1 if other
         if next_class > 0:
             c1_count += 1
         else:
@@ -1518,7 +1579,7 @@ def _calc_binary_ig(orderline, c1, c2):
 
     # evaluate each split point
     for split in range(len(orderline)):
-        next_class = orderline[split][1]  # +1 if this class, -1 if other
+        next_class = orderline[split]  # +1 if this class, -1 if other
         if next_class > 0:
             c1_count += 1
         else:
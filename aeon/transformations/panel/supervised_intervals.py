@@ -15,6 +15,7 @@ from sklearn.utils import check_random_state
 
 from aeon.transformations.base import BaseTransformer
 from aeon.utils.numba.general import z_normalise_series_3d
+from aeon.utils.numba.interval_stats import interval_stats
 from aeon.utils.numba.stats import (
     fisher_score,
     row_count_above_mean,
@@ -266,6 +267,19 @@ class SupervisedIntervals(BaseTransformer):
         return self
 
     def _transform(self, X, y=None):
+        # summary statistic features are extracted for all intervals in one pass
+        stats = np.array(
+            [
+                _INTERVAL_STAT_FEATURES.get(interval[3], -1)
+                if self._transform_features[i]
+                else -1
+                for i, interval in enumerate(self.intervals_)
+            ],
+            dtype=int,
+        )
+        is_stat = stats >= 0
+        other = np.flatnonzero(~is_stat)
+
         transform = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
         )(
@@ -273,13 +287,23 @@ class SupervisedIntervals(BaseTransformer):
                 X,
                 i,
             )
-            for i in range(len(self.intervals_))
+            for i in other
         )
 
-        Xt = np.zeros((X.shape[0], len(transform)))
-        for i, t in enumerate(transform):
+        Xt = np.zeros((X.shape[0], len(self.intervals_)))
+        for i, t in zip(other, transform):
             Xt[:, i] = t
 
+        if is_stat.any():
+            intervals = [self.intervals_[i] for i in np.flatnonzero(is_stat)]
+            Xt[:, is_stat] = interval_stats(
+                X,
+                np.array([interval[0] for interval in intervals]),
+                np.array([interval[1] for interval in intervals]),
+                np.array([interval[2] for interval in intervals]),
+                stats[is_stat],
+            )
+
         return Xt
 
     def _fit_setup(self, X, y):
@@ -499,3 +523,15 @@ class SupervisedIntervals(BaseTransformer):
             "features": row_median,
         }
         return [params1, params2]
+
+
+# default features with an equivalent in INTERVAL_STATS
+_INTERVAL_STAT_FEATURES = {
+    row_mean: 0,
+    row_std: 1,
+    row_slope: 2,
+    row_median: 3,
+    row_iqr: 4,
+    row_numba_min: 5,
+    row_numba_max: 6,
+}
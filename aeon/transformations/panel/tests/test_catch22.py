@@ -32,6 +32,23 @@ def test_catch22_on_basic_motions():
     )
 
 
+def test_catch22_single_feature_and_n_jobs():
+    """Test Catch22 single feature transform and n_jobs match the batch transform."""
+    X_train, _ = load_basic_motions(split="train")
+    X = X_train[:5, :2]
+
+    data = np.asarray(Catch22(catch24=True).fit_transform(X))
+    testing.assert_array_almost_equal(
+        Catch22(catch24=True, n_jobs=2).fit_transform(X), data
+    )
+
+    c22 = Catch22()
+    for i in range(22):
+        testing.assert_array_almost_equal(
+            c22._transform_single_feature(X[:, :1], i), data[:, i]
+        )
+
+
 @pytest.mark.skipif(
     not _check_soft_dependencies("pycatch22", severity="none"),
     reason="skip test if required soft dependency pycatch22 not available",
@@ -4,7 +4,12 @@ import numpy as np
 from numpy import testing
 
 from aeon.datasets import load_basic_motions, load_unit_test
-from aeon.transformations.panel.shapelet_transform import RandomShapeletTransform
+from aeon.transformations.panel.shapelet_transform import (
+    RandomShapeletTransform,
+    _series_tables,
+    _shapelet_distances,
+)
+from aeon.utils.numba.general import z_normalise_series
 
 
 def test_st_on_unit_test():
@@ -45,6 +50,30 @@ def test_st_on_basic_motions():
     )
 
 
+def test_shapelet_distances():
+    """Test the FFT shapelet distances against a brute force search."""
+    X = np.random.RandomState(0).normal(size=(6, 40)).cumsum(axis=1)
+    X[1, 5:25] = 1
+    tables = _series_tables(X)
+
+    for length, position in [(3, 0), (10, 12), (40, 0)]:
+        shapelet = z_normalise_series(X[0, position : position + length])
+        distances = _shapelet_distances(X, tables, shapelet, position)
+
+        expected = np.zeros(len(X))
+        for i, series in enumerate(X):
+            best = np.inf
+            for pos in range(len(series) - length + 1):
+                subseq = series[pos : pos + length]
+                # the window at the shapelet position is divided by its variance
+                std = subseq.var() if pos == position else subseq.std()
+                subseq = (subseq - subseq.mean()) / std if std > 0 else 0
+                best = min(best, np.sum((shapelet - subseq) ** 2))
+            expected[i] = best / length
+
+        testing.assert_array_almost_equal(distances, expected)
+
+
 shapelet_transform_unit_test_data = np.array(
     [
         [0.0845, 0.1536, 0.1812],
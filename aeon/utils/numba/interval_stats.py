@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Numba summary statistics for many intervals of a time series collection.
+
+Cumulative sums, sums of squares and index-weighted sums are computed once per series,
+after which the mean, standard deviation and slope of any interval take constant time.
+The minimum and maximum of an interval are found using sparse tables in constant time,
+or from the interval values if the (larger) sparse tables are not computed. The median
+and interquartile range are not decomposable and are computed from the interval values.
+"""
+
+__all__ = [
+    "INTERVAL_STATS",
+    "interval_stats",
+    "interval_stats_tables",
+    "interval_stats_from_tables",
+]
+
+import numpy as np
+from numba import njit
+
+INTERVAL_STATS = ["mean", "std", "slope", "median", "iqr", "min", "max"]
+
+
+def interval_stats(X, starts, ends, dims, stats):
+    """Summary statistics of intervals of a 3d numpy array.
+
+    Parameters
+    ----------
+    X : 3d numpy array of shape (n_instances, n_dims, series_length)
+        The time series collection.
+    starts : 1d numpy array of int of shape (n_features)
+        The start index (inclusive) of the interval for each feature.
+    ends : 1d numpy array of int of shape (n_features)
+        The end index (exclusive) of the interval for each feature.
+    dims : 1d numpy array of int of shape (n_features)
+        The dimension of the interval for each feature.
+    stats : 1d numpy array of int of shape (n_features)
+        The statistic for each feature, as an index of INTERVAL_STATS.
+
+    Returns
+    -------
+    Xt : 2d numpy array of shape (n_instances, n_features)
+        The statistic of each feature interval for all instances.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.utils.numba.interval_stats import interval_stats
+    >>> X = np.arange(10, dtype=np.float64).reshape(1, 1, 10)
+    >>> interval_stats(
+    ...     X, np.array([0, 2]), np.array([5, 9]), np.array([0, 0]), np.array([0, 6])
+    ... )
+    array([[2., 8.]])
+    """
+    tables = interval_stats_tables(X, stats)
+    return interval_stats_from_tables(X, tables, starts, ends, dims, stats)
+
+
+def interval_stats_tables(X, stats=None):
+    """Precompute the tables used to extract interval statistics from X.
+
+    Parameters
+    ----------
+    X : 3d numpy array of shape (n_instances, n_dims, series_length)
+        The time series collection.
+    stats : 1d numpy array of int or None, default=None
+        The statistics (as indices of INTERVAL_STATS) the tables will be used for.
+        Only the tables required for these statistics are computed. If None, all
+        tables are computed. Leave out the min and max statistics (5 and 6) to save
+        the memory of the sparse tables, which have a log(series_length) factor.
+
+    Returns
+    -------
+    tables : tuple of numpy arrays
+        The row means, centred cumulative sums, centred cumulative sums of squares and
+        centred index-weighted cumulative sums of shape (n_instances, n_dims,
+        series_length + 1), and the minimum and maximum sparse tables of shape
+        (n_levels, n_instances, n_dims, series_length). Tables that are not required
+        for stats are empty.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    stats = np.arange(len(INTERVAL_STATS)) if stats is None else np.asarray(stats)
+
+    if np.isin(stats, [0, 1, 2]).any():
+        means, cs, cs2, csi = _prefix_sums(X)
+    else:
+        means = np.zeros((0, 0))
+        cs = cs2 = csi = np.zeros((0, 0, 0))
+
+    if np.isin(stats, [5]).any():
+        mins = _sparse_table(X, True)
+    else:
+        mins = np.zeros((0, 0, 0, 0))
+
+    if np.isin(stats, [6]).any():
+        maxs = _sparse_table(X, False)
+    else:
+        maxs = np.zeros((0, 0, 0, 0))
+
+    return means, cs, cs2, csi, mins, maxs
+
+
+def interval_stats_from_tables(X, tables, starts, ends, dims, stats):
+    """Summary statistics of intervals of X using precomputed tables.
+
+    Parameters
+    ----------
+    X : 3d numpy array of shape (n_instances, n_dims, series_length)
+        The time series collection.
+    tables : tuple of numpy arrays
+        The tables returned by interval_stats_tables for X. Must contain the tables
+        for the mean, std and slope if these are in stats. The min and max are
+        computed from the interval values if their sparse table is empty.
+    starts : 1d numpy array of int of shape (n_features)
+        The start index (inclusive) of the interval for each feature.
+    ends : 1d numpy array of int of shape (n_features)
+        The end index (exclusive) of the interval for each feature.
+    dims : 1d numpy array of int of shape (n_features)
+        The dimension of the interval for each feature.
+    stats : 1d numpy array of int of shape (n_features)
+        The statistic for each feature, as an index of INTERVAL_STATS.
+
+    Returns
+    -------
+    Xt : 2d numpy array of shape (n_instances, n_features)
+        The statistic of each feature interval for all instances.
+    """
+    means, cs, cs2, csi, mins, maxs = tables
+    return _interval_stats(
+        np.asarray(X, dtype=np.float64),
+        means,
+        cs,
+        cs2,
+        csi,
+        mins,
+        maxs,
+        np.asarray(starts, dtype=np.int_),
+        np.asarray(ends, dtype=np.int_),
+        np.asarray(dims, dtype=np.int_),
+        np.asarray(stats, dtype=np.int_),
+    )
+
+
+@njit(cache=True)
+def _prefix_sums(X):
+    n_instances, n_dims, series_length = X.shape
+    means = np.zeros((n_instances, n_dims))
+    cs = np.zeros((n_instances, n_dims, series_length + 1))
+    cs2 = np.zeros((n_instances, n_dims, series_length + 1))
+    csi = np.zeros((n_instances, n_dims, series_length + 1))
+
+    for i in range(n_instances):
+        for j in range(n_dims):
+            # centre each series to limit cancellation in the sums of squares
+            m = np.mean(X[i, j])
+            means[i, j] = m
+            for t in range(series_length):
+                v = X[i, j, t] - m
+                cs[i, j, t + 1] = cs[i, j, t] + v
+                cs2[i, j, t + 1] = cs2[i, j, t] + v * v
+                csi[i, j, t + 1] = csi[i, j, t] + v * t
+
+    return means, cs, cs2, csi
+
+
+@njit(cache=True)
+def _sparse_table(X, minimum):
+    n_instances, n_dims, series_length = X.shape
+    n_levels = 1
+    while 1 << n_levels <= series_length:
+        n_levels += 1
+
+    table = np.zeros((n_levels, n_instances, n_dims, series_length))
+    table[0] = X
+    for k in range(1, n_levels):
+        half = 1 << (k - 1)
+        for i in range(n_instances):
+            for j in range(n_dims):
+                for t in range(series_length - (1 << k) + 1):
+                    a = table[k - 1, i, j, t]
+                    b = table[k - 1, i, j, t + half]
+                    table[k, i, j, t] = min(a, b) if minimum else max(a, b)
+
+    return table
+
+
+@njit(cache=True)
+def _interval_stats(X, means, cs, cs2, csi, mins, maxs, starts, ends, dims, stats):
+    n_instances = X.shape[0]
+    Xt = np.zeros((n_instances, len(stats)))
+
+    for n in range(len(stats)):
+        s = starts[n]
+        e = ends[n]
+        d = dims[n]
+        stat = stats[n]
+        length = e - s
+
+        if stat == 0 or stat == 1 or stat == 2:
+            sum_x = length * (length - 1) / 2
+            denom = (
+                sum_x * sum_x - length * (length - 1) * length * (2 * length - 1) / 6
+            )
+            for i in range(n_instances):
+                sum_y = cs[i, d, e] - cs[i, d, s]
+                if stat == 0:
+                    Xt[i, n] = means[i, d] + sum_y / length
+                elif stat == 1:
+                    m = sum_y / length
+                    sq = (cs2[i, d, e] - cs2[i, d, s]) / length
+                    var = sq - m * m
+                    # treat variance lost in the cancellation error as zero
+                    Xt[i, n] = np.sqrt(var) if var > 1e-12 * sq else 0
+                elif denom != 0:
+                    sum_xy = csi[i, d, e] - csi[i, d, s] - s * sum_y
+                    Xt[i, n] = (sum_x * sum_y - length * sum_xy) / denom
+        elif stat == 3:
+            for i in range(n_instances):
+                Xt[i, n] = np.median(X[i, d, s:e])
+        elif stat == 4:
+            for i in range(n_instances):
+                p75, p25 = np.percentile(X[i, d, s:e], [75, 25])
+                Xt[i, n] = p75 - p25
+        elif stat == 5 or stat == 6:
+            table = mins if stat == 5 else maxs
+            if table.shape[0] == 0:
+                for i in range(n_instances):
+                    if stat == 5:
+                        Xt[i, n] = np.min(X[i, d, s:e])
+                    else:
+                        Xt[i, n] = np.max(X[i, d, s:e])
+                continue
+
+            k = 0
+            while 1 << (k + 1) <= length:
+                k += 1
+            e2 = e - (1 << k)
+            for i in range(n_instances):
+                a = table[k, i, d, s]
+                b = table[k, i, d, e2]
+                Xt[i, n] = min(a, b) if stat == 5 else max(a, b)
+
+    return Xt
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Tests for numba interval summary statistics."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from aeon.utils.numba.interval_stats import (
+    INTERVAL_STATS,
+    interval_stats,
+    interval_stats_from_tables,
+    interval_stats_tables,
+)
+from aeon.utils.numba.stats import iqr, slope
+
+
+def _random_intervals(rng, n_intervals, n_dims, series_length):
+    starts = rng.randint(0, series_length - 1, n_intervals)
+    ends = np.array([rng.randint(s + 1, series_length + 1) for s in starts])
+    dims = rng.randint(0, n_dims, n_intervals)
+    stats = rng.randint(0, len(INTERVAL_STATS), n_intervals)
+    return starts, ends, dims, stats
+
+
+@pytest.mark.parametrize("offset", [0, 1000])
+def test_interval_stats(offset):
+    """Test interval statistics against direct computation on the interval values."""
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(10, 3, 100)) + offset
+    starts, ends, dims, stats = _random_intervals(rng, 200, 3, 100)
+
+    functions = [np.mean, np.std, slope, np.median, iqr, np.min, np.max]
+    expected = np.array(
+        [
+            [
+                functions[stats[n]](X[i, dims[n], starts[n] : ends[n]])
+                for n in range(len(stats))
+            ]
+            for i in range(X.shape[0])
+        ]
+    )
+
+    Xt = interval_stats(X, starts, ends, dims, stats)
+    assert Xt.shape == (10, 200)
+    assert_array_almost_equal(Xt, expected, decimal=6)
+
+    # min and max without sparse tables are the same
+    tables = interval_stats_tables(X, [0, 1, 2])
+    assert tables[4].size == 0 and tables[5].size == 0
+    assert_array_equal(
+        interval_stats_from_tables(X, tables, starts, ends, dims, stats), Xt
+    )
+
+
+def test_interval_stats_constant():
+    """Test the standard deviation and slope of constant intervals are zero."""
+    X = np.full((2, 1, 20), 3.7)
+    Xt = interval_stats(X, [0, 5, 5, 19], [20, 8, 6, 20], [0, 0, 0, 0], [1, 1, 2, 2])
+    assert_array_equal(Xt, np.zeros((2, 4)))
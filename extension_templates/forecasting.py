@@ -143,6 +143,14 @@ class MyForecaster(BaseForecaster):
         # valid values: boolean True (yes), False (no)
         # if False, exception raised if proba methods are called (predict_interval etc)
         #
+        # max_memory_length = how many of the latest time points are remembered?
+        "max_memory_length": None,
+        # valid values: int, or None (all data seen is remembered)
+        # if int, self._y and self._X only contain the last max_memory_length points
+        # set if the forecaster only uses the latest window in _predict and _update
+        # to let users choose the bound, set it in __init__ from a parameter, e.g.,
+        #   self.set_tags(max_memory_length=max_memory_length), see NaiveForecaster
+        #
         #
         # dependency tags: python version and soft dependencies
         # -----------------------------------------------------